@@ -7,6 +7,7 @@ from .graph_builder import (
     add_nodes,
     add_edges,
     render_graph,
+    render_streaming_html,
     display_in_streamlit,
 )
 from .sidebar import render_sidebar, render_statistics
@@ -18,6 +19,7 @@ __all__ = [
     "add_nodes",
     "add_edges",
     "render_graph",
+    "render_streaming_html",
     "display_in_streamlit",
     "render_sidebar",
     "render_statistics",
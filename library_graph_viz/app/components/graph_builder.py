@@ -1,12 +1,39 @@
 """PyVis graph construction and styling utilities."""
 
+import hashlib
+import json
+import sys
+import warnings
+from functools import lru_cache
+
 import streamlit as st
 import streamlit.components.v1 as components
+from jinja2 import Environment, FileSystemLoader
 from pyvis.network import Network
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used for cache digests instead
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # Optional: falls back to hashlib.blake2b
+    xxhash = None
+
+
+def _freeze(mapping: dict[str, Any]) -> Mapping[str, Any]:
+    """Return a read-only view of a style map with interned type keys."""
+    return MappingProxyType({sys.intern(key): value for key, value in mapping.items()})
+
 
 # Node color scheme by type
-NODE_COLORS = {
+NODE_COLORS = _freeze({
     "Member": "#ff6b6b",     # Coral red
     "Book": "#4ecdc4",       # Teal
     "Author": "#45b7d1",     # Sky blue
@@ -14,10 +41,10 @@ NODE_COLORS = {
     "Staff": "#ffeaa7",      # Soft yellow
     "Loan": "#dfe6e9",       # Light gray
     "Fine": "#fd79a8",       # Pink
-}
+})
 
 # Node shapes by type
-NODE_SHAPES = {
+NODE_SHAPES = _freeze({
     "Member": "dot",
     "Book": "box",
     "Author": "dot",
@@ -25,10 +52,10 @@ NODE_SHAPES = {
     "Staff": "triangle",
     "Loan": "dot",
     "Fine": "dot",
-}
+})
 
 # Node sizes by type
-NODE_SIZES = {
+NODE_SIZES = _freeze({
     "Member": 25,
     "Book": 25,
     "Author": 30,
@@ -36,10 +63,10 @@ NODE_SIZES = {
     "Staff": 25,
     "Loan": 20,
     "Fine": 15,
-}
+})
 
 # ERD OLTP Schema colors (for normalized tables)
-ERD_OLTP_COLORS = {
+ERD_OLTP_COLORS = _freeze({
     "member": "#4CAF50",       # Green
     "author": "#9C27B0",       # Purple
     "book": "#2196F3",         # Blue
@@ -49,9 +76,9 @@ ERD_OLTP_COLORS = {
     "fine": "#E91E63",         # Pink
     "book_author": "#607D8B",  # Gray (junction)
     "book_category": "#607D8B", # Gray (junction)
-}
+})
 
-ERD_OLTP_SHAPES = {
+ERD_OLTP_SHAPES = _freeze({
     "member": "box",
     "author": "box",
     "book": "box",
@@ -61,9 +88,9 @@ ERD_OLTP_SHAPES = {
     "fine": "box",
     "book_author": "diamond",  # Junction tables
     "book_category": "diamond",
-}
+})
 
-ERD_OLTP_SIZES = {
+ERD_OLTP_SIZES = _freeze({
     "member": 35,
     "author": 30,
     "book": 40,
@@ -73,10 +100,10 @@ ERD_OLTP_SIZES = {
     "fine": 25,
     "book_author": 20,
     "book_category": 20,
-}
+})
 
 # ERD OLAP Star Schema colors
-ERD_OLAP_COLORS = {
+ERD_OLAP_COLORS = _freeze({
     "fact_loan": "#F44336",           # Red (fact table)
     "dim_date": "#2196F3",            # Blue
     "dim_member": "#4CAF50",          # Green
@@ -84,9 +111,9 @@ ERD_OLAP_COLORS = {
     "dim_staff": "#795548",           # Brown
     "dim_category": "#FF9800",        # Orange
     "bridge_book_category": "#607D8B", # Gray (bridge)
-}
+})
 
-ERD_OLAP_SHAPES = {
+ERD_OLAP_SHAPES = _freeze({
     "fact_loan": "star",      # Fact table as star
     "dim_date": "box",
     "dim_member": "box",
@@ -94,9 +121,9 @@ ERD_OLAP_SHAPES = {
     "dim_staff": "box",
     "dim_category": "box",
     "bridge_book_category": "diamond",
-}
+})
 
-ERD_OLAP_SIZES = {
+ERD_OLAP_SIZES = _freeze({
     "fact_loan": 60,          # Fact table larger
     "dim_date": 35,
     "dim_member": 35,
@@ -104,7 +131,125 @@ ERD_OLAP_SIZES = {
     "dim_staff": 35,
     "dim_category": 35,
     "bridge_book_category": 25,
+})
+
+
+# Fallback (color, shape, size) for node types missing from the style maps
+DEFAULT_NODE_STYLE = ("#888888", "dot", 25)
+
+
+def build_style_table(
+    colors: Mapping[str, str],
+    shapes: Mapping[str, str],
+    sizes: Mapping[str, int],
+) -> dict[str, tuple[str, str, int]]:
+    """
+    Combine per-type style maps into a single (color, shape, size) lookup.
+
+    Args:
+        colors: Color mapping by type.
+        shapes: Shape mapping by type.
+        sizes: Size mapping by type.
+
+    Returns:
+        Dictionary mapping each known type to its style tuple.
+    """
+    default_color, default_shape, default_size = DEFAULT_NODE_STYLE
+    return {
+        node_type: (
+            colors.get(node_type, default_color),
+            shapes.get(node_type, default_shape),
+            sizes.get(node_type, default_size),
+        )
+        for node_type in colors.keys() | shapes.keys() | sizes.keys()
+    }
+
+
+# vis.js options shared by every PyVis network, compacted once at import time
+_RAW_OPTIONS = """
+{
+    "nodes": {
+        "font": {
+            "size": 14,
+            "face": "arial"
+        },
+        "borderWidth": 2,
+        "borderWidthSelected": 4
+    },
+    "edges": {
+        "color": {
+            "inherit": true
+        },
+        "smooth": {
+            "enabled": true,
+            "type": "dynamic"
+        },
+        "font": {
+            "size": 10,
+            "color": "#ffffff",
+            "strokeWidth": 0
+        }
+    },
+    "interaction": {
+        "hover": true,
+        "tooltipDelay": 100,
+        "hideEdgesOnDrag": true,
+        "navigationButtons": true,
+        "keyboard": {
+            "enabled": true
+        },
+        "multiselect": true
+    }
 }
+"""
+_OPTIONS_JSON = json.dumps(json.loads(_RAW_OPTIONS), separators=(",", ":"))
+
+
+@lru_cache(maxsize=1)
+def _template_env() -> Environment:
+    """
+    Jinja environment for PyVis page templates, shared by every network.
+
+    PyVis gives each Network its own environment, so every generate_html()
+    call re-read and recompiled template.html from disk. Sharing one
+    environment compiles the template once per process.
+    """
+    return Environment(loader=FileSystemLoader(Network().template_dir), auto_reload=False)
+
+
+@lru_cache(maxsize=8)
+def _network_options(physics_enabled: bool, layout: str) -> str:
+    """
+    Build the vis.js options for a physics configuration once.
+
+    Returns the options as compact JSON so each network gets its own copy.
+    """
+    net = Network()
+
+    if physics_enabled:
+        if layout == "barnes_hut":
+            net.barnes_hut(
+                gravity=-3000,
+                central_gravity=0.3,
+                spring_length=200,
+                spring_strength=0.001,
+                damping=0.09,
+            )
+        else:  # force_atlas
+            net.force_atlas_2based(
+                gravity=-80,
+                central_gravity=0.005,
+                spring_length=150,
+                spring_strength=0.04,
+                damping=0.4,
+            )
+    else:
+        net.toggle_physics(False)
+
+    # Set options for better visualization
+    net.set_options(_OPTIONS_JSON)
+
+    return json.dumps(net.options, separators=(",", ":"))
 
 
 def create_network(
@@ -136,64 +281,8 @@ def create_network(
         font_color="#ffffff",
         directed=directed,
     )
-
-    if physics_enabled:
-        if layout == "barnes_hut":
-            net.barnes_hut(
-                gravity=-3000,
-                central_gravity=0.3,
-                spring_length=200,
-                spring_strength=0.001,
-                damping=0.09,
-            )
-        else:  # force_atlas
-            net.force_atlas_2based(
-                gravity=-80,
-                central_gravity=0.005,
-                spring_length=150,
-                spring_strength=0.04,
-                damping=0.4,
-            )
-    else:
-        net.toggle_physics(False)
-
-    # Set options for better visualization
-    net.set_options("""
-    {
-        "nodes": {
-            "font": {
-                "size": 14,
-                "face": "arial"
-            },
-            "borderWidth": 2,
-            "borderWidthSelected": 4
-        },
-        "edges": {
-            "color": {
-                "inherit": true
-            },
-            "smooth": {
-                "enabled": true,
-                "type": "dynamic"
-            },
-            "font": {
-                "size": 10,
-                "color": "#ffffff",
-                "strokeWidth": 0
-            }
-        },
-        "interaction": {
-            "hover": true,
-            "tooltipDelay": 100,
-            "hideEdgesOnDrag": true,
-            "navigationButtons": true,
-            "keyboard": {
-                "enabled": true
-            },
-            "multiselect": true
-        }
-    }
-    """)
+    net.options = json.loads(_network_options(physics_enabled, layout))
+    net.templateEnv = _template_env()
 
     return net
 
@@ -204,6 +293,7 @@ def add_nodes(
     colors: Optional[dict[str, str]] = None,
     shapes: Optional[dict[str, str]] = None,
     sizes: Optional[dict[str, int]] = None,
+    bulk: bool = True,
 ) -> Network:
     """
     Add nodes to a network with consistent styling.
@@ -219,6 +309,8 @@ def add_nodes(
         colors: Optional color mapping by type.
         shapes: Optional shape mapping by type.
         sizes: Optional size mapping by type.
+        bulk: Write node dicts straight into the network's node lists
+            instead of calling net.add_node per node.
 
     Returns:
         Updated Network instance.
@@ -227,21 +319,52 @@ def add_nodes(
     shapes = shapes or NODE_SHAPES
     sizes = sizes or NODE_SIZES
 
+    if not bulk:
+        for node in nodes:
+            node_id = node["id"]
+            node_label = node.get("label", str(node_id))
+            node_type = node.get("type", "default")
+            node_title = node.get("title", f"{node_type}: {node_label}")
+            node_size = node.get("size", sizes.get(node_type, 25))
+
+            net.add_node(
+                node_id,
+                label=node_label,
+                title=node_title,
+                color=colors.get(node_type, "#888888"),
+                shape=shapes.get(node_type, "dot"),
+                size=node_size,
+            )
+        return net
+
+    # Mirror Network.add_node: skip duplicate ids and keep node_ids/node_map in sync
+    style_by_type = build_style_table(colors, shapes, sizes)
+    seen = set(net.node_ids)
+    new_nodes = []
     for node in nodes:
         node_id = node["id"]
+        if node_id in seen:
+            continue
+        seen.add(node_id)
+
         node_label = node.get("label", str(node_id))
         node_type = node.get("type", "default")
-        node_title = node.get("title", f"{node_type}: {node_label}")
-        node_size = node.get("size", sizes.get(node_type, 25))
-
-        net.add_node(
-            node_id,
-            label=node_label,
-            title=node_title,
-            color=colors.get(node_type, "#888888"),
-            shape=shapes.get(node_type, "dot"),
-            size=node_size,
-        )
+        color, shape, size = style_by_type.get(node_type, DEFAULT_NODE_STYLE)
+        options = {
+            "id": node_id,
+            "label": node_label or node_id,
+            "shape": shape,
+            "color": color,
+            "title": node.get("title", f"{node_type}: {node_label}"),
+            "size": node.get("size", size),
+        }
+        if net.font_color:
+            options["font"] = {"color": net.font_color}
+        new_nodes.append(options)
+
+    net.nodes.extend(new_nodes)
+    net.node_ids.extend(n["id"] for n in new_nodes)
+    net.node_map.update((n["id"], n) for n in new_nodes)
 
     return net
 
@@ -250,6 +373,7 @@ def add_edges(
     net: Network,
     edges: list[dict[str, Any]],
     default_color: str = "#888888",
+    bulk: bool = True,
 ) -> Network:
     """
     Add edges to a network.
@@ -262,24 +386,65 @@ def add_edges(
             - label: Optional edge label
             - title: Optional edge tooltip
             - color: Optional edge color
+        default_color: Color used when an edge has none.
+        bulk: Write edge dicts straight into the network's edge list
+            instead of calling net.add_edge per edge.
 
     Returns:
         Updated Network instance.
     """
+    if not bulk:
+        for edge in edges:
+            source = edge["from"]
+            target = edge["to"]
+            label = edge.get("label", "")
+            title = edge.get("title", label)
+            color = edge.get("color", default_color)
+
+            net.add_edge(
+                source,
+                target,
+                label=label,
+                title=title,
+                color=color,
+            )
+        return net
+
+    # Mirror Network.add_edge: endpoints must exist, and undirected
+    # graphs drop edges that already connect the same pair of nodes
+    node_ids = set(net.node_ids)
+    seen_pairs = (
+        None if net.directed
+        else {frozenset((e["from"], e["to"])) for e in net.edges}
+    )
+    new_edges = []
     for edge in edges:
         source = edge["from"]
         target = edge["to"]
+        if source not in node_ids:
+            raise ValueError(f"non existent node '{source}'")
+        if target not in node_ids:
+            raise ValueError(f"non existent node '{target}'")
+
+        if seen_pairs is not None:
+            pair = frozenset((source, target))
+            if pair in seen_pairs:
+                continue
+            seen_pairs.add(pair)
+
         label = edge.get("label", "")
-        title = edge.get("title", label)
-        color = edge.get("color", default_color)
-
-        net.add_edge(
-            source,
-            target,
-            label=label,
-            title=title,
-            color=color,
-        )
+        options = {
+            "from": source,
+            "to": target,
+            "label": label,
+            "title": edge.get("title", label),
+            "color": edge.get("color", default_color),
+        }
+        if net.directed:
+            options["arrows"] = "to"
+        new_edges.append(options)
+
+    net.edges.extend(new_edges)
 
     return net
 
@@ -297,21 +462,133 @@ def render_graph(net: Network) -> str:
     return net.generate_html()
 
 
+# Nodes/edges per embedded JSON chunk in the streaming HTML shell
+STREAM_CHUNK_SIZE = 2000
+
+# Node count above which the components.html path is deprecated
+NATIVE_NODE_THRESHOLD = 1000
+
+# Thin vis-network page: data is embedded as separate JSON chunks that the
+# browser parses and adds to the DataSets one animation frame at a time, so
+# the network starts drawing before the whole payload has been processed.
+_STREAMING_TEMPLATE = """<html>
+<head>
+<meta charset="utf-8">
+<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/dist/vis-network.min.css" />
+<script src="https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/vis-network.min.js"></script>
+<style>
+    body {{ margin: 0; }}
+    #mynetwork {{ width: {width}; height: {height}; background-color: {bgcolor}; }}
+</style>
+</head>
+<body>
+<div id="mynetwork"></div>
+{chunks}
+<script>
+    var nodes = new vis.DataSet();
+    var edges = new vis.DataSet();
+    var network = new vis.Network(
+        document.getElementById("mynetwork"),
+        {{nodes: nodes, edges: edges}},
+        {options}
+    );
+    var chunks = document.querySelectorAll("script[data-chunk]");
+    var next = 0;
+    function loadNextChunk() {{
+        if (next >= chunks.length) return;
+        var el = chunks[next++];
+        (el.dataset.chunk === "nodes" ? nodes : edges).add(JSON.parse(el.textContent));
+        requestAnimationFrame(loadNextChunk);
+    }}
+    loadNextChunk();
+</script>
+</body>
+</html>
+"""
+
+
+def _json_chunks(kind: str, items: list[dict], chunk_size: int) -> list[str]:
+    """Serialize items into <script> JSON blocks of at most chunk_size items."""
+    return [
+        f'<script type="application/json" data-chunk="{kind}">'
+        + json.dumps(items[i:i + chunk_size]).replace("</", "<\\/")
+        + "</script>"
+        for i in range(0, len(items), chunk_size)
+    ]
+
+
+def render_streaming_html(net: Network, chunk_size: int = STREAM_CHUNK_SIZE) -> str:
+    """
+    Render a PyVis network to a thin HTML shell with chunked node/edge data.
+
+    Args:
+        net: PyVis Network instance.
+        chunk_size: Maximum number of nodes or edges per JSON chunk.
+
+    Returns:
+        HTML string that loads the graph data incrementally in the browser.
+    """
+    options = net.options if isinstance(net.options, dict) else json.loads(net.options.to_json())
+    chunks = _json_chunks("nodes", net.nodes, chunk_size) + _json_chunks("edges", net.edges, chunk_size)
+    return _STREAMING_TEMPLATE.format(
+        width=net.width,
+        height=net.height,
+        bgcolor=net.bgcolor,
+        options=json.dumps(options, separators=(",", ":")),
+        chunks="\n".join(chunks),
+    )
+
+
 def display_in_streamlit(
     net: Network,
     height: int = 620,
     key: Optional[str] = None,
-) -> None:
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    use_native: bool = True,
+    layout: str = "barnes_hut",
+) -> Optional[dict]:
     """
-    Display a PyVis network in Streamlit using components.html().
+    Display a PyVis network in Streamlit.
+
+    By default the network's node and edge dicts are handed straight to the
+    streamlit_graph component, skipping HTML generation entirely. With
+    use_native=False the chunked HTML shell is rendered via components.html().
 
     Args:
         net: PyVis Network instance.
         height: Height of the component in pixels.
         key: Optional unique key for the component (used for container).
+        chunk_size: Maximum number of nodes or edges per streamed chunk.
+        use_native: Render through the streamlit_graph component.
+        layout: Physics layout for the native component ('barnes_hut' or 'force_atlas').
+
+    Returns:
+        Event dictionary from the native component, None for the HTML path.
     """
-    html = net.generate_html()
+    if use_native:
+        # Imported here: streamlit_graph imports its style maps from this module
+        from app.components.streamlit_graph import streamlit_graph
+
+        return streamlit_graph(
+            nodes=net.nodes,
+            edges=net.edges,
+            layout=layout,
+            height=height,
+            directed=net.directed,
+            key=key,
+        )
+
+    if len(net.nodes) > NATIVE_NODE_THRESHOLD:
+        warnings.warn(
+            f"Rendering {len(net.nodes)} nodes through components.html is deprecated; "
+            "use display_in_streamlit(..., use_native=True)",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+    html = render_streaming_html(net, chunk_size=chunk_size)
     components.html(html, height=height, scrolling=True)
+    return None
 
 
 def create_legend() -> str:
@@ -321,20 +598,22 @@ def create_legend() -> str:
     Returns:
         HTML string for the legend.
     """
-    legend_html = "<div style='padding: 10px; background-color: #1e1e1e; border-radius: 5px;'>"
-    legend_html += "<h4 style='color: white; margin-bottom: 10px;'>Node Types</h4>"
-
-    for node_type, color in NODE_COLORS.items():
-        legend_html += f"""
+    parts = [
+        "<div style='padding: 10px; background-color: #1e1e1e; border-radius: 5px;'>",
+        "<h4 style='color: white; margin-bottom: 10px;'>Node Types</h4>",
+    ]
+    parts.extend(
+        f"""
         <div style='display: flex; align-items: center; margin: 5px 0;'>
             <div style='width: 20px; height: 20px; background-color: {color};
                         border-radius: 50%; margin-right: 10px;'></div>
             <span style='color: white;'>{node_type}</span>
         </div>
         """
-
-    legend_html += "</div>"
-    return legend_html
+        for node_type, color in NODE_COLORS.items()
+    )
+    parts.append("</div>")
+    return "".join(parts)
 
 
 def display_legend() -> None:
@@ -342,6 +621,41 @@ def display_legend() -> None:
     st.markdown(create_legend(), unsafe_allow_html=True)
 
 
+def _digest_records(records: list) -> str:
+    """Fast content digest of a list of query records, used as a cache key."""
+    data = (
+        orjson.dumps(records, option=orjson.OPT_SORT_KEYS, default=str)
+        if orjson is not None
+        else json.dumps(records, sort_keys=True, default=str).encode()
+    )
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _network_from_records(
+    nodes: list[dict], edges: list[dict], height: str, layout: str
+) -> Network:
+    """Build a fresh network around already styled node and edge records."""
+    net = create_network(height=height, layout=layout)
+    net.nodes = nodes
+    net.node_ids = [node["id"] for node in nodes]
+    net.node_map = {node["id"]: node for node in nodes}
+    net.edges = edges
+    return net
+
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={list: _digest_records})
+def _graph_records(
+    nodes_data: list[dict], edges_data: list[dict]
+) -> tuple[list[dict], list[dict]]:
+    """Styled node and edge records for build_graph_from_neo4j_results."""
+    net = create_network()
+    add_nodes(net, nodes_data)
+    add_edges(net, edges_data)
+    return net.nodes, net.edges
+
+
 def build_graph_from_neo4j_results(
     nodes_data: list[dict],
     edges_data: list[dict],
@@ -351,6 +665,10 @@ def build_graph_from_neo4j_results(
     """
     Build a complete graph from Neo4j query results.
 
+    The styled node and edge records are cached on a digest of the inputs;
+    each call wraps its own copy of them in a new Network, so callers may
+    modify the result freely.
+
     Args:
         nodes_data: List of node dictionaries from Neo4j.
         edges_data: List of edge dictionaries from Neo4j.
@@ -360,7 +678,84 @@ def build_graph_from_neo4j_results(
     Returns:
         Configured PyVis Network with nodes and edges.
     """
-    net = create_network(height=height, layout=layout)
-    add_nodes(net, nodes_data)
-    add_edges(net, edges_data)
-    return net
+    nodes, edges = _graph_records(nodes_data, edges_data)
+    return _network_from_records(nodes, edges, height, layout)
+
+
+def _edge_records_from_df(net: Network, edges_df: "pd.DataFrame", default_color: str) -> list[dict]:
+    """Convert an edge DataFrame into PyVis edge dicts with column operations."""
+    import pandas as pd
+
+    edges_df = edges_df.rename(columns={"source": "from", "target": "to"})
+    label = edges_df["label"].fillna("") if "label" in edges_df else ""
+    title = edges_df["title"].fillna(label) if "title" in edges_df else label
+    color = edges_df["color"].fillna(default_color) if "color" in edges_df else default_color
+    edges_df = edges_df.assign(label=label, title=title, color=color)[
+        ["from", "to", "label", "title", "color"]
+    ]
+
+    unknown = ~(edges_df["from"].isin(net.node_ids) & edges_df["to"].isin(net.node_ids))
+    if unknown.any():
+        row = edges_df[unknown].iloc[0]
+        missing = row["from"] if row["from"] not in net.node_map else row["to"]
+        raise ValueError(f"non existent node '{missing}'")
+
+    if net.directed:
+        edges_df = edges_df.assign(arrows="to")
+    else:
+        # Like Network.add_edge, keep only the first edge per unordered pair
+        pairs = pd.Series(
+            [frozenset(pair) for pair in zip(edges_df["from"], edges_df["to"])],
+            index=edges_df.index,
+        )
+        existing = {frozenset((e["from"], e["to"])) for e in net.edges}
+        edges_df = edges_df[~(pairs.duplicated() | pairs.isin(existing))]
+    return edges_df.to_dict("records")
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _df_graph_records(
+    nodes_df: "pd.DataFrame", edges_df: "pd.DataFrame"
+) -> tuple[list[dict], list[dict]]:
+    """Styled node and edge records for build_graph_from_neo4j_df."""
+    import pandas as pd
+
+    net = create_network()
+    # Drop missing cells so add_nodes falls back to its per-type defaults
+    add_nodes(
+        net,
+        [
+            {key: value for key, value in row.items() if pd.notna(value)}
+            for row in nodes_df.to_dict("records")
+        ],
+    )
+    if not edges_df.empty:
+        net.edges.extend(_edge_records_from_df(net, edges_df, "#888888"))
+    return net.nodes, net.edges
+
+
+def build_graph_from_neo4j_df(
+    nodes_df: "pd.DataFrame",
+    edges_df: "pd.DataFrame",
+    height: str = "600px",
+    layout: str = "barnes_hut",
+) -> Network:
+    """
+    Build a complete graph from Neo4j results loaded into DataFrames.
+
+    Edges are converted column-wise instead of one dict lookup per edge,
+    which pays off for large result sets (e.g. from Result.to_df()).
+
+    Args:
+        nodes_df: Node rows with the same columns as add_nodes expects.
+        edges_df: Edge rows with from/to (or source/target) columns and
+            optional label, title and color columns.
+        height: Graph height.
+        layout: Physics layout algorithm.
+
+    Returns:
+        Configured PyVis Network with nodes and edges. Records are cached
+        like build_graph_from_neo4j_results; the network is the caller's own.
+    """
+    nodes, edges = _df_graph_records(nodes_df, edges_df)
+    return _network_from_records(nodes, edges, height, layout)
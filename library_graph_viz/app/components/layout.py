@@ -0,0 +1,282 @@
+"""Server-side force-directed layout for pre-positioning graph nodes."""
+
+import logging
+from typing import Any, Hashable, Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # Optional: the kernel still runs, just without JIT
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Quadtree cell states stored in the body array: a node index >= 0 is a leaf
+# holding one node; these mark the other cell kinds
+_EMPTY = -1
+_INTERNAL = -2
+_CROWDED = -3  # leaf at MAX_TREE_DEPTH holding several (near-)coincident nodes
+
+# Depth at which cells stop splitting, so coincident nodes cannot recurse forever
+MAX_TREE_DEPTH = 24
+
+
+@njit(cache=True)
+def _build_quadtree(
+    positions: np.ndarray,
+    child: np.ndarray,
+    body: np.ndarray,
+    center: np.ndarray,
+    half: np.ndarray,
+    mass: np.ndarray,
+    mass_sum: np.ndarray,
+) -> int:
+    """Insert every node into a quadtree held in flat arrays; returns the cell count."""
+    n = positions.shape[0]
+    min_x = positions[:, 0].min()
+    max_x = positions[:, 0].max()
+    min_y = positions[:, 1].min()
+    max_y = positions[:, 1].max()
+
+    center[0, 0] = (min_x + max_x) / 2
+    center[0, 1] = (min_y + max_y) / 2
+    half[0] = max(max_x - min_x, max_y - min_y) / 2 + 1e-6
+    child[0, :] = -1
+    body[0] = _EMPTY
+    mass[0] = 0.0
+    mass_sum[0, :] = 0.0
+    cells = 1
+
+    for i in range(n):
+        x = positions[i, 0]
+        y = positions[i, 1]
+        cell = 0
+        depth = 0
+        while True:
+            # Every cell on the path counts the node towards its center of mass
+            mass[cell] += 1.0
+            mass_sum[cell, 0] += x
+            mass_sum[cell, 1] += y
+
+            occupant = body[cell]
+            if occupant == _EMPTY:
+                body[cell] = i
+                break
+            if occupant == _CROWDED:
+                break
+            if occupant >= 0:
+                if depth >= MAX_TREE_DEPTH:
+                    body[cell] = _CROWDED
+                    break
+                # Split the leaf: push its node one level down
+                body[cell] = _INTERNAL
+                quadrant = (positions[occupant, 0] > center[cell, 0]) + 2 * (
+                    positions[occupant, 1] > center[cell, 1]
+                )
+                new = cells
+                cells += 1
+                child[cell, quadrant] = new
+                child[new, :] = -1
+                half[new] = half[cell] / 2
+                center[new, 0] = center[cell, 0] + (half[new] if quadrant & 1 else -half[new])
+                center[new, 1] = center[cell, 1] + (half[new] if quadrant & 2 else -half[new])
+                body[new] = occupant
+                mass[new] = 1.0
+                mass_sum[new, 0] = positions[occupant, 0]
+                mass_sum[new, 1] = positions[occupant, 1]
+
+            # Internal cell: descend into the node's quadrant
+            quadrant = (x > center[cell, 0]) + 2 * (y > center[cell, 1])
+            next_cell = child[cell, quadrant]
+            if next_cell == -1:
+                next_cell = cells
+                cells += 1
+                child[cell, quadrant] = next_cell
+                child[next_cell, :] = -1
+                half[next_cell] = half[cell] / 2
+                center[next_cell, 0] = center[cell, 0] + (half[next_cell] if quadrant & 1 else -half[next_cell])
+                center[next_cell, 1] = center[cell, 1] + (half[next_cell] if quadrant & 2 else -half[next_cell])
+                body[next_cell] = _EMPTY
+                mass[next_cell] = 0.0
+                mass_sum[next_cell, :] = 0.0
+            cell = next_cell
+            depth += 1
+
+    return cells
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _barnes_hut_kernel(
+    positions: np.ndarray,
+    edges: np.ndarray,
+    iterations: int,
+    spacing: float,
+    temperature: float,
+    theta: float,
+) -> np.ndarray:
+    """Fruchterman-Reingold iterations with Barnes-Hut repulsion, in place."""
+    n = positions.shape[0]
+    cooling = temperature / max(iterations, 1)
+    displacement = np.zeros_like(positions)
+    k2 = spacing * spacing
+    theta2 = theta * theta
+
+    # Each insertion adds at most one cell per level plus the final leaf
+    capacity = n * (MAX_TREE_DEPTH + 2) + 1
+    child = np.empty((capacity, 4), dtype=np.int64)
+    body = np.empty(capacity, dtype=np.int64)
+    center = np.empty((capacity, 2))
+    half = np.empty(capacity)
+    mass = np.empty(capacity)
+    mass_sum = np.empty((capacity, 2))
+
+    for _ in range(iterations):
+        _build_quadtree(positions, child, body, center, half, mass, mass_sum)
+
+        # Repulsion: distant cells act as one mass at their center of mass
+        for i in prange(n):
+            x = positions[i, 0]
+            y = positions[i, 1]
+            fx = 0.0
+            fy = 0.0
+            stack = np.empty(4 * MAX_TREE_DEPTH + 8, dtype=np.int64)
+            stack[0] = 0
+            top = 1
+            while top > 0:
+                top -= 1
+                cell = stack[top]
+                m = mass[cell]
+                if m == 0.0 or body[cell] == i:
+                    continue
+                dx = x - mass_sum[cell, 0] / m
+                dy = y - mass_sum[cell, 1] / m
+                dist2 = dx * dx + dy * dy + 1e-9
+                width = 2.0 * half[cell]
+                if body[cell] == _INTERNAL and width * width >= theta2 * dist2:
+                    for quadrant in range(4):
+                        if child[cell, quadrant] != -1:
+                            stack[top] = child[cell, quadrant]
+                            top += 1
+                else:
+                    force = m * k2 / dist2
+                    fx += dx * force
+                    fy += dy * force
+            displacement[i, 0] = fx
+            displacement[i, 1] = fy
+
+        # Attraction along edges (serial: endpoints are shared between edges)
+        for e in range(edges.shape[0]):
+            a = edges[e, 0]
+            b = edges[e, 1]
+            dx = positions[a, 0] - positions[b, 0]
+            dy = positions[a, 1] - positions[b, 1]
+            dist = np.sqrt(dx * dx + dy * dy) + 1e-9
+            force = dist / spacing
+            displacement[a, 0] -= dx * force
+            displacement[a, 1] -= dy * force
+            displacement[b, 0] += dx * force
+            displacement[b, 1] += dy * force
+
+        # Move each node at most `temperature` along its displacement
+        for i in prange(n):
+            dx = displacement[i, 0]
+            dy = displacement[i, 1]
+            length = np.sqrt(dx * dx + dy * dy) + 1e-9
+            step = min(length, temperature)
+            positions[i, 0] += dx / length * step
+            positions[i, 1] += dy / length * step
+
+        temperature -= cooling
+
+    return positions
+
+
+def compute_positions(
+    node_ids: list[Hashable],
+    edges: Iterable[tuple[Hashable, Hashable]],
+    iterations: int = 50,
+    spacing: float = 100.0,
+    seed: int = 0,
+    theta: float = 0.5,
+) -> np.ndarray:
+    """
+    Compute initial (x, y) node positions with a force-directed layout.
+
+    Repulsion uses the Barnes-Hut approximation: nodes are kept in a
+    quadtree, and a cell that looks small from a node (width / distance
+    below theta) repels it as a single mass, so each iteration costs
+    O(n log n) rather than O(n^2).
+
+    Args:
+        node_ids: Node identifiers, in output order.
+        edges: (source, target) pairs of node identifiers. Edges with
+            unknown endpoints are ignored.
+        iterations: Number of layout iterations.
+        spacing: Ideal distance between connected nodes, in pixels.
+        seed: Seed for the random starting positions.
+        theta: Barnes-Hut opening angle; 0 computes every pair exactly,
+            larger values trade accuracy for speed.
+
+    Returns:
+        Array of shape (len(node_ids), 2) with x, y coordinates.
+    """
+    n = len(node_ids)
+    if n == 0:
+        return np.zeros((0, 2))
+
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    edge_index = np.array(
+        [
+            (index[source], index[target])
+            for source, target in edges
+            if source in index and target in index
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+
+    extent = spacing * np.sqrt(n)
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(-extent / 2, extent / 2, size=(n, 2))
+
+    if not NUMBA_AVAILABLE:
+        logger.debug("numba not installed; running layout kernel without JIT")
+
+    return _barnes_hut_kernel(positions, edge_index, iterations, spacing, extent / 10, theta)
+
+
+def radial_positions(
+    node_ids: list[Hashable],
+    center: Hashable,
+    radius: float = 300.0,
+) -> np.ndarray:
+    """
+    Place one node at the origin and the rest evenly on a circle around it.
+
+    Suited to small hub-and-spoke graphs such as the ERDs, which can then be
+    drawn without a physics simulation.
+
+    Args:
+        node_ids: Node identifiers, in output order.
+        center: Identifier of the node placed at the origin.
+        radius: Circle radius, in pixels.
+
+    Returns:
+        Array of shape (len(node_ids), 2) with x, y coordinates.
+    """
+    positions = np.zeros((len(node_ids), 2))
+    ring = [i for i, node_id in enumerate(node_ids) if node_id != center]
+    angles = 2 * np.pi * np.arange(len(ring)) / max(len(ring), 1)
+    positions[ring, 0] = radius * np.cos(angles)
+    positions[ring, 1] = radius * np.sin(angles)
+    return positions
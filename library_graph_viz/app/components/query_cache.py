@@ -0,0 +1,55 @@
+"""Cached Neo4j query helper shared by the views."""
+
+import streamlit as st
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from etl.neo4j_connector import Neo4jConnector
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_query(
+    _neo4j: "Neo4jConnector",
+    cypher: str,
+    params: tuple[tuple[str, Any], ...] = (),
+) -> list[dict]:
+    """
+    Run a read query and cache its rows between reruns.
+
+    Results are keyed on the query text and parameters; the connector is
+    not part of the key. Clear with ``st.cache_data.clear()`` after an
+    ETL sync.
+
+    Args:
+        _neo4j: Neo4j connector instance.
+        cypher: Cypher query string.
+        params: Query parameters as (name, value) pairs.
+
+    Returns:
+        List of result records as dictionaries.
+    """
+    return _neo4j.run_query(cypher, dict(params))
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_query_df(
+    _neo4j: "Neo4jConnector",
+    cypher: str,
+    params: tuple[tuple[str, Any], ...] = (),
+) -> "pd.DataFrame":
+    """
+    Run a read query and cache its result as a DataFrame.
+
+    Same caching rules as cached_query, for views that go straight to
+    pandas.
+
+    Args:
+        _neo4j: Neo4j connector instance.
+        cypher: Cypher query string.
+        params: Query parameters as (name, value) pairs.
+
+    Returns:
+        DataFrame with one column per returned key.
+    """
+    return _neo4j.run_query_values(cypher, dict(params))
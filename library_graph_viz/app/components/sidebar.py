@@ -1,15 +1,24 @@
 """Sidebar component for navigation and statistics."""
 
 import streamlit as st
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
 from datetime import datetime
 
-from etl.neo4j_connector import Neo4jConnector
+from .graph_builder import NODE_COLORS
+
+if TYPE_CHECKING:
+    from etl.neo4j_connector import Neo4jConnector
+
+# Legend markup, built once at import; NODE_COLORS never changes at runtime
+LEGEND_HTML = "<br>".join(
+    f'<span style="color: {color};">●</span> {node_type}'
+    for node_type, color in NODE_COLORS.items()
+)
 
 
 def render_sidebar(
-    views: dict[str, Callable],
-    neo4j: Optional[Neo4jConnector] = None,
+    views: Mapping[str, Any],
+    neo4j: Optional["Neo4jConnector"] = None,
     on_sync: Optional[Callable] = None,
     last_sync: Optional[datetime] = None,
 ) -> str:
@@ -17,7 +26,7 @@ def render_sidebar(
     Render the sidebar with navigation and statistics.
 
     Args:
-        views: Dictionary mapping view names to render functions.
+        views: Mapping keyed by view name; only the names are used.
         neo4j: Optional Neo4j connector for statistics.
         on_sync: Optional callback for sync button.
         last_sync: Optional timestamp of last sync.
@@ -45,8 +54,9 @@ def render_sidebar(
         else:
             st.sidebar.text("Never synced")
 
-        if st.sidebar.button("🔄 Sync Now", help="Run ETL to refresh graph data"):
+        if st.sidebar.button("🔄 Sync Data", help="Run ETL to refresh graph data from MySQL"):
             on_sync()
+            _fetch_stats.clear()
 
     # Statistics section
     if neo4j:
@@ -71,7 +81,7 @@ def render_sidebar(
     return selected_view
 
 
-def render_statistics(neo4j: Neo4jConnector) -> None:
+def render_statistics(neo4j: "Neo4jConnector") -> None:
     """
     Render graph statistics in the sidebar.
 
@@ -82,12 +92,12 @@ def render_statistics(neo4j: Neo4jConnector) -> None:
     st.sidebar.markdown("### Graph Statistics")
 
     try:
-        stats = neo4j.get_statistics()
+        stats = _fetch_stats(neo4j)
 
         # Total counts
         col1, col2 = st.sidebar.columns(2)
-        col1.metric("Total Nodes", stats.get("total_nodes", 0))
-        col2.metric("Total Rels", stats.get("total_relationships", 0))
+        col1.metric("Nodes", stats.get("total_nodes", 0))
+        col2.metric("Relationships", stats.get("total_relationships", 0))
 
         # Node counts by type
         with st.sidebar.expander("📊 Node Counts", expanded=False):
@@ -99,23 +109,23 @@ def render_statistics(neo4j: Neo4jConnector) -> None:
             for rel_type, count in stats.get("relationships", {}).items():
                 st.text(f"{rel_type}: {count}")
 
-    except Exception as e:
-        st.sidebar.warning(f"Could not load statistics: {e}")
+    except Exception:
+        st.sidebar.warning("Could not load statistics")
+        st.sidebar.info("Run ETL sync to populate the graph")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_stats(_neo4j: "Neo4jConnector") -> dict:
+    """
+    Fetch graph statistics, cached for 5 minutes or until a sync clears it.
+
+    The leading underscore keeps Streamlit from hashing the connector.
+    """
+    return _neo4j.get_statistics()
 
 
 def render_legend() -> None:
     """Render the node type legend in the sidebar."""
-    from app.components.graph_builder import NODE_COLORS
-
     st.sidebar.markdown("### Legend")
 
-    legend_items = []
-    for node_type, color in NODE_COLORS.items():
-        legend_items.append(
-            f'<span style="color: {color};">●</span> {node_type}'
-        )
-
-    st.sidebar.markdown(
-        "<br>".join(legend_items),
-        unsafe_allow_html=True,
-    )
+    st.sidebar.markdown(LEGEND_HTML, unsafe_allow_html=True)
@@ -6,29 +6,43 @@ node/edge click events, and multi-selection.
 """
 
 import os
-from typing import Any, Optional
+from functools import cache
+from typing import Any, Callable, Mapping, NamedTuple, Optional
 
-import streamlit.components.v1 as components
+try:
+    import orjson
+except ImportError:  # Optional: falls back to Streamlit's own JSON encoding
+    orjson = None
 
 # Determine if we're in development mode
 _DEVELOPMENT = os.environ.get("STREAMLIT_GRAPH_DEV", "false").lower() == "true"
 
-if _DEVELOPMENT:
-    # Development mode: use local dev server
-    _component_func = components.declare_component(
-        "streamlit_graph",
-        url="http://localhost:3001",
-    )
-else:
+_COMPONENT_PATH = os.path.join(os.path.dirname(__file__), "frontend", "build")
+
+
+@cache
+def _get_component() -> Callable[..., Any]:
+    """Declare the frontend component on first use rather than at import."""
+    import streamlit.components.v1 as components
+
+    if _DEVELOPMENT:
+        # Development mode: use local dev server
+        return components.declare_component(
+            "streamlit_graph",
+            url="http://localhost:3001",
+        )
+
     # Production mode: use built files
-    _COMPONENT_PATH = os.path.join(os.path.dirname(__file__), "frontend", "build")
-    _component_func = components.declare_component(
+    return components.declare_component(
         "streamlit_graph",
         path=_COMPONENT_PATH,
     )
 
+
 # Import constants from graph_builder for backward compatibility
 from app.components.graph_builder import (
+    DEFAULT_NODE_STYLE,
+    build_style_table,
     NODE_COLORS,
     NODE_SHAPES,
     NODE_SIZES,
@@ -44,7 +58,10 @@ from app.components.graph_builder import (
 __all__ = [
     "streamlit_graph",
     "display_interactive_graph",
+    "style_nodes",
+    "short_label",
     "InteractiveNetwork",
+    "NodeRec",
     "NODE_COLORS",
     "NODE_SHAPES",
     "NODE_SIZES",
@@ -57,6 +74,22 @@ __all__ = [
     "PHYSICS_PRESETS",
 ]
 
+# Graphs larger than this are sent as column arrays (structure-of-arrays)
+# instead of one dict per node, so key strings are not repeated per record
+SOA_THRESHOLD = 5000
+
+# Graphs with more nodes than this are drawn with straight edges; curved
+# edges cost Bezier math per edge on every frame
+SMOOTH_EDGE_LIMIT = 200
+
+# Fields the frontend reads from each node / edge
+NODE_KEYS = ("id", "label", "type", "title", "size", "color", "shape")
+EDGE_KEYS = ("from", "to", "label", "title", "color", "dashes")
+PALETTE_KEYS = ("type", "color", "shape", "size")
+
+# Style table for networks that never customize styling
+_DEFAULT_STYLE_TABLE = build_style_table(NODE_COLORS, NODE_SHAPES, NODE_SIZES)
+
 # Physics presets matching current PyVis implementation
 PHYSICS_PRESETS = {
     "barnes_hut": {
@@ -78,6 +111,19 @@ PHYSICS_PRESETS = {
 }
 
 
+def _to_columns(records: list[dict[str, Any]], keys: tuple[str, ...]) -> dict[str, list]:
+    """
+    Transpose a list of records into one list per key.
+
+    Columns cover the given keys plus any other key found in the records,
+    so nothing a caller passes is dropped; missing cells are None.
+    """
+    all_keys = dict.fromkeys(keys)
+    for record in records:
+        all_keys.update(dict.fromkeys(record))
+    return {key: [record.get(key) for record in records] for key in all_keys}
+
+
 def streamlit_graph(
     nodes: list[dict[str, Any]],
     edges: list[dict[str, Any]],
@@ -86,6 +132,10 @@ def streamlit_graph(
     directed: bool = True,
     multi_select: bool = True,
     key: Optional[str] = None,
+    style_fn: Optional[Callable[[dict[str, Any]], dict[str, Any]]] = None,
+    palette: Optional[list[dict[str, Any]]] = None,
+    positions: Optional[list[list[float]]] = None,
+    smooth_edges: Optional[bool] = None,
 ) -> Optional[dict]:
     """
     Display an interactive graph visualization.
@@ -105,11 +155,21 @@ def streamlit_graph(
             - label: Optional edge label
             - title: Optional edge tooltip
             - color: Optional edge color
+            - dashes: Optional, draw the edge dashed
         layout: Physics layout algorithm ('barnes_hut' or 'force_atlas')
         height: Height of the component in pixels
         directed: Whether edges should show arrows
         multi_select: Allow selecting multiple nodes
         key: Optional unique key for the component
+        style_fn: Optional function applied to each node while the payload
+            is built, returning the node dict to send
+        palette: Optional list of {type, color, shape, size} styles. When
+            given, nodes are (id, label, title, palette index) rows instead
+            of dicts, so each distinct style is sent only once
+        positions: Optional precomputed [x, y] per node, in node order. When
+            given, physics is disabled and vis.js draws the nodes in place
+        smooth_edges: Draw curved edges. Defaults to curved for graphs of
+            up to SMOOTH_EDGE_LIMIT nodes and straight above that
 
     Returns:
         Event dictionary if user interaction occurred, None otherwise.
@@ -123,14 +183,47 @@ def streamlit_graph(
     # Get physics configuration
     physics = PHYSICS_PRESETS.get(layout, PHYSICS_PRESETS["barnes_hut"])
 
+    if style_fn is not None:
+        nodes = [style_fn(node) for node in nodes]
+
+    if smooth_edges is None:
+        smooth_edges = len(nodes) <= SMOOTH_EDGE_LIMIT
+
+    graph = {"nodes": nodes, "edges": edges, "soa": False}
+    if positions is not None:
+        graph["positions"] = positions
+        physics = {**physics, "enabled": False}
+    if palette is not None:
+        graph["palette"] = palette
+    elif len(nodes) > SOA_THRESHOLD:
+        graph = {
+            "nodes": _to_columns(nodes, NODE_KEYS),
+            "edges": _to_columns(edges, EDGE_KEYS),
+            "soa": True,
+        }
+        if positions is not None:
+            graph["positions"] = positions
+
+    # Pre-encode the graph with orjson when available; the frontend parses
+    # the payload strings once instead of Streamlit encoding each dict.
+    # Edges get their own string so edge-only changes keep the nodes as is
+    if orjson is not None:
+        edges_payload = graph.pop("edges")
+        graph_args = {
+            "payload": orjson.dumps(graph).decode(),
+            "edgesPayload": orjson.dumps(edges_payload).decode(),
+        }
+    else:
+        graph_args = graph
+
     # Call the component
-    event = _component_func(
-        nodes=nodes,
-        edges=edges,
+    event = _get_component()(
+        **graph_args,
         physics=physics,
         height=height,
         directed=directed,
         multiSelect=multi_select,
+        smoothEdges=smooth_edges,
         key=key,
         default=None,
     )
@@ -138,6 +231,58 @@ def streamlit_graph(
     return event
 
 
+def _node_styler(
+    colors: Optional[Mapping[str, str]] = None,
+    shapes: Optional[Mapping[str, str]] = None,
+    sizes: Optional[Mapping[str, int]] = None,
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Return a function that fills in a node's type-based styling."""
+    style_by_type = build_style_table(
+        colors or NODE_COLORS, shapes or NODE_SHAPES, sizes or NODE_SIZES
+    )
+
+    def style_node(node: dict[str, Any]) -> dict[str, Any]:
+        color, shape, size = style_by_type.get(node.get("type", "default"), DEFAULT_NODE_STYLE)
+        return {
+            **node,
+            "color": node.get("color") or color,
+            "shape": node.get("shape") or shape,
+            "size": node.get("size") or size,
+        }
+
+    return style_node
+
+
+def style_nodes(
+    nodes: list[dict[str, Any]],
+    colors: Optional[Mapping[str, str]] = None,
+    shapes: Optional[Mapping[str, str]] = None,
+    sizes: Optional[Mapping[str, int]] = None,
+) -> list[dict[str, Any]]:
+    """
+    Apply type-based styling to nodes ahead of display.
+
+    Useful for static graphs: style once, then pass the result straight
+    to streamlit_graph on every rerun.
+
+    Args:
+        nodes: List of node dictionaries (same format as streamlit_graph)
+        colors: Optional color mapping by node type (defaults to NODE_COLORS)
+        shapes: Optional shape mapping by node type (defaults to NODE_SHAPES)
+        sizes: Optional size mapping by node type (defaults to NODE_SIZES)
+
+    Returns:
+        New node dictionaries with color, shape and size filled in.
+    """
+    style_node = _node_styler(colors, shapes, sizes)
+    return [style_node(node) for node in nodes]
+
+
+def short_label(text: str, width: int = 20) -> str:
+    """Truncate a node label to width characters, marking cuts with "..."."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
 def display_interactive_graph(
     nodes: list[dict[str, Any]],
     edges: list[dict[str, Any]],
@@ -169,31 +314,30 @@ def display_interactive_graph(
     Returns:
         Event dictionary if user interaction occurred, None otherwise.
     """
-    # Apply custom styling
-    color_map = colors or NODE_COLORS
-    shape_map = shapes or NODE_SHAPES
-    size_map = sizes or NODE_SIZES
-
-    styled_nodes = []
-    for node in nodes:
-        node_type = node.get("type", "default")
-        styled_nodes.append({
-            **node,
-            "color": node.get("color") or color_map.get(node_type, "#888888"),
-            "shape": node.get("shape") or shape_map.get(node_type, "dot"),
-            "size": node.get("size") or size_map.get(node_type, 25),
-        })
-
+    # Apply custom styling while the payload is built
     return streamlit_graph(
-        nodes=styled_nodes,
+        nodes=nodes,
         edges=edges,
         layout=layout,
         height=height,
         directed=directed,
         key=key,
+        style_fn=_node_styler(colors, shapes, sizes),
     )
 
 
+class NodeRec(NamedTuple):
+    """Styled node record stored by InteractiveNetwork."""
+
+    id: str
+    label: str
+    type: str
+    title: str
+    size: int
+    color: str
+    shape: str
+
+
 class InteractiveNetwork:
     """
     Drop-in replacement for PyVis Network with interactive capabilities.
@@ -234,11 +378,17 @@ class InteractiveNetwork:
         self.directed = directed
         self.physics_enabled = physics_enabled
         self.layout = layout
-        self.nodes: list[dict] = []
+        self.nodes: list[NodeRec] = []
         self.edges: list[dict] = []
-        self._colors = NODE_COLORS.copy()
-        self._shapes = NODE_SHAPES.copy()
-        self._sizes = NODE_SIZES.copy()
+        # Shared read-only defaults; set_styling swaps in merged copies
+        self._colors: Mapping[str, str] = NODE_COLORS
+        self._shapes: Mapping[str, str] = NODE_SHAPES
+        self._sizes: Mapping[str, int] = NODE_SIZES
+        self._style_by_type = _DEFAULT_STYLE_TABLE
+
+    def _build_style_table(self) -> None:
+        """Materialize a (color, shape, size) tuple per known node type."""
+        self._style_by_type = build_style_table(self._colors, self._shapes, self._sizes)
 
     def set_styling(
         self,
@@ -247,12 +397,15 @@ class InteractiveNetwork:
         sizes: Optional[dict[str, int]] = None,
     ) -> None:
         """Set custom styling maps for node types."""
+        if not (colors or shapes or sizes):
+            return
         if colors:
-            self._colors.update(colors)
+            self._colors = {**self._colors, **colors}
         if shapes:
-            self._shapes.update(shapes)
+            self._shapes = {**self._shapes, **shapes}
         if sizes:
-            self._sizes.update(sizes)
+            self._sizes = {**self._sizes, **sizes}
+        self._build_style_table()
 
     def add_node(
         self,
@@ -265,15 +418,18 @@ class InteractiveNetwork:
         shape: Optional[str] = None,
     ) -> None:
         """Add a node to the network."""
-        self.nodes.append({
-            "id": node_id,
-            "label": label,
-            "type": node_type,
-            "title": title or f"{node_type}: {label}",
-            "size": size or self._sizes.get(node_type, 25),
-            "color": color or self._colors.get(node_type, "#888888"),
-            "shape": shape or self._shapes.get(node_type, "dot"),
-        })
+        default_color, default_shape, default_size = self._style_by_type.get(
+            node_type, DEFAULT_NODE_STYLE
+        )
+        self.nodes.append(NodeRec(
+            id=node_id,
+            label=label,
+            type=node_type,
+            title=title or f"{node_type}: {label}",
+            size=size or default_size,
+            color=color or default_color,
+            shape=shape or default_shape,
+        ))
 
     def add_nodes(self, nodes: list[dict[str, Any]]) -> None:
         """Add multiple nodes at once."""
@@ -320,19 +476,49 @@ class InteractiveNetwork:
         """Change the physics layout."""
         self.layout = layout
 
-    def display(self, key: Optional[str] = None) -> Optional[dict]:
+    def display(
+        self,
+        key: Optional[str] = None,
+        precompute_layout: bool = False,
+    ) -> Optional[dict]:
         """
         Display the network in Streamlit and return interaction events.
 
         Args:
             key: Optional unique key for the component
+            precompute_layout: Position nodes server-side with a force-directed
+                layout and skip the browser physics simulation. Requires
+                numba; without it the browser lays out the graph as usual.
 
         Returns:
             Event dictionary if user interaction occurred, None otherwise.
         """
+        # Dictionary-encode node styles: each distinct (type, color, shape, size)
+        # goes into the palette once and nodes refer to it by index
+        palette_index: dict[tuple, int] = {}
+        rows = []
+        for node in self.nodes:
+            style = (node.type, node.color, node.shape, node.size)
+            index = palette_index.setdefault(style, len(palette_index))
+            rows.append((node.id, node.label, node.title, index))
+        palette = [dict(zip(PALETTE_KEYS, style)) for style in palette_index]
+
+        positions = None
+        if precompute_layout:
+            # Imported lazily: pulls in numpy and numba
+            from app.components import layout as layout_engine
+
+            if layout_engine.NUMBA_AVAILABLE:
+                positions = layout_engine.compute_positions(
+                    [node.id for node in self.nodes],
+                    [(edge["from"], edge["to"]) for edge in self.edges],
+                ).tolist()
+
         return streamlit_graph(
-            nodes=self.nodes,
+            nodes=rows,
             edges=self.edges,
+            palette=palette,
+            positions=positions,
             layout=self.layout,
             height=self.height,
             directed=self.directed,
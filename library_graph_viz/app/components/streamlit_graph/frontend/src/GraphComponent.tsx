@@ -1,4 +1,4 @@
-import { useEffect, useRef, useCallback, useState } from 'react';
+import { useEffect, useRef, useCallback, useMemo, useState } from 'react';
 import { Network, Options, Data } from 'vis-network';
 import { DataSet } from 'vis-data';
 import {
@@ -6,7 +6,16 @@ import {
   withStreamlitConnection,
   ComponentProps,
 } from 'streamlit-component-lib';
-import { GraphComponentArgs, GraphEvent } from './types';
+import {
+  Columns,
+  EncodedNode,
+  GraphComponentArgs,
+  GraphEdge,
+  GraphEvent,
+  GraphNode,
+  GraphPayload,
+  PaletteEntry,
+} from './types';
 import './styles.css';
 
 // Use any for DataSet to avoid complex type issues with vis-network
@@ -28,6 +37,34 @@ function LoadingSpinner({ height }: { height: number }) {
   );
 }
 
+// Rebuild row objects from column arrays sent for large graphs
+function fromColumns<T>(columns: Columns<T>): T[] {
+  const keys = Object.keys(columns) as (keyof T)[];
+  const length = keys.length > 0 ? columns[keys[0]].length : 0;
+  const rows = new Array<T>(length);
+  for (let i = 0; i < length; i++) {
+    const row = {} as T;
+    for (const key of keys) {
+      const value = columns[key][i];
+      if (value !== null) {
+        row[key] = value as T[keyof T];
+      }
+    }
+    rows[i] = row;
+  }
+  return rows;
+}
+
+// Expand palette-encoded node rows back into node objects
+function fromPalette(rows: EncodedNode[], palette: PaletteEntry[]): GraphNode[] {
+  return rows.map(([id, label, title, index]) => ({
+    id,
+    label,
+    title,
+    ...palette[index],
+  }));
+}
+
 // Physics presets matching current PyVis configuration
 const PHYSICS_PRESETS: Record<string, Options['physics']> = {
   barnes_hut: {
@@ -73,16 +110,95 @@ function GraphComponent({ args }: ComponentProps) {
   const [currentLayout, setCurrentLayout] = useState<string>('');
   const [isLoading, setIsLoading] = useState<boolean>(false);
   const loadingTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  // Records last written to the DataSets; layout-only updates leave them be
+  const appliedNodesRef = useRef<object[] | null>(null);
+  const appliedEdgesRef = useRef<object[] | null>(null);
 
   const {
-    nodes,
-    edges,
+    nodes: rawNodes,
+    edges: rawEdges,
+    soa: rawSoa,
+    palette: rawPalette,
+    positions: rawPositions,
+    payload,
+    edgesPayload,
     physics,
     height,
     directed,
     multiSelect,
+    smoothEdges,
   } = args as GraphComponentArgs;
 
+  // Parse the pre-encoded payloads once per change. Nodes and edges arrive
+  // in separate strings, so an edge-only change (e.g. toggling edge labels)
+  // leaves the parsed nodes, and the nodes DataSet, untouched
+  const { nodes, soa } = useMemo(() => {
+    const data: GraphPayload = payload
+      ? JSON.parse(payload)
+      : {
+          nodes: rawNodes ?? [],
+          soa: rawSoa,
+          palette: rawPalette,
+          positions: rawPositions,
+        };
+
+    let graphNodes: GraphNode[];
+    if (data.palette) {
+      graphNodes = fromPalette(data.nodes as EncodedNode[], data.palette);
+    } else if (data.soa) {
+      graphNodes = fromColumns(data.nodes as Columns<GraphNode>);
+    } else {
+      graphNodes = data.nodes as GraphNode[];
+    }
+
+    // Apply server-side layout positions, if any
+    const positions = data.positions;
+    if (positions) {
+      graphNodes = graphNodes.map((n, i) => ({ ...n, x: positions[i][0], y: positions[i][1] }));
+    }
+
+    return { nodes: graphNodes, soa: Boolean(data.soa) };
+  }, [payload, rawNodes, rawSoa, rawPalette, rawPositions]);
+
+  const edges = useMemo(() => {
+    const data = edgesPayload ? JSON.parse(edgesPayload) : rawEdges ?? [];
+    return soa
+      ? fromColumns(data as Columns<GraphEdge>)
+      : (data as GraphEdge[]);
+  }, [edgesPayload, rawEdges, soa]);
+
+  // Prepare node data with vis-network format, once per data change
+  const visNodes = useMemo(() => nodes.map((n) => ({
+    id: n.id,
+    label: n.label,
+    title: n.title || `${n.type}: ${n.label}`,
+    size: n.size || 25,
+    color: n.color || '#888888',
+    shape: n.shape || 'dot',
+    font: { color: '#ffffff' },
+    ...(n.x !== undefined && n.y !== undefined ? { x: n.x, y: n.y } : {}),
+  })), [nodes]);
+
+  // Prepare edge data with vis-network format
+  // Use index in ID to handle multiple edges between same nodes
+  const visEdges = useMemo(() => edges.map((e, index) => ({
+    id: `${e.from}-${e.to}-${index}`,
+    from: e.from,
+    to: e.to,
+    label: e.label || '',
+    title: e.title || e.label || '',
+    color: e.color || '#888888',
+    dashes: e.dashes || false,
+  })), [edges]);
+
+  // Physics options for the current layout, or disabled for pre-positioned graphs
+  const physicsOptions = useCallback((layout: string): Options['physics'] => {
+    if (physics.enabled === false) {
+      return { enabled: false };
+    }
+    return PHYSICS_PRESETS[layout] || PHYSICS_PRESETS.barnes_hut;
+  }, [physics.enabled]);
+
   // Send event to Python
   const sendEvent = useCallback((event: GraphEvent) => {
     Streamlit.setComponentValue(event);
@@ -91,11 +207,10 @@ function GraphComponent({ args }: ComponentProps) {
   // Update physics without rebuilding network
   const updatePhysics = useCallback((layout: string) => {
     if (networkRef.current && layout !== currentLayout) {
-      const physicsOptions = PHYSICS_PRESETS[layout] || PHYSICS_PRESETS.barnes_hut;
-      networkRef.current.setOptions({ physics: physicsOptions });
+      networkRef.current.setOptions({ physics: physicsOptions(layout) });
       setCurrentLayout(layout);
     }
-  }, [currentLayout]);
+  }, [currentLayout, physicsOptions]);
 
   // Initialize or update network
   useEffect(() => {
@@ -103,33 +218,13 @@ function GraphComponent({ args }: ComponentProps) {
 
     const isInitialLoad = !networkRef.current;
 
-    // Prepare node data with vis-network format
-    const visNodes = nodes.map((n) => ({
-      id: n.id,
-      label: n.label,
-      title: n.title || `${n.type}: ${n.label}`,
-      size: n.size || 25,
-      color: n.color || '#888888',
-      shape: n.shape || 'dot',
-      font: { color: '#ffffff' },
-    }));
-
-    // Prepare edge data with vis-network format
-    // Use index in ID to handle multiple edges between same nodes
-    const visEdges = edges.map((e, index) => ({
-      id: `${e.from}-${e.to}-${index}`,
-      from: e.from,
-      to: e.to,
-      label: e.label || '',
-      title: e.title || e.label || '',
-      color: e.color || '#888888',
-    }));
-
     // Create network if not exists
     if (!networkRef.current) {
       // Initialize DataSets
       nodesDataRef.current = new DataSet(visNodes);
       edgesDataRef.current = new DataSet(visEdges);
+      appliedNodesRef.current = visNodes;
+      appliedEdgesRef.current = visEdges;
 
       const options: Options = {
         nodes: {
@@ -143,7 +238,8 @@ function GraphComponent({ args }: ComponentProps) {
         },
         edges: {
           color: { inherit: false },
-          smooth: true,
+          // Straight edges skip per-frame Bezier math on large graphs
+          smooth: smoothEdges !== false,
           font: {
             size: 10,
             color: '#ffffff',
@@ -161,7 +257,7 @@ function GraphComponent({ args }: ComponentProps) {
           keyboard: { enabled: true },
           multiselect: multiSelect,
         },
-        physics: PHYSICS_PRESETS[physics.layout] || PHYSICS_PRESETS.barnes_hut,
+        physics: physicsOptions(physics.layout),
       };
 
       const data: Data = {
@@ -185,8 +281,9 @@ function GraphComponent({ args }: ComponentProps) {
 
       // Only show loading spinner if graph takes more than 200ms to stabilize
       // This avoids flash for fast graphs, but shows spinner for slow ones
+      // Pre-positioned graphs skip stabilization, so never show the spinner
       loadingTimerRef.current = setTimeout(() => {
-        if (!hasInitializedRef.current) {
+        if (!hasInitializedRef.current && physics.enabled !== false) {
           setIsLoading(true);
         }
       }, 200);
@@ -268,11 +365,19 @@ function GraphComponent({ args }: ComponentProps) {
         }
       });
     } else {
-      // Update existing network data
-      nodesDataRef.current?.clear();
-      nodesDataRef.current?.add(visNodes);
-      edgesDataRef.current?.clear();
-      edgesDataRef.current?.add(visEdges);
+      // Update existing network data, only where it changed: a layout
+      // switch keeps both DataSets, and an edge label toggle keeps the nodes
+      if (appliedNodesRef.current !== visNodes) {
+        nodesDataRef.current?.clear();
+        nodesDataRef.current?.add(visNodes);
+        appliedNodesRef.current = visNodes;
+      }
+      if (appliedEdgesRef.current !== visEdges) {
+        edgesDataRef.current?.clear();
+        edgesDataRef.current?.add(visEdges);
+        appliedEdgesRef.current = visEdges;
+      }
+      networkRef.current?.setOptions({ edges: { smooth: smoothEdges !== false } });
 
       // Update physics if changed
       if (physics.layout !== currentLayout) {
@@ -282,7 +387,7 @@ function GraphComponent({ args }: ComponentProps) {
 
     // Set frame height for Streamlit
     Streamlit.setFrameHeight(height);
-  }, [nodes, edges, physics, height, directed, multiSelect, sendEvent, updatePhysics, currentLayout]);
+  }, [visNodes, visEdges, physics, height, directed, multiSelect, smoothEdges, sendEvent, updatePhysics, physicsOptions, currentLayout]);
 
   // Cleanup on unmount
   useEffect(() => {
@@ -7,6 +7,8 @@ export interface GraphNode {
   size?: number;
   color?: string;
   shape?: string;
+  x?: number;
+  y?: number;
 }
 
 // Edge data structure
@@ -16,6 +18,7 @@ export interface GraphEdge {
   label?: string;
   title?: string;
   color?: string;
+  dashes?: boolean;
 }
 
 // Physics layout type
@@ -24,6 +27,7 @@ export type PhysicsLayout = 'barnes_hut' | 'force_atlas';
 // Physics configuration
 export interface PhysicsConfig {
   layout: PhysicsLayout;
+  enabled?: boolean;
   gravity: number;
   centralGravity: number;
   springLength: number;
@@ -31,14 +35,43 @@ export interface PhysicsConfig {
   damping: number;
 }
 
+// Shared node style referenced by index from palette-encoded nodes
+export interface PaletteEntry {
+  type: string;
+  color: string;
+  shape: string;
+  size: number;
+}
+
+// Palette-encoded node row: [id, label, title, palette index]
+export type EncodedNode = [string, string, string, number];
+
+// Column-oriented (structure-of-arrays) form used for large graphs
+export type Columns<T> = { [K in keyof T]-?: Array<T[K] | null> };
+
+// Node data, either sent directly or pre-encoded as a JSON payload; edges
+// travel in a payload of their own
+export interface GraphPayload {
+  nodes: GraphNode[] | Columns<GraphNode> | EncodedNode[];
+  soa?: boolean;
+  palette?: PaletteEntry[];
+  positions?: [number, number][];
+}
+
 // Component props from Python
 export interface GraphComponentArgs {
-  nodes: GraphNode[];
-  edges: GraphEdge[];
+  nodes?: GraphNode[] | Columns<GraphNode> | EncodedNode[];
+  edges?: GraphEdge[] | Columns<GraphEdge>;
+  soa?: boolean;
+  palette?: PaletteEntry[];
+  positions?: [number, number][];
+  payload?: string;
+  edgesPayload?: string;
   physics: PhysicsConfig;
   height: number;
   directed: boolean;
   multiSelect: boolean;
+  smoothEdges?: boolean;
 }
 
 // Event types sent back to Python
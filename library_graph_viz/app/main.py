@@ -1,6 +1,7 @@
 """Main Streamlit application for Library Graph Visualization."""
 
 import streamlit as st
+import importlib
 import logging
 from datetime import datetime
 from typing import Optional
@@ -8,21 +9,8 @@ from typing import Optional
 from config.settings import get_settings, Settings
 from etl.neo4j_connector import Neo4jConnector
 from etl.mysql_connector import MySQLConnector
-from etl.etl_pipeline import LibraryETL
-from app.views import (
-    full_network,
-    books_authors,
-    member_history,
-    category_explorer,
-    staff_activity,
-    custom_query,
-    analytics,
-    erd_oltp,
-    erd_olap,
-    crud_examples,
-    olap_analytics,
-    transactions_demo,
-)
+from etl.etl_pipeline import LibraryETL, VIEW_INDEXES
+from app.components.sidebar import render_sidebar
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -55,20 +43,20 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-# View mapping
+# View mapping: display name -> module in app.views, imported on first use
 VIEWS = {
-    "🌐 Full Library Network": full_network,
-    "📖 Books & Authors": books_authors,
-    "👤 Member Borrowing History": member_history,
-    "📂 Category Explorer": category_explorer,
-    "👥 Staff Activity": staff_activity,
-    "🔍 Custom Cypher Query": custom_query,
-    "📊 Analytics & Recommendations": analytics,
-    "📋 ERD: OLTP Schema": erd_oltp,
-    "⭐ ERD: OLAP Star Schema": erd_olap,
-    "✏️ CRUD Examples": crud_examples,
-    "📈 OLAP Analytics": olap_analytics,
-    "💳 Transactions Demo": transactions_demo,
+    "🌐 Full Library Network": "full_network",
+    "📖 Books & Authors": "books_authors",
+    "👤 Member Borrowing History": "member_history",
+    "📂 Category Explorer": "category_explorer",
+    "👥 Staff Activity": "staff_activity",
+    "🔍 Custom Cypher Query": "custom_query",
+    "📊 Analytics & Recommendations": "analytics",
+    "📋 ERD: OLTP Schema": "erd_oltp",
+    "⭐ ERD: OLAP Star Schema": "erd_olap",
+    "✏️ CRUD Examples": "crud_examples",
+    "📈 OLAP Analytics": "olap_analytics",
+    "💳 Transactions Demo": "transactions_demo",
 }
 
 
@@ -77,6 +65,9 @@ def get_neo4j_connector() -> Neo4jConnector:
     """
     Get a cached Neo4j connector instance.
 
+    The connector wraps the process-wide pooled driver, so every session
+    shares one Bolt connection pool.
+
     Returns:
         Neo4jConnector instance.
     """
@@ -84,119 +75,53 @@ def get_neo4j_connector() -> Neo4jConnector:
     connector = Neo4jConnector(settings)
     # Enter context to establish connection
     connector.__enter__()
+    # Idempotent; covers graphs loaded before these indexes existed
+    for label, prop in VIEW_INDEXES:
+        connector.create_index(label, prop)
     return connector
 
 
-def run_etl_sync() -> Optional[dict]:
+def run_etl_sync(neo4j: Neo4jConnector) -> Optional[dict]:
     """
     Run the ETL pipeline to sync data.
 
+    Args:
+        neo4j: Cached Neo4j connector, reused so its connection pool stays warm.
+
     Returns:
         Dictionary with sync results or None if failed.
     """
     settings = get_settings()
     try:
+        neo4j.driver.verify_connectivity()
         with MySQLConnector(settings) as mysql:
-            with Neo4jConnector(settings) as neo4j:
-                etl = LibraryETL(mysql, neo4j)
-                return etl.run(clear_first=True)
+            etl = LibraryETL(mysql, neo4j)
+            return etl.run(clear_first=True)
     except Exception as e:
         logger.error(f"ETL sync failed: {e}")
         return None
 
 
-def render_sidebar(neo4j: Neo4jConnector) -> str:
+def sync_data(neo4j: Neo4jConnector) -> None:
     """
-    Render the sidebar navigation.
+    Run the ETL sync from the sidebar and refresh caches accordingly.
 
     Args:
         neo4j: Neo4j connector instance.
-
-    Returns:
-        Selected view name.
     """
-    st.sidebar.title("📚 Library Graph Explorer")
-
-    # View selection
-    st.sidebar.markdown("### Navigation")
-    selected_view = st.sidebar.selectbox(
-        "Select View",
-        list(VIEWS.keys()),
-        help="Choose a visualization to explore",
-    )
-
-    # Sync section
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### Data Sync")
-
-    if "last_sync" not in st.session_state:
-        st.session_state["last_sync"] = None
-
-    if st.session_state["last_sync"]:
-        st.sidebar.text(f"Last sync: {st.session_state['last_sync'].strftime('%Y-%m-%d %H:%M')}")
+    with st.spinner("Running ETL sync..."):
+        result = run_etl_sync(neo4j)
+    if result:
+        st.session_state["last_sync"] = datetime.now()
+        st.sidebar.success("Sync completed!")
+        # Refresh cached query results; the connector and its pool stay
+        st.cache_data.clear()
+        st.rerun()
     else:
-        st.sidebar.text("Never synced")
-
-    if st.sidebar.button("🔄 Sync Data", help="Run ETL to refresh graph data from MySQL"):
-        with st.spinner("Running ETL sync..."):
-            result = run_etl_sync()
-            if result:
-                st.session_state["last_sync"] = datetime.now()
-                st.sidebar.success("Sync completed!")
-                # Clear cache to refresh data
-                st.cache_resource.clear()
-                st.rerun()
-            else:
-                st.sidebar.error("Sync failed. Check database connections.")
-
-    # Statistics section
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### Graph Statistics")
-
-    try:
-        stats = neo4j.get_statistics()
-
-        col1, col2 = st.sidebar.columns(2)
-        col1.metric("Nodes", stats.get("total_nodes", 0))
-        col2.metric("Relationships", stats.get("total_relationships", 0))
-
-        with st.sidebar.expander("📊 Node Counts"):
-            for label, count in stats.get("nodes", {}).items():
-                st.text(f"{label}: {count}")
-
-        with st.sidebar.expander("🔗 Relationship Counts"):
-            for rel_type, count in stats.get("relationships", {}).items():
-                st.text(f"{rel_type}: {count}")
-
-    except Exception as e:
-        st.sidebar.warning("Could not load statistics")
-        st.sidebar.info("Run ETL sync to populate the graph")
-
-    # Legend
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### Legend")
-
-    from app.components.graph_builder import NODE_COLORS
-
-    legend_items = []
-    for node_type, color in NODE_COLORS.items():
-        legend_items.append(f'<span style="color: {color};">●</span> {node_type}')
-
-    st.sidebar.markdown("<br>".join(legend_items), unsafe_allow_html=True)
-
-    # Footer
-    st.sidebar.markdown("---")
-    st.sidebar.markdown(
-        """
-        <div style='text-align: center; color: #888;'>
-            <small>Library Graph Viz v1.0</small><br>
-            <small>Neo4j + PyVis + Streamlit</small>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    return selected_view
+        # Rebuild this app's connector on the next run; the driver pool is
+        # shared with other sessions and only reset from "Retry Connection"
+        st.cache_resource.clear()
+        st.sidebar.error("Sync failed. Check database connections.")
 
 
 def main():
@@ -216,18 +141,24 @@ def main():
 
         if st.button("🔄 Retry Connection"):
             st.cache_resource.clear()
+            Neo4jConnector.close_drivers()
             st.rerun()
 
         return
 
     # Render sidebar and get selected view
-    selected_view = render_sidebar(neo4j)
+    selected_view = render_sidebar(
+        VIEWS,
+        neo4j,
+        on_sync=lambda: sync_data(neo4j),
+        last_sync=st.session_state.get("last_sync"),
+    )
 
     # Main content
     st.title("Library Management Graph Visualization")
 
     # Render the selected view
-    view_module = VIEWS[selected_view]
+    view_module = importlib.import_module(f"app.views.{VIEWS[selected_view]}")
     view_module.render(neo4j)
 
 
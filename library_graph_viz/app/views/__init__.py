@@ -1,17 +1,11 @@
-"""Streamlit views for Library Graph Visualization."""
+"""Streamlit views for Library Graph Visualization.
 
-from . import full_network
-from . import books_authors
-from . import member_history
-from . import category_explorer
-from . import staff_activity
-from . import custom_query
-from . import analytics
-from . import erd_oltp
-from . import erd_olap
-from . import crud_examples
-from . import olap_analytics
-from . import transactions_demo
+View modules are imported on first attribute access, so a session only
+pays for the views it actually opens.
+"""
+
+import importlib
+from types import ModuleType
 
 __all__ = [
     "full_network",
@@ -27,3 +21,10 @@ __all__ = [
     "olap_analytics",
     "transactions_demo",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a view module lazily (PEP 562)."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,7 @@
 import streamlit as st
 import pandas as pd
 from etl.neo4j_connector import Neo4jConnector
+from app.components.query_cache import cached_query
 from app.components.streamlit_graph import display_interactive_graph
 
 
@@ -37,6 +38,45 @@ def render(neo4j: Neo4jConnector) -> None:
         render_top_performers(neo4j)
 
 
+RECOMMENDATIONS_QUERY = """
+    UNWIND $book_ids AS bid
+    MATCH (b:Book {id: bid})
+    OPTIONAL MATCH (b)<-[:WROTE]-(a:Author)-[:WROTE]->(rec:Book)
+    WHERE rec <> b
+    WITH bid, b, collect(DISTINCT {book: rec, reason: 'Same Author: ' + a.name}) AS author_recs
+
+    OPTIONAL MATCH (b)-[:BELONGS_TO]->(c:Category)<-[:BELONGS_TO]-(rec2:Book)
+    WHERE rec2 <> b
+    WITH bid, author_recs, collect(DISTINCT {book: rec2, reason: 'Same Category: ' + c.name}) AS category_recs
+
+    UNWIND author_recs + category_recs AS rec
+    WITH bid, rec.book AS book, collect(DISTINCT rec.reason) AS reasons
+    WHERE book IS NOT NULL
+    WITH bid, collect({
+        id: book.id,
+        title: book.title,
+        year: book.publication_year,
+        matching_reasons: reasons[0..3]
+    })[0..10] AS recs
+    UNWIND recs AS rec
+    RETURN
+        bid,
+        rec.id AS id,
+        rec.title AS title,
+        rec.year AS year,
+        rec.matching_reasons AS matching_reasons
+"""
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_recommendations(_neo4j: Neo4jConnector, book_ids: tuple) -> dict:
+    """Fetch up to 10 recommendations for each book in one round trip."""
+    recommendations: dict = {}
+    for row in _neo4j.run_query(RECOMMENDATIONS_QUERY, {"book_ids": list(book_ids)}):
+        recommendations.setdefault(row.pop("bid"), []).append(row)
+    return recommendations
+
+
 def render_book_recommendations(neo4j: Neo4jConnector) -> None:
     """Render book recommendations based on borrowing patterns."""
     st.markdown("### 📚 Book Recommendations")
@@ -50,7 +90,7 @@ def render_book_recommendations(neo4j: Neo4jConnector) -> None:
             ORDER BY b.title
             LIMIT 100
         """
-        books = neo4j.run_query(books_query)
+        books = cached_query(neo4j, books_query)
 
         if not books:
             st.warning("No books found.")
@@ -65,29 +105,12 @@ def render_book_recommendations(neo4j: Neo4jConnector) -> None:
         book_id = book_options[selected_book]
 
         if st.button("Find Similar Books", type="primary"):
-            # Find similar books by same author or same category
-            query = """
-                MATCH (b:Book {id: $book_id})
-                OPTIONAL MATCH (b)<-[:WROTE]-(a:Author)-[:WROTE]->(rec:Book)
-                WHERE rec <> b
-                WITH b, collect(DISTINCT {book: rec, reason: 'Same Author: ' + a.name}) AS author_recs
-
-                OPTIONAL MATCH (b)-[:BELONGS_TO]->(c:Category)<-[:BELONGS_TO]-(rec2:Book)
-                WHERE rec2 <> b
-                WITH b, author_recs, collect(DISTINCT {book: rec2, reason: 'Same Category: ' + c.name}) AS category_recs
-
-                WITH b, author_recs + category_recs AS all_recs
-                UNWIND all_recs AS rec
-                WITH rec.book AS book, collect(DISTINCT rec.reason) AS reasons
-                WHERE book IS NOT NULL
-                RETURN
-                    book.id AS id,
-                    book.title AS title,
-                    book.publication_year AS year,
-                    reasons[0..3] AS matching_reasons
-                LIMIT 10
-            """
-            results = neo4j.run_query(query, {"book_id": book_id})
+            # One batched query covers every book in the dropdown; later
+            # selections are served from the cached mapping
+            recommendations = _fetch_recommendations(
+                neo4j, tuple(sorted(book_options.values()))
+            )
+            results = recommendations.get(book_id, [])
 
             if results:
                 st.success(f"Found {len(results)} recommendations for '{selected_book}'")
@@ -115,11 +138,13 @@ def render_member_connections(neo4j: Neo4jConnector) -> None:
     try:
         # Get members
         members_query = """
-            MATCH (m:Member)-[:BORROWED]->(:Loan)
+            MATCH (m:Member)
+            WHERE EXISTS { (m)-[:BORROWED]->(:Loan) }
             RETURN m.id AS id, m.name AS name
             ORDER BY m.name
+            LIMIT 500
         """
-        members = neo4j.run_query(members_query)
+        members = cached_query(neo4j, members_query)
 
         if not members:
             st.warning("No members with borrowing history found.")
@@ -134,12 +159,15 @@ def render_member_connections(neo4j: Neo4jConnector) -> None:
         member_id = member_options[selected_member]
 
         if st.button("Find Connections", type="primary"):
-            # Find other members who borrowed same books
+            # Find other members who borrowed same books; dedupe the selected
+            # member's books first so repeat loans don't multiply the expansion
             query = """
                 MATCH (m1:Member {id: $member_id})-[:BORROWED]->(:Loan)-[:CONTAINS]->(b:Book)
-                      <-[:CONTAINS]-(:Loan)<-[:BORROWED]-(m2:Member)
-                WHERE m1 <> m2
-                WITH m1, m2, collect(DISTINCT b.title) AS shared_books
+                WITH m1, collect(DISTINCT b) AS my_books
+                UNWIND my_books AS b
+                MATCH (b)<-[:CONTAINS]-(:Loan)<-[:BORROWED]-(m2:Member)
+                WHERE m2 <> m1
+                WITH m2, collect(DISTINCT b.title) AS shared_books
                 RETURN
                     m2.id AS member_id,
                     m2.name AS member_name,
@@ -203,58 +231,88 @@ def render_member_connections(neo4j: Neo4jConnector) -> None:
         st.error(f"Error: {e}")
 
 
+TRENDS_QUERY = """
+    MATCH (b:Book)<-[:CONTAINS]-(l:Loan)
+    RETURN 'popular' AS kind, b.title AS name, count(l) AS value
+    ORDER BY value DESC
+    LIMIT 10
+    UNION ALL
+    MATCH (c:Category)<-[:BELONGS_TO]-(b:Book)<-[:CONTAINS]-(l:Loan)
+    RETURN 'category' AS kind, c.name AS name, count(l) AS value
+    ORDER BY value DESC
+    UNION ALL
+    MATCH (l:Loan)
+    RETURN
+        'status' AS kind,
+        CASE
+            WHEN l.return_date IS NOT NULL THEN 'Returned'
+            WHEN l.due_date < date() THEN 'Overdue'
+            ELSE 'Active'
+        END AS name,
+        count(l) AS value
+"""
+
+TOP_PERFORMERS_QUERY = """
+    MATCH (a:Author)-[:WROTE]->(b:Book)
+    RETURN 'author' AS kind, a.name AS name, count(b) AS value, [] AS categories
+    ORDER BY value DESC
+    LIMIT 10
+    UNION ALL
+    MATCH (m:Member)-[:BORROWED]->(l:Loan)
+    RETURN 'member' AS kind, m.name AS name, count(l) AS value, [] AS categories
+    ORDER BY value DESC
+    LIMIT 10
+    UNION ALL
+    MATCH (m:Member)-[:BORROWED]->(:Loan)-[:CONTAINS]->(b:Book)-[:BELONGS_TO]->(c:Category)
+    WITH m, count(DISTINCT c) AS category_count, collect(DISTINCT c.name)[0..5] AS categories
+    RETURN 'diverse' AS kind, m.name AS name, category_count AS value, categories
+    ORDER BY value DESC
+    LIMIT 5
+"""
+
+
+def _split_by_kind(rows: list[dict]) -> dict[str, list[dict]]:
+    """Group rows of a UNION query by their 'kind' column, keeping order."""
+    groups: dict[str, list[dict]] = {}
+    for row in rows:
+        groups.setdefault(row["kind"], []).append(row)
+    return groups
+
+
 def render_trends(neo4j: Neo4jConnector) -> None:
     """Show borrowing trends and patterns."""
     st.markdown("### 📈 Borrowing Trends & Patterns")
 
     try:
+        # All three panels come from a single round trip
+        trends = _split_by_kind(cached_query(neo4j, TRENDS_QUERY))
+
         col1, col2 = st.columns(2)
 
         with col1:
             st.markdown("#### Most Popular Books")
-            popular_query = """
-                MATCH (b:Book)<-[:CONTAINS]-(l:Loan)
-                RETURN b.title AS book, count(l) AS borrows
-                ORDER BY borrows DESC
-                LIMIT 10
-            """
-            popular = neo4j.run_query(popular_query)
+            popular = trends.get("popular")
 
             if popular:
-                df = pd.DataFrame(popular)
+                df = pd.DataFrame(popular).rename(columns={"name": "book", "value": "borrows"})
                 st.bar_chart(df.set_index("book")["borrows"])
 
         with col2:
             st.markdown("#### Most Active Categories")
-            category_query = """
-                MATCH (c:Category)<-[:BELONGS_TO]-(b:Book)<-[:CONTAINS]-(l:Loan)
-                RETURN c.name AS category, count(l) AS borrows
-                ORDER BY borrows DESC
-            """
-            categories = neo4j.run_query(category_query)
+            categories = trends.get("category")
 
             if categories:
-                df = pd.DataFrame(categories)
+                df = pd.DataFrame(categories).rename(columns={"name": "category", "value": "borrows"})
                 st.bar_chart(df.set_index("category")["borrows"])
 
         # Overdue analysis
         st.markdown("#### 📅 Loan Status Overview")
-        status_query = """
-            MATCH (l:Loan)
-            RETURN
-                CASE
-                    WHEN l.return_date IS NOT NULL THEN 'Returned'
-                    WHEN l.due_date < date() THEN 'Overdue'
-                    ELSE 'Active'
-                END AS status,
-                count(l) AS count
-        """
-        status = neo4j.run_query(status_query)
+        status = trends.get("status")
 
         if status:
             cols = st.columns(len(status))
             for i, s in enumerate(status):
-                cols[i].metric(s["status"], s["count"])
+                cols[i].metric(s["name"], s["value"])
 
     except Exception as e:
         st.error(f"Error: {e}")
@@ -265,53 +323,37 @@ def render_top_performers(neo4j: Neo4jConnector) -> None:
     st.markdown("### 🌟 Top Performers")
 
     try:
+        # All three panels come from a single round trip
+        performers = _split_by_kind(cached_query(neo4j, TOP_PERFORMERS_QUERY))
+
         col1, col2 = st.columns(2)
 
         with col1:
             st.markdown("#### Most Prolific Authors")
-            authors_query = """
-                MATCH (a:Author)-[:WROTE]->(b:Book)
-                RETURN a.name AS author, count(b) AS books
-                ORDER BY books DESC
-                LIMIT 10
-            """
-            authors = neo4j.run_query(authors_query)
+            authors = performers.get("author")
 
             if authors:
                 for i, a in enumerate(authors, 1):
-                    st.markdown(f"{i}. **{a['author']}** - {a['books']} books")
+                    st.markdown(f"{i}. **{a['name']}** - {a['value']} books")
 
         with col2:
             st.markdown("#### Most Active Members")
-            members_query = """
-                MATCH (m:Member)-[:BORROWED]->(l:Loan)
-                RETURN m.name AS member, count(l) AS loans
-                ORDER BY loans DESC
-                LIMIT 10
-            """
-            members = neo4j.run_query(members_query)
+            members = performers.get("member")
 
             if members:
                 for i, m in enumerate(members, 1):
-                    st.markdown(f"{i}. **{m['member']}** - {m['loans']} loans")
+                    st.markdown(f"{i}. **{m['name']}** - {m['value']} loans")
 
         # Cross-category readers
         st.markdown("#### 📖 Most Diverse Readers")
         st.caption("Members who read from the most categories")
 
-        diverse_query = """
-            MATCH (m:Member)-[:BORROWED]->(:Loan)-[:CONTAINS]->(b:Book)-[:BELONGS_TO]->(c:Category)
-            WITH m, count(DISTINCT c) AS category_count, collect(DISTINCT c.name)[0..5] AS categories
-            RETURN m.name AS member, category_count, categories
-            ORDER BY category_count DESC
-            LIMIT 5
-        """
-        diverse = neo4j.run_query(diverse_query)
+        diverse = performers.get("diverse")
 
         if diverse:
             df = pd.DataFrame([{
-                "Member": d["member"],
-                "Categories Read": d["category_count"],
+                "Member": d["name"],
+                "Categories Read": d["value"],
                 "Sample Categories": ", ".join(d["categories"]),
             } for d in diverse])
             st.dataframe(df, width="stretch")
@@ -3,6 +3,7 @@
 import streamlit as st
 import pandas as pd
 from etl.neo4j_connector import Neo4jConnector
+from app.components.query_cache import cached_query_df
 from app.components.streamlit_graph import (
     display_interactive_graph,
     NODE_COLORS,
@@ -39,64 +40,79 @@ def render(neo4j: Neo4jConnector) -> None:
         )
 
     try:
-        # Query for authors and books
+        # Query for authors and books; node labels and tooltips are
+        # formatted server-side
         query = """
             MATCH (a:Author)-[:WROTE]->(b:Book)
-            WITH a, collect(b) AS books, count(b) AS book_count
-            WHERE book_count >= $min_books
-            UNWIND books AS book
+            WITH a, b
+            ORDER BY b.title
+            WITH a, collect({
+                book_id: b.id,
+                book_title: b.title,
+                publication_year: b.publication_year,
+                isbn: b.isbn,
+                book_label: CASE
+                    WHEN size(b.title) > 25 THEN substring(b.title, 0, 25) + '...'
+                    ELSE b.title
+                END,
+                book_tooltip: 'Book: ' + b.title
+                    + '\\nYear: ' + coalesce(toString(b.publication_year), 'Unknown')
+                    + '\\nISBN: ' + coalesce(b.isbn, 'N/A')
+            }) AS books
+            WHERE size(books) >= $min_books
             RETURN
                 a.id AS author_id,
                 a.name AS author_name,
-                book.id AS book_id,
-                book.title AS book_title,
-                book.publication_year AS publication_year,
-                book.isbn AS isbn
-            ORDER BY author_name, book_title
+                books
+            ORDER BY author_name
         """
-        results = neo4j.run_query(query, {"min_books": min_books})
+        authors_df = cached_query_df(neo4j, query, (("min_books", min_books),))
 
-        if not results:
+        if authors_df.empty:
             st.warning("No author-book relationships found with the current filter.")
             return
 
-        # Build unique nodes
-        authors = {}
-        books = {}
-        edges = []
-
-        for r in results:
-            # Author node
-            author_id = f"author_{r['author_id']}"
-            if author_id not in authors:
-                authors[author_id] = {
-                    "id": author_id,
-                    "label": r["author_name"],
-                    "type": "Author",
-                    "title": f"Author: {r['author_name']}",
-                    "size": 35,  # Authors are larger
-                }
-
-            # Book node
-            book_id = f"book_{r['book_id']}"
-            if book_id not in books:
-                books[book_id] = {
-                    "id": book_id,
-                    "label": r["book_title"][:25] + "..." if len(r["book_title"]) > 25 else r["book_title"],
-                    "type": "Book",
-                    "title": f"Book: {r['book_title']}\nYear: {r['publication_year'] or 'Unknown'}\nISBN: {r['isbn'] or 'N/A'}",
-                }
-
-            # Edge
-            edges.append({
-                "from": author_id,
-                "to": book_id,
-                "label": "WROTE",
-                "title": "WROTE",
-            })
+        # One row per author, with that author's books nested in a list
+        authors_df["author_node"] = "author_" + authors_df["author_id"].astype(str)
+        authors = pd.DataFrame({
+            "id": authors_df["author_node"],
+            "label": authors_df["author_name"],
+            "type": "Author",
+            "title": "Author: " + authors_df["author_name"],
+            "size": 35,  # Authors are larger
+        }).to_dict("records")
+
+        # Flatten to one row per (author, book) for edges and the data table
+        df = authors_df.explode("books", ignore_index=True)
+        # object dtype keeps integer years from being upcast to float by None
+        df = pd.concat(
+            [df.drop(columns="books"), pd.DataFrame(df["books"].tolist(), dtype=object)],
+            axis=1,
+        )
+
+        # Co-authored books appear under each author: dedupe on the raw id and
+        # format the "book_N" node id once per unique book, not once per edge
+        book_codes, unique_book_ids = pd.factorize(df["book_id"])
+        book_nodes = "book_" + pd.Series(unique_book_ids, dtype=object).astype(str)
+        df["book_node"] = book_nodes.to_numpy()[book_codes]
+
+        books_df = df.drop_duplicates("book_id")
+        books = pd.DataFrame({
+            "id": books_df["book_node"],
+            "label": books_df["book_label"],
+            "type": "Book",
+            "title": books_df["book_tooltip"],
+        }).to_dict("records")
+
+        edges = pd.DataFrame({
+            "from": df["author_node"],
+            "to": df["book_node"],
+            "label": "WROTE",
+            "title": "WROTE",
+        }).to_dict("records")
 
         # Combine all nodes
-        all_nodes = list(authors.values()) + list(books.values())
+        all_nodes = authors + books
 
         # Display statistics
         col1, col2, col3 = st.columns(3)
@@ -124,7 +140,6 @@ def render(neo4j: Neo4jConnector) -> None:
 
         # Data table
         with st.expander("📋 View Data Table"):
-            df = pd.DataFrame(results)
             df = df.rename(columns={
                 "author_name": "Author",
                 "book_title": "Book Title",
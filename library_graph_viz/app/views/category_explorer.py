@@ -4,6 +4,58 @@ import streamlit as st
 import pandas as pd
 from etl.neo4j_connector import Neo4jConnector
 from app.components.streamlit_graph import display_interactive_graph
+from utils.export import export_to_csv
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_category_graphs(_neo4j: Neo4jConnector) -> dict:
+    """
+    Fetch every category with its books and authors in one query (5 minute TTL).
+
+    Book labels and tooltips are formatted in the query, so the work
+    happens once per cache fill rather than on every rerun. Views that
+    show several categories at once should look them up in this mapping
+    instead of querying per category.
+
+    Returns:
+        Mapping of category id to a dict with name, description, book_count
+        and books, ordered by book count (largest first).
+    """
+    query = """
+        MATCH (c:Category)<-[:BELONGS_TO]-(b:Book)
+        OPTIONAL MATCH (a:Author)-[:WROTE]->(b)
+        WITH c, b, collect(DISTINCT {id: a.id, name: a.name}) AS authors
+        ORDER BY b.title
+        WITH c, collect({
+            book_id: b.id,
+            book_title: b.title,
+            publication_year: b.publication_year,
+            isbn: b.isbn,
+            book_label: CASE
+                WHEN size(b.title) > 25 THEN substring(b.title, 0, 25) + '...'
+                ELSE b.title
+            END,
+            book_tooltip: 'Book: ' + b.title
+                + '\\nYear: ' + coalesce(toString(b.publication_year), 'Unknown')
+                + '\\nISBN: ' + coalesce(b.isbn, 'N/A'),
+            authors: authors
+        }) AS books
+        RETURN
+            c.id AS id,
+            c.name AS name,
+            c.description AS description,
+            size(books) AS book_count,
+            books
+        ORDER BY book_count DESC
+    """
+    return {c["id"]: c for c in _neo4j.run_query(query)}
+
+
+@st.cache_data(ttl=300, max_entries=16, show_spinner=False)
+def _to_csv(df: pd.DataFrame) -> bytes:
+    """Encode a table as CSV bytes for download."""
+    csv_bytes, _ = export_to_csv(df)
+    return csv_bytes
 
 
 def render(neo4j: Neo4jConnector) -> None:
@@ -17,123 +69,109 @@ def render(neo4j: Neo4jConnector) -> None:
     st.markdown("Explore books and authors organized by category.")
 
     try:
-        # Get list of categories with book counts
-        categories_query = """
-            MATCH (c:Category)<-[:BELONGS_TO]-(b:Book)
-            RETURN c.id AS id, c.name AS name, c.description AS description, count(b) AS book_count
-            ORDER BY book_count DESC
-        """
-        categories = neo4j.run_query(categories_query)
+        # All categories and their books arrive in one round trip; switching
+        # category is a dict lookup
+        categories = _fetch_category_graphs(neo4j)
 
         if not categories:
             st.warning("No categories found in the database.")
             return
 
-        # Category selector
+        # Category selector; labels map straight to the category details
         category_options = {
-            f"{c['name']} ({c['book_count']} books)": c['id']
-            for c in categories
+            f"{c['name']} ({c['book_count']} books)": c
+            for c in categories.values()
         }
         selected_category = st.selectbox(
             "Select Category",
             list(category_options.keys()),
             help="Choose a category to explore",
         )
-        category_id = category_options[selected_category]
-
-        # Get category details
-        category_info = next(c for c in categories if c['id'] == category_id)
+        category_info = category_options[selected_category]
+        category_id = category_info["id"]
 
         # Display category info
         st.info(f"**{category_info['name']}**: {category_info['description'] or 'No description available'}")
 
-        # Query for books in category with authors
-        query = """
-            MATCH (b:Book)-[:BELONGS_TO]->(c:Category {id: $category_id})
-            OPTIONAL MATCH (a:Author)-[:WROTE]->(b)
-            RETURN
-                c.id AS category_id,
-                c.name AS category_name,
-                b.id AS book_id,
-                b.title AS book_title,
-                b.publication_year AS publication_year,
-                b.isbn AS isbn,
-                collect(DISTINCT {id: a.id, name: a.name}) AS authors
-            ORDER BY b.title
-        """
-        results = neo4j.run_query(query, {"category_id": category_id})
+        # Books in category with authors
+        results = category_info["books"]
 
         if not results:
             st.info("No books found in this category.")
             return
 
-        # Build graph
-        nodes = []
-        edges = []
-        seen_nodes = set()
+        # Bound the graph to a slice of the category so large categories
+        # stay interactive; the table below still lists every book
+        max_books = st.slider(
+            "Max books to visualize",
+            min_value=10,
+            max_value=500,
+            value=100,
+            step=10,
+            help="Books are taken in title order",
+        )
+        graph_books = results[:max_books]
+        if len(results) > max_books:
+            st.caption(f"Showing {max_books} of {len(results)} books in the graph.")
 
-        # Add central category node
+        # Collect node fields in parallel lists (insertion-ordered dicts for
+        # dedup) and build the node/edge dicts in one pass at the end
         category_node_id = f"category_{category_id}"
-        nodes.append({
-            "id": category_node_id,
-            "label": category_info["name"],
-            "type": "Category",
-            "title": f"Category: {category_info['name']}\nBooks: {category_info['book_count']}",
-            "size": 50,  # Larger central node
-        })
-        seen_nodes.add(category_node_id)
+        book_ids: list[str] = []
+        book_labels: list[str] = []
+        book_titles: list[str] = []
+        author_names: dict[str, str] = {}
+        wrote_pairs: dict[tuple[str, str], None] = {}
 
-        for r in results:
-            # Book node
+        for r in graph_books:
             book_node_id = f"book_{r['book_id']}"
-            if book_node_id not in seen_nodes:
-                title = r["book_title"]
-                nodes.append({
-                    "id": book_node_id,
-                    "label": title[:25] + "..." if len(title) > 25 else title,
-                    "type": "Book",
-                    "title": f"Book: {title}\nYear: {r['publication_year'] or 'Unknown'}\nISBN: {r['isbn'] or 'N/A'}",
-                })
-                seen_nodes.add(book_node_id)
-
-                # Book -> Category edge
-                edges.append({
-                    "from": book_node_id,
-                    "to": category_node_id,
-                    "label": "BELONGS_TO",
-                    "title": "BELONGS_TO",
-                })
-
-            # Author nodes
+            book_ids.append(book_node_id)
+            book_labels.append(r["book_label"])
+            book_titles.append(r["book_tooltip"])
+
             for author in r["authors"]:
                 if author["id"]:
                     author_node_id = f"author_{author['id']}"
-                    if author_node_id not in seen_nodes:
-                        nodes.append({
-                            "id": author_node_id,
-                            "label": author["name"],
-                            "type": "Author",
-                            "title": f"Author: {author['name']}",
-                        })
-                        seen_nodes.add(author_node_id)
-
-                    # Author -> Book edge
-                    edge_id = f"{author_node_id}_{book_node_id}"
-                    if edge_id not in seen_nodes:
-                        edges.append({
-                            "from": author_node_id,
-                            "to": book_node_id,
-                            "label": "WROTE",
-                            "title": "WROTE",
-                        })
-                        seen_nodes.add(edge_id)
-
-        # Statistics
-        unique_authors = len([n for n in nodes if n["type"] == "Author"])
+                    author_names.setdefault(author_node_id, author["name"])
+                    wrote_pairs[(author_node_id, book_node_id)] = None
+
+        nodes = [{
+            "id": category_node_id,
+            "label": category_info["name"],
+            "type": "Category",
+            "title": f"Category: {category_info['name']}\nBooks: {category_info['book_count']}",
+            "size": 50,  # Larger central node
+        }]
+        nodes += [
+            {"id": node_id, "label": label, "type": "Book", "title": title}
+            for node_id, label, title in zip(book_ids, book_labels, book_titles)
+        ]
+        nodes += [
+            {"id": node_id, "label": name, "type": "Author", "title": f"Author: {name}"}
+            for node_id, name in author_names.items()
+        ]
+
+        edges = [
+            {"from": node_id, "to": category_node_id, "label": "BELONGS_TO", "title": "BELONGS_TO"}
+            for node_id in book_ids
+        ]
+        edges += [
+            {"from": author_node_id, "to": book_node_id, "label": "WROTE", "title": "WROTE"}
+            for author_node_id, book_node_id in wrote_pairs
+        ]
+
+        # Statistics over the whole category, not just the graphed slice
+        category_wrote = {
+            (author["id"], r["book_id"])
+            for r in results
+            for author in r["authors"]
+            if author["id"]
+        }
+        unique_authors = len({author_id for author_id, _ in category_wrote})
         col1, col2, col3 = st.columns(3)
         col1.metric("Books in Category", len(results))
         col2.metric("Authors", unique_authors)
-        col3.metric("Total Connections", len(edges))
+        col3.metric("Total Connections", len(results) + len(category_wrote))
 
         # Display the interactive graph
         event = display_interactive_graph(
@@ -155,21 +193,23 @@ def render(neo4j: Neo4jConnector) -> None:
 
         # Data table
         with st.expander("📋 Books in Category"):
-            table_data = []
-            for r in results:
-                authors_str = ", ".join([a["name"] for a in r["authors"] if a["name"]])
-                table_data.append({
-                    "Title": r["book_title"],
-                    "Year": r["publication_year"] or "Unknown",
-                    "Authors": authors_str or "Unknown",
-                    "ISBN": r["isbn"] or "N/A",
-                })
-
-            df = pd.DataFrame(table_data)
+            # object dtype keeps integer years from being upcast to float by None
+            df = pd.DataFrame(
+                results, columns=["book_title", "publication_year", "authors", "isbn"], dtype=object
+            )
+            df["authors"] = df["authors"].map(
+                lambda authors: ", ".join(a["name"] for a in authors if a["name"]) or "Unknown"
+            )
+            df = df.rename(columns={
+                "book_title": "Title",
+                "publication_year": "Year",
+                "authors": "Authors",
+                "isbn": "ISBN",
+            }).fillna({"Year": "Unknown", "ISBN": "N/A"})
             st.dataframe(df, width="stretch")
 
-            # Download
-            csv = df.to_csv(index=False)
+            # Download (CSV cached per table so repeat downloads don't rebuild it)
+            csv = _to_csv(df)
             st.download_button(
                 label="Download as CSV",
                 data=csv,
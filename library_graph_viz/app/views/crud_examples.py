@@ -11,10 +11,8 @@ def get_table_statistics() -> dict:
     """Fetch table counts from MySQL with caching (60 second TTL)."""
     settings = get_settings()
     with MySQLConnector(settings, database="oltp") as db:
-        counts = {}
-        for table in ["member", "book", "author", "category", "staff", "loan", "fine"]:
-            counts[table.upper()] = db.get_table_count(table)
-        return counts
+        counts = db.get_table_counts(["member", "book", "author", "category", "staff", "loan", "fine"])
+        return {table.upper(): count for table, count in counts.items()}
 
 
 # SQL Query Examples
@@ -167,6 +165,25 @@ WHERE first_name = 'Test' AND last_name = 'Author';""",
 }
 
 
+# Static overview for the Summary tab, built once per process
+CRUD_SUMMARY = pd.DataFrame({
+    "Operation": ["CREATE", "READ", "UPDATE", "DELETE"],
+    "SQL Command": ["INSERT", "SELECT", "UPDATE", "DELETE"],
+    "Purpose": [
+        "Add new records to tables",
+        "Query and retrieve data",
+        "Modify existing records",
+        "Remove records from tables",
+    ],
+    "Example Use Case": [
+        "New member registration",
+        "View active/overdue loans",
+        "Mark book as returned",
+        "Remove erroneous entry",
+    ],
+})
+
+
 def render(neo4j=None) -> None:
     """Render the CRUD examples view."""
     st.header("CRUD Operations Examples")
@@ -214,24 +231,7 @@ def render(neo4j=None) -> None:
     with tabs[4]:
         st.subheader("CRUD Operations Summary")
 
-        summary_data = {
-            "Operation": ["CREATE", "READ", "UPDATE", "DELETE"],
-            "SQL Command": ["INSERT", "SELECT", "UPDATE", "DELETE"],
-            "Purpose": [
-                "Add new records to tables",
-                "Query and retrieve data",
-                "Modify existing records",
-                "Remove records from tables",
-            ],
-            "Example Use Case": [
-                "New member registration",
-                "View active/overdue loans",
-                "Mark book as returned",
-                "Remove erroneous entry",
-            ],
-        }
-
-        st.table(pd.DataFrame(summary_data))
+        st.table(CRUD_SUMMARY)
 
         st.divider()
         st.subheader("Key SQL Concepts Demonstrated")
@@ -272,12 +272,10 @@ def render(neo4j=None) -> None:
         try:
             counts = get_table_statistics()
 
-            col1, col2, col3, col4 = st.columns(4)
-            tables = list(counts.items())
+            cols = st.columns(4)
 
-            for i, (table, count) in enumerate(tables):
-                col = [col1, col2, col3, col4][i % 4]
-                with col:
+            for i, (table, count) in enumerate(counts.items()):
+                with cols[i % 4]:
                     st.metric(table, f"{count:,}")
 
         except Exception as e:
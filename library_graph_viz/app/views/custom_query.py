@@ -1,9 +1,79 @@
 """Custom Cypher Query View - Execute custom queries against Neo4j."""
 
+import io
+import re
+from typing import Any
+
 import streamlit as st
 import pandas as pd
 from etl.neo4j_connector import Neo4jConnector
-
+from utils.export import export_to_csv
+
+
+# Matches a LIMIT clause at the very end of a query, so property names
+# like `time_limit` don't suppress the default limit. The limit may be a
+# number, a $parameter or an identifier
+TRAILING_LIMIT_RE = re.compile(r"\bLIMIT\s+(\d+|\$?\w+)\s*;?\s*$", re.IGNORECASE)
+
+# Clauses that change the graph; queries using them always run against Neo4j
+WRITE_CLAUSE_RE = re.compile(
+    r"\b(CREATE|MERGE|DELETE|SET|REMOVE|DROP|LOAD\s+CSV|CALL)\b", re.IGNORECASE
+)
+
+# Editor and help text
+QUERY_PLACEHOLDER = "MATCH (n) RETURN n LIMIT 10"
+QUERY_HELP = "Enter a valid Cypher query. Results will be displayed as a table."
+QUERY_ERROR_TIPS = (
+    "Tips:\n"
+    "- Check your Cypher syntax\n"
+    "- Make sure node labels and property names are correct\n"
+    "- Verify relationships exist in the database"
+)
+
+CYPHER_QUICK_REFERENCE = """
+### Common Patterns
+
+**Match nodes:**
+```cypher
+MATCH (n:Label) RETURN n
+```
+
+**Match with properties:**
+```cypher
+MATCH (n:Label {property: 'value'}) RETURN n
+```
+
+**Match relationships:**
+```cypher
+MATCH (a)-[r:RELATIONSHIP]->(b) RETURN a, r, b
+```
+
+**Filter results:**
+```cypher
+MATCH (n) WHERE n.property > 10 RETURN n
+```
+
+**Aggregate:**
+```cypher
+MATCH (n) RETURN count(n), avg(n.value)
+```
+
+**Order and limit:**
+```cypher
+MATCH (n) RETURN n ORDER BY n.name LIMIT 10
+```
+
+### Node Labels in This Database
+- `Member`, `Book`, `Author`, `Category`, `Staff`, `Loan`, `Fine`
+
+### Relationship Types
+- `WROTE` (Author → Book)
+- `BELONGS_TO` (Book → Category)
+- `BORROWED` (Member → Loan)
+- `CONTAINS` (Loan → Book)
+- `PROCESSED_BY` (Loan → Staff)
+- `HAS_FINE` (Loan → Fine)
+"""
 
 # Example queries for users
 EXAMPLE_QUERIES = {
@@ -57,6 +127,46 @@ ORDER BY count DESC""",
 }
 
 
+def _run_query_df(neo4j: Neo4jConnector, query: str, params: dict) -> pd.DataFrame:
+    """Run a custom query and load its rows into a DataFrame."""
+    results = neo4j.run_query(query, params)
+    if not results:
+        return pd.DataFrame()
+
+    # Every row of a Cypher result has the same keys, so take the columns
+    # from the first one
+    return pd.DataFrame.from_records(results, columns=list(results[0]))
+
+
+@st.cache_data(ttl=120, max_entries=64, show_spinner=False)
+def _cached_run(
+    _neo4j: Neo4jConnector, query: str, params: tuple[tuple[str, Any], ...]
+) -> pd.DataFrame:
+    """Run a custom query, caching the result table on the query text and parameters."""
+    return _run_query_df(_neo4j, query, dict(params))
+
+
+def _serialize_results(df: pd.DataFrame) -> tuple[bytes, bytes]:
+    """Encode query results as CSV and JSON bytes for the download buttons."""
+    csv_bytes, _ = export_to_csv(df)
+    json_buffer = io.BytesIO()
+    df.to_json(json_buffer, orient="records", indent=2)
+    return csv_bytes, json_buffer.getvalue()
+
+
+@st.cache_data(ttl=120, max_entries=16, show_spinner=False)
+def _cached_serialize(
+    _df: pd.DataFrame, query: str, params: tuple[tuple[str, Any], ...]
+) -> tuple[bytes, bytes]:
+    """
+    Encode a _cached_run result for download, keyed like _cached_run.
+
+    Keying on the query and parameters rather than the frame avoids hashing
+    every result cell on each rerun (node and map cells are not hashable).
+    """
+    return _serialize_results(_df)
+
+
 def render(neo4j: Neo4jConnector) -> None:
     """
     Render the custom Cypher query view.
@@ -69,15 +179,18 @@ def render(neo4j: Neo4jConnector) -> None:
 
     # Example queries section
     with st.expander("📝 Example Queries", expanded=False):
-        st.markdown("Click on a query to load it into the editor:")
-
-        for name, query in EXAMPLE_QUERIES.items():
-            if st.button(f"📋 {name}", key=f"example_{name}"):
-                st.session_state["custom_query"] = query
+        # Only the selected example is rendered, so each rerun draws one
+        # code block instead of the whole catalogue
+        example_name = st.selectbox(
+            "Choose an example to preview",
+            list(EXAMPLE_QUERIES),
+            key="example_query_choice",
+        )
+        example_query = EXAMPLE_QUERIES[example_name]
+        st.code(example_query, language="cypher")
 
-            with st.container():
-                st.code(query, language="cypher")
-                st.markdown("---")
+        if st.button("📋 Load into editor", key="load_example_query"):
+            st.session_state["custom_query"] = example_query
 
     # Query editor
     st.markdown("### Query Editor")
@@ -90,8 +203,8 @@ def render(neo4j: Neo4jConnector) -> None:
         "Enter Cypher Query",
         value=st.session_state.get("custom_query", ""),
         height=200,
-        placeholder="MATCH (n) RETURN n LIMIT 10",
-        help="Enter a valid Cypher query. Results will be displayed as a table.",
+        placeholder=QUERY_PLACEHOLDER,
+        help=QUERY_HELP,
     )
 
     # Update session state
@@ -115,34 +228,55 @@ def render(neo4j: Neo4jConnector) -> None:
             min_value=1,
             max_value=1000,
             value=100,
-            help="Maximum number of results to return",
+            help="Maximum number of results to return. Applied as the $auto_limit parameter so Neo4j can reuse the query plan.",
+        )
+        bypass_cache = st.checkbox(
+            "Bypass cache",
+            help="Re-run the query against Neo4j instead of reusing results from the last two minutes.",
         )
 
     # Execute query
     if execute_button and query.strip():
         try:
             with st.spinner("Executing query..."):
-                # Add LIMIT if not present
-                query_lower = query.lower()
-                if "limit" not in query_lower and result_limit:
-                    # Check if it ends with a number (likely already has limit)
-                    final_query = f"{query.rstrip().rstrip(';')} LIMIT {result_limit}"
+                # Add LIMIT unless the query already ends with one; the value goes
+                # as a parameter, so every limit value shares one cached plan
+                params = {}
+                if not TRAILING_LIMIT_RE.search(query) and result_limit:
+                    final_query = f"{query.rstrip().rstrip(';')} LIMIT $auto_limit"
+                    params["auto_limit"] = int(result_limit)
                 else:
                     final_query = query
 
-                results = neo4j.run_query(final_query)
-
-                if results:
-                    st.success(f"Query returned {len(results)} results")
+                # Identical read queries reuse cached results; writes always run
+                # and drop cached reads, which may no longer match the graph
+                param_key = tuple(sorted(params.items()))
+                from_cache = False
+                if WRITE_CLAUSE_RE.search(final_query):
+                    df = _run_query_df(neo4j, final_query, params)
+                    _cached_run.clear()
+                    _cached_serialize.clear()
+                elif bypass_cache:
+                    df = _run_query_df(neo4j, final_query, params)
+                    # Fresh rows replace any results and downloads cached for
+                    # this query, so the next cached run cannot serve stale rows
+                    _cached_run.clear()
+                    _cached_serialize.clear()
+                else:
+                    df = _cached_run(neo4j, final_query, param_key)
+                    from_cache = True
 
-                    # Display as DataFrame
-                    df = pd.DataFrame(results)
+                if not df.empty:
+                    st.success(f"Query returned {len(df)} results")
                     st.dataframe(df, width="stretch")
 
                     # Download options
                     col1, col2 = st.columns(2)
+                    if from_cache:
+                        csv, json_data = _cached_serialize(df, final_query, param_key)
+                    else:
+                        csv, json_data = _serialize_results(df)
                     with col1:
-                        csv = df.to_csv(index=False)
                         st.download_button(
                             label="📥 Download as CSV",
                             data=csv,
@@ -151,7 +285,6 @@ def render(neo4j: Neo4jConnector) -> None:
                         )
 
                     with col2:
-                        json_data = df.to_json(orient="records", indent=2)
                         st.download_button(
                             label="📥 Download as JSON",
                             data=json_data,
@@ -162,6 +295,8 @@ def render(neo4j: Neo4jConnector) -> None:
                     # Show query info
                     with st.expander("ℹ️ Query Info"):
                         st.code(final_query, language="cypher")
+                        if params:
+                            st.text(f"Parameters: {params}")
                         st.text(f"Columns: {', '.join(df.columns)}")
                         st.text(f"Rows returned: {len(df)}")
 
@@ -170,59 +305,11 @@ def render(neo4j: Neo4jConnector) -> None:
 
         except Exception as e:
             st.error(f"Query Error: {e}")
-            st.info(
-                "Tips:\n"
-                "- Check your Cypher syntax\n"
-                "- Make sure node labels and property names are correct\n"
-                "- Verify relationships exist in the database"
-            )
+            st.info(QUERY_ERROR_TIPS)
 
     elif execute_button:
         st.warning("Please enter a query to execute.")
 
     # Query help section
     with st.expander("❓ Cypher Quick Reference"):
-        st.markdown("""
-        ### Common Patterns
-
-        **Match nodes:**
-        ```cypher
-        MATCH (n:Label) RETURN n
-        ```
-
-        **Match with properties:**
-        ```cypher
-        MATCH (n:Label {property: 'value'}) RETURN n
-        ```
-
-        **Match relationships:**
-        ```cypher
-        MATCH (a)-[r:RELATIONSHIP]->(b) RETURN a, r, b
-        ```
-
-        **Filter results:**
-        ```cypher
-        MATCH (n) WHERE n.property > 10 RETURN n
-        ```
-
-        **Aggregate:**
-        ```cypher
-        MATCH (n) RETURN count(n), avg(n.value)
-        ```
-
-        **Order and limit:**
-        ```cypher
-        MATCH (n) RETURN n ORDER BY n.name LIMIT 10
-        ```
-
-        ### Node Labels in This Database
-        - `Member`, `Book`, `Author`, `Category`, `Staff`, `Loan`, `Fine`
-
-        ### Relationship Types
-        - `WROTE` (Author → Book)
-        - `BELONGS_TO` (Book → Category)
-        - `BORROWED` (Member → Loan)
-        - `CONTAINS` (Loan → Book)
-        - `PROCESSED_BY` (Loan → Staff)
-        - `HAS_FINE` (Loan → Fine)
-        """)
+        st.markdown(CYPHER_QUICK_REFERENCE)
@@ -1,8 +1,10 @@
 """ERD Visualization for OLAP (Star Schema)."""
 
 import streamlit as st
+from app.components.layout import radial_positions
 from app.components.streamlit_graph import (
-    display_interactive_graph,
+    streamlit_graph,
+    style_nodes,
     ERD_OLAP_COLORS,
     ERD_OLAP_SHAPES,
     ERD_OLAP_SIZES,
@@ -121,6 +123,15 @@ OLAP_RELATIONSHIPS = [
 ]
 
 
+# Tooltip marker for a column definition; the first matching tag wins
+COLUMN_MARKERS = (
+    ("PK", " [PK]"),
+    ("FK", " [FK]"),
+    ("(measure)", " [MEASURE]"),
+    ("(denorm)", " [DENORM]"),
+)
+
+
 def build_tooltip(table_name: str, table_info: dict) -> str:
     """Build plain text tooltip showing table columns."""
     table_type = table_info["type"]
@@ -131,19 +142,110 @@ def build_tooltip(table_name: str, table_info: dict) -> str:
         "Columns:",
     ]
     for col in table_info["columns"]:
-        marker = ""
-        if "PK" in col:
-            marker = " [PK]"
-        elif "FK" in col:
-            marker = " [FK]"
-        elif "(measure)" in col:
-            marker = " [MEASURE]"
-        elif "(denorm)" in col:
-            marker = " [DENORM]"
+        marker = next((marker for tag, marker in COLUMN_MARKERS if tag in col), "")
         lines.append(f"  {col}{marker}")
     return "\n".join(lines)
 
 
+# Graph payload for the diagram; the schema is static, so it is built and
+# styled once at import instead of on every rerun
+ERD_OLAP_NODES = style_nodes([
+    {
+        "id": table_name,
+        "label": table_name.upper().replace("_", " "),
+        "type": table_name,
+        "title": build_tooltip(table_name, table_info),
+        "size": ERD_OLAP_SIZES.get(table_name, 30),
+    }
+    for table_name, table_info in OLAP_TABLES.items()
+], ERD_OLAP_COLORS, ERD_OLAP_SHAPES, ERD_OLAP_SIZES)
+
+ERD_OLAP_EDGES = [
+    {
+        "from": rel["from"],
+        "to": rel["to"],
+        "label": rel["label"],
+        "title": f"FK: {rel['from']}.{rel['label']} -> {rel['to']}",
+        "color": "#888888" if not rel.get("dashed") else "#555555",
+        "dashes": rel.get("dashed", False),
+    }
+    for rel in OLAP_RELATIONSHIPS
+]
+
+# Fixed positions around the fact_loan hub; the diagram is drawn without a
+# physics simulation
+ERD_OLAP_POSITIONS = radial_positions(
+    [node["id"] for node in ERD_OLAP_NODES], center="fact_loan"
+).tolist()
+
+
+# Star schema component notes, shown one at a time below the diagram
+OLAP_COMPONENT_NOTES = {
+    "FACT_LOAN - Central Fact Table": """
+The fact table contains **quantitative measures** that can be aggregated:
+
+| Measure | Description |
+|---------|-------------|
+| `loan_count` | Always 1, allows COUNT aggregation |
+| `loan_duration_days` | Days between loan and return |
+| `days_overdue` | Days past due date (0 if on time) |
+| `fine_amount` | Fine amount in dollars |
+
+**Grain:** One row per loan transaction
+""",
+    "DIM_DATE - Time Dimension": """
+Enables time-based analysis:
+- Year, Quarter, Month analysis
+- Weekend vs. Weekday patterns
+- Week-over-week comparisons
+
+**Records:** ~4,000 (2020-2030)
+""",
+    "DIM_MEMBER - Member Dimension": """
+Member attributes for segmentation:
+- Full name (denormalized)
+- Membership year for cohort analysis
+- Status for filtering
+
+**Derived:** `full_name`, `membership_year`
+""",
+    "DIM_STAFF - Staff Dimension": """
+Staff attributes for performance analysis:
+- Full name (denormalized)
+- Role-based analysis
+- Hire year for tenure analysis
+
+**Derived:** `full_name`, `hire_year`
+""",
+    "DIM_BOOK - Book Dimension": """
+Book attributes with denormalized authors:
+- Authors as comma-separated string
+- Publication year for age analysis
+- Total copies for utilization
+
+**Denormalized:** `authors` field
+""",
+    "DIM_CATEGORY - Category Dimension": """
+Genre classification for collection analysis:
+- Category name
+- Description
+
+**Note:** Connected via bridge table
+""",
+    "BRIDGE_BOOK_CATEGORY - Bridge Table": """
+Handles **many-to-many** relationship between books and categories:
+
+| Column | Purpose |
+|--------|---------|
+| `weight_factor` | 1/N where N = categories per book |
+
+**Example:** A book in 3 categories has weight 0.333 each
+
+This ensures accurate aggregation without double-counting.
+""",
+}
+
+
 def render(neo4j=None) -> None:
     """Render the OLAP ERD visualization."""
     st.header("OLAP Star Schema - Entity Relationship Diagram")
@@ -154,61 +256,43 @@ def render(neo4j=None) -> None:
     - **Bridge table** (diamond) handles M:N category relationships with weighting
     """)
 
-    # Legend
+    # Legend: one markdown element per column
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.markdown("**Table Types:**")
-        st.markdown("- :red[**Star**] - Fact Table (measures)")
-        st.markdown("- :blue[**Box**] - Dimension Tables")
-        st.markdown("- :gray[**Diamond**] - Bridge Table")
+        st.markdown(
+            "**Table Types:**\n"
+            "- :red[**Star**] - Fact Table (measures)\n"
+            "- :blue[**Box**] - Dimension Tables\n"
+            "- :gray[**Diamond**] - Bridge Table"
+        )
     with col2:
-        st.markdown("**Tooltip Markers:**")
-        st.markdown("- `[PK]` - Primary Key")
-        st.markdown("- `[FK]` - Foreign Key")
-        st.markdown("- `[MEASURE]` - Measure columns")
-        st.markdown("- `[DENORM]` - Denormalized columns")
+        st.markdown(
+            "**Tooltip Markers:**\n"
+            "- `[PK]` - Primary Key\n"
+            "- `[FK]` - Foreign Key\n"
+            "- `[MEASURE]` - Measure columns\n"
+            "- `[DENORM]` - Denormalized columns"
+        )
     with col3:
-        st.markdown("**ETL Source:**")
-        st.markdown("- Populated from OLTP `library` database")
-        st.markdown("- ~4,000 date records (2020-2030)")
-        st.markdown("- Denormalized for query performance")
+        st.markdown(
+            "**ETL Source:**\n"
+            "- Populated from OLTP `library` database\n"
+            "- ~4,000 date records (2020-2030)\n"
+            "- Denormalized for query performance"
+        )
 
     st.divider()
 
-    # Build nodes
-    nodes = []
-    for table_name, table_info in OLAP_TABLES.items():
-        nodes.append({
-            "id": table_name,
-            "label": table_name.upper().replace("_", " "),
-            "type": table_name,
-            "title": build_tooltip(table_name, table_info),
-            "size": ERD_OLAP_SIZES.get(table_name, 30),
-        })
-
-    # Build edges
-    edges = []
-    for rel in OLAP_RELATIONSHIPS:
-        edge_style = {
-            "from": rel["from"],
-            "to": rel["to"],
-            "label": rel["label"],
-            "title": f"FK: {rel['from']}.{rel['label']} -> {rel['to']}",
-            "color": "#888888" if not rel.get("dashed") else "#555555",
-        }
-        edges.append(edge_style)
-
     # Display the interactive graph with OLAP styling
-    event = display_interactive_graph(
-        nodes=nodes,
-        edges=edges,
+    event = streamlit_graph(
+        nodes=ERD_OLAP_NODES,
+        edges=ERD_OLAP_EDGES,
+        positions=ERD_OLAP_POSITIONS,
+        smooth_edges=False,
         height=720,
         layout="barnes_hut",
         directed=True,
         key="erd_olap_network",
-        colors=ERD_OLAP_COLORS,
-        shapes=ERD_OLAP_SHAPES,
-        sizes=ERD_OLAP_SIZES,
     )
 
     # Handle graph events
@@ -233,88 +317,13 @@ def render(neo4j=None) -> None:
                         else:
                             st.markdown(col_def)
 
-    # Schema explanation
+    # Schema explanation: only the selected component's notes are rendered
     st.divider()
     st.subheader("Star Schema Components")
 
-    # Fact table
-    with st.expander("**FACT_LOAN** - Central Fact Table", expanded=True):
-        st.markdown("""
-        The fact table contains **quantitative measures** that can be aggregated:
-
-        | Measure | Description |
-        |---------|-------------|
-        | `loan_count` | Always 1, allows COUNT aggregation |
-        | `loan_duration_days` | Days between loan and return |
-        | `days_overdue` | Days past due date (0 if on time) |
-        | `fine_amount` | Fine amount in dollars |
-
-        **Grain:** One row per loan transaction
-        """)
-
-    # Dimensions
-    col1, col2 = st.columns(2)
-
-    with col1:
-        with st.expander("**DIM_DATE** - Time Dimension"):
-            st.markdown("""
-            Enables time-based analysis:
-            - Year, Quarter, Month analysis
-            - Weekend vs. Weekday patterns
-            - Week-over-week comparisons
-
-            **Records:** ~4,000 (2020-2030)
-            """)
-
-        with st.expander("**DIM_MEMBER** - Member Dimension"):
-            st.markdown("""
-            Member attributes for segmentation:
-            - Full name (denormalized)
-            - Membership year for cohort analysis
-            - Status for filtering
-
-            **Derived:** `full_name`, `membership_year`
-            """)
-
-        with st.expander("**DIM_STAFF** - Staff Dimension"):
-            st.markdown("""
-            Staff attributes for performance analysis:
-            - Full name (denormalized)
-            - Role-based analysis
-            - Hire year for tenure analysis
-
-            **Derived:** `full_name`, `hire_year`
-            """)
-
-    with col2:
-        with st.expander("**DIM_BOOK** - Book Dimension"):
-            st.markdown("""
-            Book attributes with denormalized authors:
-            - Authors as comma-separated string
-            - Publication year for age analysis
-            - Total copies for utilization
-
-            **Denormalized:** `authors` field
-            """)
-
-        with st.expander("**DIM_CATEGORY** - Category Dimension"):
-            st.markdown("""
-            Genre classification for collection analysis:
-            - Category name
-            - Description
-
-            **Note:** Connected via bridge table
-            """)
-
-        with st.expander("**BRIDGE_BOOK_CATEGORY** - Bridge Table"):
-            st.markdown("""
-            Handles **many-to-many** relationship between books and categories:
-
-            | Column | Purpose |
-            |--------|---------|
-            | `weight_factor` | 1/N where N = categories per book |
-
-            **Example:** A book in 3 categories has weight 0.333 each
-
-            This ensures accurate aggregation without double-counting.
-            """)
+    component = st.selectbox(
+        "Component",
+        list(OLAP_COMPONENT_NOTES),
+        key="erd_olap_component",
+    )
+    st.markdown(OLAP_COMPONENT_NOTES[component])
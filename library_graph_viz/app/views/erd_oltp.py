@@ -1,8 +1,10 @@
 """ERD Visualization for OLTP (Normalized) Schema."""
 
 import streamlit as st
+from app.components.layout import radial_positions
 from app.components.streamlit_graph import (
-    display_interactive_graph,
+    streamlit_graph,
+    style_nodes,
     ERD_OLTP_COLORS,
     ERD_OLTP_SHAPES,
     ERD_OLTP_SIZES,
@@ -114,6 +116,13 @@ OLTP_RELATIONSHIPS = [
 ]
 
 
+# Tooltip marker for a column definition; the first matching tag wins
+COLUMN_MARKERS = (
+    ("PK", " [PK]"),
+    ("FK", " [FK]"),
+)
+
+
 def build_tooltip(table_name: str, table_info: dict) -> str:
     """Build plain text tooltip showing table columns."""
     lines = [
@@ -123,15 +132,62 @@ def build_tooltip(table_name: str, table_info: dict) -> str:
         "Columns:",
     ]
     for col in table_info["columns"]:
-        marker = ""
-        if "PK" in col:
-            marker = " [PK]"
-        elif "FK" in col:
-            marker = " [FK]"
+        marker = next((marker for tag, marker in COLUMN_MARKERS if tag in col), "")
         lines.append(f"  {col}{marker}")
     return "\n".join(lines)
 
 
+# Graph payload for the diagram; the schema is static, so it is built and
+# styled once at import instead of on every rerun
+ERD_OLTP_NODES = style_nodes([
+    {
+        "id": table_name,
+        "label": table_name.upper(),
+        "type": table_name,
+        "title": build_tooltip(table_name, table_info),
+        "size": ERD_OLTP_SIZES.get(table_name, 30),
+    }
+    for table_name, table_info in OLTP_TABLES.items()
+], ERD_OLTP_COLORS, ERD_OLTP_SHAPES, ERD_OLTP_SIZES)
+
+ERD_OLTP_EDGES = [
+    {
+        "from": rel["from"],
+        "to": rel["to"],
+        "label": f"{rel['label']} ({rel['cardinality']})",
+        "title": f"FK: {rel['from']}.{rel['label']} -> {rel['to']}.id",
+        "color": "#888888",
+    }
+    for rel in OLTP_RELATIONSHIPS
+]
+
+# Fixed positions around the loan hub; the diagram is drawn without a
+# physics simulation
+ERD_OLTP_POSITIONS = radial_positions(
+    [node["id"] for node in ERD_OLTP_NODES], center="loan"
+).tolist()
+
+
+def column_markdown(columns: list[str]) -> str:
+    """Format column definitions as markdown, colouring keys."""
+    lines = []
+    for col_def in columns:
+        if "PK" in col_def:
+            lines.append(f":green[{col_def}]")
+        elif "FK" in col_def:
+            lines.append(f":blue[{col_def}]")
+        else:
+            lines.append(col_def)
+    return "\n\n".join(lines)
+
+
+# Column listings for the table details, one markdown element per table
+OLTP_COLUMNS_MARKDOWN = {
+    table_name: column_markdown(table_info["columns"])
+    for table_name, table_info in OLTP_TABLES.items()
+}
+
+
 def render(neo4j=None) -> None:
     """Render the OLTP ERD visualization."""
     st.header("OLTP Schema - Entity Relationship Diagram")
@@ -142,56 +198,39 @@ def render(neo4j=None) -> None:
     - Hover over tables to see column definitions
     """)
 
-    # Legend
+    # Legend: one markdown element per column
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.markdown("**Tooltip Markers:**")
-        st.markdown("- `[PK]` - Primary Key")
-        st.markdown("- `[FK]` - Foreign Key")
+        st.markdown(
+            "**Tooltip Markers:**\n"
+            "- `[PK]` - Primary Key\n"
+            "- `[FK]` - Foreign Key"
+        )
     with col2:
-        st.markdown("**Table Types:**")
-        st.markdown("- Rectangle - Entity tables")
-        st.markdown("- Diamond - Junction tables")
+        st.markdown(
+            "**Table Types:**\n"
+            "- Rectangle - Entity tables\n"
+            "- Diamond - Junction tables"
+        )
     with col3:
-        st.markdown("**Cardinality:**")
-        st.markdown("- N:1 - Many to One")
-        st.markdown("- 1:1 - One to One")
+        st.markdown(
+            "**Cardinality:**\n"
+            "- N:1 - Many to One\n"
+            "- 1:1 - One to One"
+        )
 
     st.divider()
 
-    # Build nodes
-    nodes = []
-    for table_name, table_info in OLTP_TABLES.items():
-        nodes.append({
-            "id": table_name,
-            "label": table_name.upper(),
-            "type": table_name,
-            "title": build_tooltip(table_name, table_info),
-            "size": ERD_OLTP_SIZES.get(table_name, 30),
-        })
-
-    # Build edges
-    edges = []
-    for rel in OLTP_RELATIONSHIPS:
-        edges.append({
-            "from": rel["from"],
-            "to": rel["to"],
-            "label": f"{rel['label']} ({rel['cardinality']})",
-            "title": f"FK: {rel['from']}.{rel['label']} -> {rel['to']}.id",
-            "color": "#888888",
-        })
-
     # Display the interactive graph with ERD styling
-    event = display_interactive_graph(
-        nodes=nodes,
-        edges=edges,
+    event = streamlit_graph(
+        nodes=ERD_OLTP_NODES,
+        edges=ERD_OLTP_EDGES,
+        positions=ERD_OLTP_POSITIONS,
+        smooth_edges=False,
         height=720,
         layout="barnes_hut",
         directed=True,
         key="erd_oltp_network",
-        colors=ERD_OLTP_COLORS,
-        shapes=ERD_OLTP_SHAPES,
-        sizes=ERD_OLTP_SIZES,
     )
 
     # Handle graph events
@@ -203,31 +242,17 @@ def render(neo4j=None) -> None:
                 with st.sidebar:
                     st.markdown(f"### {table_name.upper()}")
                     st.caption(OLTP_TABLES[table_name]["description"])
-                    for col_def in OLTP_TABLES[table_name]["columns"]:
-                        if "PK" in col_def:
-                            st.markdown(f":green[{col_def}]")
-                        elif "FK" in col_def:
-                            st.markdown(f":blue[{col_def}]")
-                        else:
-                            st.markdown(col_def)
+                    st.markdown(OLTP_COLUMNS_MARKDOWN[table_name])
 
     # Table details section
     st.divider()
     st.subheader("Table Details")
 
-    # Show tables in columns
-    col1, col2, col3 = st.columns(3)
-
+    # Show tables in columns, filling them left to right
     table_list = list(OLTP_TABLES.items())
-    for i, (table_name, table_info) in enumerate(table_list):
-        col = [col1, col2, col3][i % 3]
+    for i, col in enumerate(st.columns(3)):
         with col:
-            with st.expander(f"**{table_name.upper()}**"):
-                st.caption(table_info["description"])
-                for col_def in table_info["columns"]:
-                    if "PK" in col_def:
-                        st.markdown(f":green[{col_def}]")
-                    elif "FK" in col_def:
-                        st.markdown(f":blue[{col_def}]")
-                    else:
-                        st.markdown(col_def)
+            for table_name, table_info in table_list[i::3]:
+                with st.expander(f"**{table_name.upper()}**"):
+                    st.caption(table_info["description"])
+                    st.markdown(OLTP_COLUMNS_MARKDOWN[table_name])
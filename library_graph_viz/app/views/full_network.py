@@ -1,23 +1,135 @@
 """Full Library Network View - Shows all node types and relationships."""
 
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
 import streamlit as st
-from etl.neo4j_connector import Neo4jConnector
 from app.components.streamlit_graph import display_interactive_graph, NODE_COLORS
 
+if TYPE_CHECKING:
+    from etl.neo4j_connector import Neo4jConnector
+
 # Define node type categories
 SMALL_TYPES = {"Category": 15, "Staff": 20, "Author": 100}  # Show ALL of these
 LARGE_TYPES = {"Member": 200, "Book": 500, "Loan": 2000, "Fine": 1234}  # Sample from these
 
 
-def get_node_counts(neo4j: Neo4jConnector) -> dict:
-    """Get actual node counts from Neo4j."""
-    query = """
-        MATCH (n)
-        WITH labels(n)[0] AS label, count(*) AS cnt
-        RETURN label, cnt
+# Node sample for the full network. Each branch is switched on or sized by
+# a parameter, and the branches cover disjoint labels, so UNION ALL needs
+# no de-duplication pass. Loan neighbours come from a single one-hop
+# expansion: these four relationship types only ever touch loans
+SAMPLE_NODES_QUERY = """
+    MATCH (l:Loan)
+    WITH l LIMIT $loan_sample
+    OPTIONAL MATCH (l)-[:BORROWED|CONTAINS|PROCESSED_BY|HAS_FINE]-(x)
+    WITH collect(DISTINCT l) + collect(DISTINCT x) AS nodes
+    UNWIND nodes AS n
+    WITH n WHERE n IS NOT NULL AND labels(n)[0] IN $types
+    RETURN DISTINCT id(n) AS neo4j_id, labels(n)[0] AS label,
+        CASE labels(n)[0]
+            WHEN 'Member' THEN n.name
+            WHEN 'Book' THEN n.title
+            WHEN 'Loan' THEN 'Loan #' + toString(n.id)
+            WHEN 'Fine' THEN 'Fine $' + toString(n.amount)
+            WHEN 'Staff' THEN n.name
+        END AS display_name
+    UNION ALL
+    WITH $include_category AS include WHERE include
+    MATCH (n:Category)
+    RETURN id(n) AS neo4j_id, 'Category' AS label, n.name AS display_name
+    UNION ALL
+    WITH $include_author AS include WHERE include
+    MATCH (n:Author)
+    RETURN id(n) AS neo4j_id, 'Author' AS label, n.name AS display_name
+    UNION ALL
+    WITH $include_staff AS include WHERE include
+    MATCH (n:Staff)
+    RETURN id(n) AS neo4j_id, 'Staff' AS label, n.name AS display_name
+    UNION ALL
+    MATCH (n:Member) WITH n LIMIT $member_limit
+    RETURN id(n) AS neo4j_id, 'Member' AS label, n.name AS display_name
+    UNION ALL
+    MATCH (n:Book) WITH n LIMIT $book_limit
+    RETURN id(n) AS neo4j_id, 'Book' AS label, n.title AS display_name
+    UNION ALL
+    MATCH (n:Fine) WITH n LIMIT $fine_limit
+    RETURN id(n) AS neo4j_id, 'Fine' AS label, 'Fine $' + toString(n.amount) AS display_name
+"""
+
+# Node counts for every label from APOC's store counters, in one call
+APOC_COUNT_QUERY = "CALL apoc.meta.stats() YIELD labels RETURN labels"
+
+# Per-label node counts for every type the view knows about, used when APOC
+# is not installed
+NODE_COUNT_QUERY = " UNION ALL ".join(
+    f"MATCH (n:{label}) RETURN '{label}' AS label, count(n) AS cnt"
+    for label in (*SMALL_TYPES, *LARGE_TYPES)
+)
+
+# Edge hover titles are dropped above this many relationships
+EDGE_TITLE_LIMIT = 500
+
+# Colored breakdown bullet per node type, built once at import
+TYPE_MARKERS = {
+    node_type: f'<span style="color: {color};">●</span>'
+    for node_type, color in NODE_COLORS.items()
+}
+DEFAULT_TYPE_MARKER = '<span style="color: #888888;">●</span>'
+
+# Appended to the node sampling query: collects the sampled nodes, already
+# shaped for the graph component (truncated label, type, hover title), the
+# relationships whose endpoints are both in the sample, as parallel source,
+# target and type lists rather than a map per relationship, and the number
+# of sampled nodes per label
+GRAPH_RELATIONSHIPS_QUERY = """
+    WITH collect(neo4j_id) AS node_ids, collect({
+        id: 'n_' + toString(neo4j_id),
+        label: CASE WHEN size(display_name) > 20
+            THEN substring(display_name, 0, 20) + '...'
+            ELSE display_name END,
+        type: label,
+        title: label + ': ' + display_name
+    }) AS nodes
+    CALL {
+        WITH node_ids
+        UNWIND node_ids AS source_id
+        MATCH (a)-[r]->(b)
+        WHERE id(a) = source_id AND id(b) IN node_ids
+        RETURN collect('n_' + toString(id(a))) AS sources,
+            collect('n_' + toString(id(b))) AS targets,
+            collect(type(r)) AS rel_types
+    }
+    CALL {
+        WITH nodes
+        UNWIND nodes AS n
+        WITH n.type AS label, count(*) AS count
+        RETURN collect({label: label, count: count}) AS type_counts
+    }
+    RETURN nodes, sources, targets, rel_types, type_counts
+"""
+
+# Nodes and the relationships between them in one round trip, as a single row
+SAMPLE_GRAPH_QUERY = "CALL {" + SAMPLE_NODES_QUERY + "}" + GRAPH_RELATIONSHIPS_QUERY
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_node_counts(_neo4j: "Neo4jConnector") -> dict:
+    """
+    Get actual node counts from Neo4j (1 minute TTL).
+
+    Reads every label count at once from apoc.meta.stats(). Without APOC,
+    counts one label per UNION branch; a bare count over a single label is
+    also answered from Neo4j's count store instead of scanning every node.
     """
-    result = neo4j.run_query(query)
-    return {r["label"]: r["cnt"] for r in result}
+    from neo4j.exceptions import ClientError
+
+    try:
+        label_counts = _neo4j.run_query(APOC_COUNT_QUERY)[0]["labels"]
+    except ClientError:
+        result = _neo4j.run_query(NODE_COUNT_QUERY)
+        return {r["label"]: r["cnt"] for r in result}
+    return {label: label_counts.get(label, 0) for label in (*SMALL_TYPES, *LARGE_TYPES)}
 
 
 def build_connectivity_query(selected_types: dict, node_limit: int, actual_counts: dict) -> tuple:
@@ -29,9 +141,16 @@ def build_connectivity_query(selected_types: dict, node_limit: int, actual_count
     2. Expand to get connected nodes
     3. Add all small types (Category, Staff, Author)
 
+    The query text is always SAMPLE_GRAPH_QUERY, which fetches the sampled
+    nodes together with their relationships; the selection only changes the
+    parameters, so Neo4j plans it once.
+
     Returns:
         Tuple of (query_string, parameters_dict)
     """
+    if not any(selected_types.values()):
+        return None, None
+
     # Calculate small type totals
     small_total = sum(
         actual_counts.get(t, 0)
@@ -45,87 +164,54 @@ def build_connectivity_query(selected_types: dict, node_limit: int, actual_count
     # Allocate roughly: 40% to loans, 60% to connected entities
     loan_sample = min(actual_counts.get('Loan', 0), max(10, remaining // 3)) if selected_types.get('Loan') else 0
 
-    params = {"loan_sample": loan_sample}
-    query_parts = []
-
-    # Part 1: Sample Loans and their connected nodes (Member, Book, Staff, Fine)
-    if loan_sample > 0:
-        # Get loans and all their connected nodes in one query
-        connected_query = """
-            MATCH (l:Loan)
-            WITH l LIMIT $loan_sample
-            OPTIONAL MATCH (m:Member)-[:BORROWED]->(l)
-            OPTIONAL MATCH (l)-[:CONTAINS]->(b:Book)
-            OPTIONAL MATCH (l)-[:PROCESSED_BY]->(s:Staff)
-            OPTIONAL MATCH (l)-[:HAS_FINE]->(f:Fine)
-            WITH collect(DISTINCT l) + collect(DISTINCT m) + collect(DISTINCT b) + collect(DISTINCT s) + collect(DISTINCT f) AS nodes
-            UNWIND nodes AS n
-            WITH n WHERE n IS NOT NULL
-            RETURN DISTINCT id(n) AS neo4j_id, labels(n)[0] AS label,
-                CASE labels(n)[0]
-                    WHEN 'Member' THEN n.name
-                    WHEN 'Book' THEN n.title
-                    WHEN 'Loan' THEN 'Loan #' + toString(n.id)
-                    WHEN 'Fine' THEN 'Fine $' + toString(n.amount)
-                    WHEN 'Staff' THEN n.name
-                END AS display_name,
-                n AS properties
-        """
-        query_parts.append(connected_query)
-
-    # Part 2: Add ALL small types (Category, Author - Staff already included via loans)
-    if selected_types.get('Category', False):
-        query_parts.append("""
-            MATCH (n:Category)
-            RETURN id(n) AS neo4j_id, 'Category' AS label, n.name AS display_name, n AS properties
-        """)
-
-    if selected_types.get('Author', False):
-        query_parts.append("""
-            MATCH (n:Author)
-            RETURN id(n) AS neo4j_id, 'Author' AS label, n.name AS display_name, n AS properties
-        """)
-
-    # If no loans selected, fall back to independent sampling
-    if loan_sample == 0:
-        if selected_types.get('Staff', False):
-            query_parts.append("""
-                MATCH (n:Staff)
-                RETURN id(n) AS neo4j_id, 'Staff' AS label, n.name AS display_name, n AS properties
-            """)
-
-        if selected_types.get('Member', False):
-            member_limit = min(actual_counts.get('Member', 0), remaining // 4)
-            params["member_limit"] = member_limit
-            query_parts.append("""
-                MATCH (n:Member) WITH n LIMIT $member_limit
-                RETURN id(n) AS neo4j_id, 'Member' AS label, n.name AS display_name, n AS properties
-            """)
-
-        if selected_types.get('Book', False):
-            book_limit = min(actual_counts.get('Book', 0), remaining // 4)
-            params["book_limit"] = book_limit
-            query_parts.append("""
-                MATCH (n:Book) WITH n LIMIT $book_limit
-                RETURN id(n) AS neo4j_id, 'Book' AS label, n.title AS display_name, n AS properties
-            """)
-
-        if selected_types.get('Fine', False):
-            fine_limit = min(actual_counts.get('Fine', 0), remaining // 4)
-            params["fine_limit"] = fine_limit
-            query_parts.append("""
-                MATCH (n:Fine) WITH n LIMIT $fine_limit
-                RETURN id(n) AS neo4j_id, 'Fine' AS label, 'Fine $' + toString(n.amount) AS display_name, n AS properties
-            """)
-
-    if not query_parts:
-        return None, None
+    # Without loans, large types are sampled independently
+    def fallback_limit(node_type: str) -> int:
+        if loan_sample > 0 or not selected_types.get(node_type, False):
+            return 0
+        return min(actual_counts.get(node_type, 0), remaining // 4)
+
+    params = {
+        "loan_sample": loan_sample,
+        "types": sorted(t for t, selected in selected_types.items() if selected),
+        "include_category": bool(selected_types.get("Category")),
+        "include_author": bool(selected_types.get("Author")),
+        "include_staff": loan_sample == 0 and bool(selected_types.get("Staff")),
+        "member_limit": fallback_limit("Member"),
+        "book_limit": fallback_limit("Book"),
+        "fine_limit": fallback_limit("Fine"),
+    }
+
+    return SAMPLE_GRAPH_QUERY, params
+
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _fetch_graph(
+    _neo4j: "Neo4jConnector", graph_query: str, params: tuple[tuple[str, Any], ...]
+) -> tuple[list[dict], tuple[list[str], list[str], list[str]], Counter]:
+    """
+    Fetch the sampled nodes and the relationships between them (5 minute TTL).
+
+    Results are keyed on the query text and parameters, so returning to a
+    slider position or node type selection seen before skips Neo4j. At most
+    32 samples are kept, as each slider step produces a new key.
+
+    Args:
+        _neo4j: Neo4j connector instance (not part of the cache key).
+        graph_query: Query from build_connectivity_query.
+        params: Query parameters as (name, value) pairs.
+
+    Returns:
+        Tuple of (graph nodes, (source ids, target ids, relationship types)
+        for the relationships, node count per label).
+    """
+    result = _neo4j.run_query(graph_query, dict(params))[0]
 
-    full_query = " UNION ".join(query_parts)
-    return full_query, params
+    type_counts = Counter({r["label"]: r["count"] for r in result["type_counts"]})
+    rels = (result["sources"], result["targets"], result["rel_types"])
+    return result["nodes"], rels, type_counts
 
 
-def render(neo4j: Neo4jConnector) -> None:
+def render(neo4j: "Neo4jConnector") -> None:
     """
     Render the full library network view.
 
@@ -143,68 +229,26 @@ def render(neo4j: Neo4jConnector) -> None:
     except Exception:
         actual_counts = {**SMALL_TYPES, **LARGE_TYPES}  # Use defaults if query fails
 
-    # Node Type Selection
+    # Node Type Selection, as one editable table rather than a checkbox per
+    # type: a single widget and a single state diff per interaction
     st.markdown("**Select Node Types to Display:**")
 
-    col1, col2, col3, col4 = st.columns(4)
-
-    # Small types (first row) - always show all when selected
-    with col1:
-        show_category = st.checkbox(
-            f"Categories ({actual_counts.get('Category', 0)})",
-            value=True,
-            help="Show ALL categories"
-        )
-    with col2:
-        show_staff = st.checkbox(
-            f"Staff ({actual_counts.get('Staff', 0)})",
-            value=True,
-            help="Show ALL staff members"
-        )
-    with col3:
-        show_author = st.checkbox(
-            f"Authors ({actual_counts.get('Author', 0)})",
-            value=True,
-            help="Show ALL authors"
-        )
-    with col4:
-        show_member = st.checkbox(
-            f"Members ({actual_counts.get('Member', 0)})",
-            value=True,
-            help="Sample from members"
-        )
-
-    col5, col6, col7, col8 = st.columns(4)
-
-    # Large types (second row) - sampled
-    with col5:
-        show_book = st.checkbox(
-            f"Books ({actual_counts.get('Book', 0)})",
-            value=True,
-            help="Sample from books"
-        )
-    with col6:
-        show_loan = st.checkbox(
-            f"Loans ({actual_counts.get('Loan', 0)})",
-            value=True,
-            help="Sample from loans"
-        )
-    with col7:
-        show_fine = st.checkbox(
-            f"Fines ({actual_counts.get('Fine', 0)})",
-            value=True,
-            help="Sample from fines"
-        )
-
-    selected_types = {
-        "Category": show_category,
-        "Staff": show_staff,
-        "Author": show_author,
-        "Member": show_member,
-        "Book": show_book,
-        "Loan": show_loan,
-        "Fine": show_fine,
-    }
+    node_types = [*SMALL_TYPES, *LARGE_TYPES]
+    type_table = pd.DataFrame({
+        "Type": node_types,
+        "Count": [actual_counts.get(t, 0) for t in node_types],
+        "Shown": ["All" if t in SMALL_TYPES else "Sampled" for t in node_types],
+        # Fines are off by default: they are leaves hanging off loans and
+        # mostly add clutter to the physics simulation
+        "Show": [t != "Fine" for t in node_types],
+    })
+    edited_types = st.data_editor(
+        type_table,
+        disabled=["Type", "Count", "Shown"],
+        hide_index=True,
+        key="full_network_types",
+    )
+    selected_types = dict(zip(edited_types["Type"], edited_types["Show"].astype(bool)))
 
     st.markdown("---")
 
@@ -223,7 +267,7 @@ def render(neo4j: Neo4jConnector) -> None:
         node_limit = st.slider(
             "Max Nodes to Display",
             min_value=min_nodes,
-            max_value=500,
+            max_value=1000,
             value=max(200, min_nodes),
             step=25,
             help=f"Small types ({small_selected} nodes) are always shown completely. Remaining slots are distributed to large types.",
@@ -232,8 +276,8 @@ def render(neo4j: Neo4jConnector) -> None:
     with col2:
         layout = st.selectbox(
             "Physics Layout",
-            ["barnes_hut", "force_atlas"],
-            help="Choose the graph layout algorithm",
+            ["force_atlas", "barnes_hut"],
+            help="Choose the graph layout algorithm. Force Atlas settles faster on large samples.",
         )
 
     with col3:
@@ -247,58 +291,39 @@ def render(neo4j: Neo4jConnector) -> None:
     # Query Neo4j for nodes and relationships
     try:
         # Build connectivity-aware query to ensure relationships are visible
-        nodes_query, params = build_connectivity_query(selected_types, node_limit, actual_counts)
+        graph_query, params = build_connectivity_query(selected_types, node_limit, actual_counts)
 
-        if nodes_query is None:
+        if graph_query is None:
             st.warning("No node types selected for display.")
             return
 
-        nodes_result = neo4j.run_query(nodes_query, params)
-
-        # Get relationships between the fetched nodes
-        node_ids = [n["neo4j_id"] for n in nodes_result]
-
-        rels_query = """
-            MATCH (a)-[r]->(b)
-            WHERE id(a) IN $node_ids AND id(b) IN $node_ids
-            RETURN id(a) AS source, id(b) AS target, type(r) AS rel_type
-        """
-        rels_result = neo4j.run_query(rels_query, {"node_ids": node_ids})
-
-        # Build the graph
-        nodes = [
-            {
-                "id": f"n_{n['neo4j_id']}",
-                "label": n["display_name"][:20] + "..." if len(n["display_name"]) > 20 else n["display_name"],
-                "type": n["label"],
-                "title": f"{n['label']}: {n['display_name']}",
-            }
-            for n in nodes_result
-        ]
-
-        edges = [
-            {
-                "from": f"n_{r['source']}",
-                "to": f"n_{r['target']}",
-                "label": r["rel_type"] if show_labels else "",
-                "title": r["rel_type"],
-            }
-            for r in rels_result
-        ]
+        # Layout and label changes reuse the cached fetch; nodes arrive
+        # labelled, typed and titled from the query
+        nodes, (sources, targets, rel_types), type_counts = _fetch_graph(
+            neo4j, graph_query, tuple(sorted(params.items()))
+        )
+
+        # Only send the keys that will be drawn: no label unless labels are
+        # shown, and no hover titles on very dense graphs
+        edge_titles = len(rel_types) <= EDGE_TITLE_LIMIT
+        edges = []
+        for source, target, rel_type in zip(sources, targets, rel_types):
+            edge = {"from": source, "to": target}
+            if show_labels:
+                edge["label"] = rel_type
+            if edge_titles:
+                edge["title"] = rel_type
+            edges.append(edge)
 
         # Display statistics
         col1, col2, col3, col4 = st.columns(4)
         col1.metric("Nodes Displayed", len(nodes))
         col2.metric("Relationships", len(edges))
 
-        # Count by type
-        type_counts = {}
-        for n in nodes:
-            t = n["type"]
-            type_counts[t] = type_counts.get(t, 0) + 1
-
+        # Counts by type come precomputed from the query
+        most_common = type_counts.most_common()
         col3.metric("Node Types", len(type_counts))
-        col4.metric("Most Common", max(type_counts, key=type_counts.get) if type_counts else "N/A")
+        col4.metric("Most Common", most_common[0][0] if most_common else "N/A")
 
         # Display the interactive graph
         event = display_interactive_graph(
@@ -320,13 +345,14 @@ def render(neo4j: Neo4jConnector) -> None:
 
         # Show breakdown
         with st.expander("📊 Node Type Breakdown"):
-            for node_type, color in NODE_COLORS.items():
-                count = type_counts.get(node_type, 0)
-                if count > 0:
-                    st.markdown(
-                        f'<span style="color: {color};">●</span> **{node_type}**: {count}',
-                        unsafe_allow_html=True,
-                    )
+            # Only types present in the sample, sent as one markdown element
+            st.markdown(
+                "<br>".join(
+                    f"{TYPE_MARKERS.get(node_type, DEFAULT_TYPE_MARKER)} **{node_type}**: {count}"
+                    for node_type, count in most_common
+                ),
+                unsafe_allow_html=True,
+            )
 
     except Exception as e:
         st.error(f"Error loading graph: {e}")
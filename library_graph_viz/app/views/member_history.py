@@ -1,9 +1,120 @@
-"""Member Borrowing History View - Shows member loan chains."""
+"""
+Member Borrowing History View - Shows member loan chains.
+
+Lookups seek the Member(id) and Book(id) indexes that back the uniqueness
+constraints created by LibraryETL.create_constraints.
+"""
 
 import streamlit as st
 import pandas as pd
 from etl.neo4j_connector import Neo4jConnector
-from app.components.streamlit_graph import display_interactive_graph
+from app.components.streamlit_graph import display_interactive_graph, short_label
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_members(_neo4j: Neo4jConnector) -> list[dict]:
+    """Fetch every member's id and name, ordered by name (5 minute TTL)."""
+    members_query = """
+        MATCH (m:Member)
+        RETURN m.id AS id, m.name AS name
+        ORDER BY m.name
+    """
+    return _neo4j.run_query(members_query)
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def _fetch_history(
+    _neo4j: Neo4jConnector, member_id: int, include_authors: bool, show_returned: bool
+) -> tuple[list[dict], dict[int, list[dict]]]:
+    """
+    Fetch a member's loans and the authors of the borrowed books (5 minute TTL).
+
+    Results are keyed on the member and filters, so re-selecting a member
+    viewed before skips Neo4j.
+
+    Args:
+        _neo4j: Neo4j connector instance (not part of the cache key).
+        member_id: Member to fetch loans for.
+        include_authors: Whether to fetch authors of the borrowed books.
+        show_returned: Whether to keep only returned loans.
+
+    Returns:
+        Tuple of (loan rows, newest first; author rows per book id).
+    """
+    query = """
+        MATCH (m:Member {id: $member_id})-[:BORROWED]->(l:Loan)-[:CONTAINS]->(b:Book)
+        USING INDEX m:Member(id)
+        WHERE ($show_returned = false OR l.return_date IS NOT NULL)
+        RETURN
+            m.id AS member_id,
+            m.name AS member_name,
+            m.email AS member_email,
+            l.id AS loan_id,
+            l.loan_date AS loan_date,
+            l.due_date AS due_date,
+            l.return_date AS return_date,
+            b.id AS book_id,
+            b.title AS book_title
+        ORDER BY l.loan_date DESC
+    """
+    results = _neo4j.run_query(
+        query,
+        {"member_id": member_id, "show_returned": show_returned}
+    )
+
+    # Authors for all borrowed books in one batch, rather than an
+    # OPTIONAL MATCH repeating every loan row once per author. Co-authors
+    # are collected server-side, so each book is a single row
+    authors_by_book: dict[int, list[dict]] = {}
+    if include_authors and results:
+        authors_query = """
+            MATCH (a:Author)-[:WROTE]->(b:Book)
+            USING INDEX b:Book(id)
+            WHERE b.id IN $book_ids
+            RETURN b.id AS book_id,
+                collect({author_id: a.id, author_name: a.name}) AS authors
+        """
+        author_rows = _neo4j.run_query(
+            authors_query,
+            {"book_ids": list({r["book_id"] for r in results})}
+        )
+        authors_by_book = {r["book_id"]: r["authors"] for r in author_rows}
+
+    return results, authors_by_book
+
+
+def _date_column(results: list[dict], field: str) -> pd.DatetimeIndex:
+    """Parse one date field of the loan rows, converting Neo4j dates to native ones."""
+    return pd.to_datetime(
+        [d.to_native() if hasattr(d, "to_native") else d for d in (r[field] for r in results)],
+        errors="coerce",
+    )
+
+
+def _history_table(results: list[dict], authors_by_book: dict[int, list[dict]]) -> pd.DataFrame:
+    """
+    Build the loan history table from the fetched loan rows.
+
+    Built column by column from the rows, with dates parsed once per column
+    and repeated titles and authors stored as categories.
+
+    Args:
+        results: Loan rows from _fetch_history.
+        authors_by_book: Author rows per book id from _fetch_history.
+
+    Returns:
+        DataFrame with one row per loan row.
+    """
+    return pd.DataFrame({
+        "Loan Date": _date_column(results, "loan_date"),
+        "Due Date": _date_column(results, "due_date"),
+        "Return Date": _date_column(results, "return_date"),
+        "Book": pd.Categorical([r["book_title"] for r in results]),
+        "Author": pd.Categorical([
+            ", ".join(a["author_name"] for a in authors_by_book.get(r["book_id"], []))
+            for r in results
+        ]),
+    })
 
 
 def render(neo4j: Neo4jConnector) -> None:
@@ -18,12 +129,7 @@ def render(neo4j: Neo4jConnector) -> None:
 
     try:
         # Get list of members for dropdown
-        members_query = """
-            MATCH (m:Member)
-            RETURN m.id AS id, m.name AS name
-            ORDER BY m.name
-        """
-        members = neo4j.run_query(members_query)
+        members = _fetch_members(neo4j)
 
         if not members:
             st.warning("No members found in the database.")
@@ -46,82 +152,48 @@ def render(neo4j: Neo4jConnector) -> None:
             show_returned_only = st.checkbox("Show Only Returned Books", value=False)
 
         # Query for member's borrowing history
-        if include_authors:
-            query = """
-                MATCH (m:Member {id: $member_id})-[:BORROWED]->(l:Loan)-[:CONTAINS]->(b:Book)
-                OPTIONAL MATCH (b)<-[:WROTE]-(a:Author)
-                WHERE ($show_returned = false OR l.return_date IS NOT NULL)
-                RETURN
-                    m.id AS member_id,
-                    m.name AS member_name,
-                    m.email AS member_email,
-                    l.id AS loan_id,
-                    l.loan_date AS loan_date,
-                    l.due_date AS due_date,
-                    l.return_date AS return_date,
-                    b.id AS book_id,
-                    b.title AS book_title,
-                    a.id AS author_id,
-                    a.name AS author_name
-                ORDER BY l.loan_date DESC
-            """
-        else:
-            query = """
-                MATCH (m:Member {id: $member_id})-[:BORROWED]->(l:Loan)-[:CONTAINS]->(b:Book)
-                WHERE ($show_returned = false OR l.return_date IS NOT NULL)
-                RETURN
-                    m.id AS member_id,
-                    m.name AS member_name,
-                    m.email AS member_email,
-                    l.id AS loan_id,
-                    l.loan_date AS loan_date,
-                    l.due_date AS due_date,
-                    l.return_date AS return_date,
-                    b.id AS book_id,
-                    b.title AS book_title,
-                    null AS author_id,
-                    null AS author_name
-                ORDER BY l.loan_date DESC
-            """
-
-        results = neo4j.run_query(
-            query,
-            {"member_id": member_id, "show_returned": show_returned_only}
+        results, authors_by_book = _fetch_history(
+            neo4j, member_id, include_authors, show_returned_only
         )
 
         if not results:
             st.info(f"No borrowing history found for this member.")
             return
 
-        # Build graph nodes and edges
-        nodes = []
+        # Build graph nodes and edges. Nodes are keyed by raw id, one dict
+        # per entity kind, so de-duplication checks hash ints rather than
+        # prefixed id strings
+        loan_nodes: dict[int, dict] = {}
+        book_nodes: dict[int, dict] = {}
+        author_nodes: dict[int, dict] = {}
+        seen_contains: set[tuple[int, int]] = set()
         edges = []
-        seen_nodes = set()
 
         # Add member node
         member_node_id = f"member_{member_id}"
-        if member_node_id not in seen_nodes:
-            nodes.append({
-                "id": member_node_id,
-                "label": results[0]["member_name"],
-                "type": "Member",
-                "title": f"Member: {results[0]['member_name']}\nEmail: {results[0]['member_email']}",
-                "size": 40,
-            })
-            seen_nodes.add(member_node_id)
+        member_node = {
+            "id": member_node_id,
+            "label": results[0]["member_name"],
+            "type": "Member",
+            "title": f"Member: {results[0]['member_name']}\nEmail: {results[0]['member_email']}",
+            "size": 40,
+        }
 
         for r in results:
+            loan_id = r["loan_id"]
+            book_id = r["book_id"]
+            loan_node_id = f"loan_{loan_id}"
+            book_node_id = f"book_{book_id}"
+
             # Loan node
-            loan_node_id = f"loan_{r['loan_id']}"
-            if loan_node_id not in seen_nodes:
+            if loan_id not in loan_nodes:
                 status = "Returned" if r["return_date"] else "Active"
-                nodes.append({
+                loan_nodes[loan_id] = {
                     "id": loan_node_id,
-                    "label": f"Loan #{r['loan_id']}",
+                    "label": f"Loan #{loan_id}",
                     "type": "Loan",
-                    "title": f"Loan #{r['loan_id']}\nDate: {r['loan_date']}\nDue: {r['due_date']}\nReturned: {r['return_date'] or 'Not yet'}\nStatus: {status}",
-                })
-                seen_nodes.add(loan_node_id)
+                    "title": f"Loan #{loan_id}\nDate: {r['loan_date']}\nDue: {r['due_date']}\nReturned: {r['return_date'] or 'Not yet'}\nStatus: {status}",
+                }
 
                 # Member -> Loan edge
                 edges.append({
@@ -131,50 +203,50 @@ def render(neo4j: Neo4jConnector) -> None:
                     "title": f"Borrowed on {r['loan_date']}",
                 })
 
-            # Book node
-            book_node_id = f"book_{r['book_id']}"
-            if book_node_id not in seen_nodes:
-                nodes.append({
+            # Book node, with its authors the first time the book is seen
+            if book_id not in book_nodes:
+                book_nodes[book_id] = {
                     "id": book_node_id,
-                    "label": r["book_title"][:20] + "..." if len(r["book_title"]) > 20 else r["book_title"],
+                    "label": short_label(r["book_title"]),
                     "type": "Book",
                     "title": f"Book: {r['book_title']}",
-                })
-                seen_nodes.add(book_node_id)
+                }
+
+                for a in authors_by_book.get(book_id, []):
+                    author_id = a["author_id"]
+                    author_node_id = f"author_{author_id}"
+                    if author_id not in author_nodes:
+                        author_nodes[author_id] = {
+                            "id": author_node_id,
+                            "label": a["author_name"],
+                            "type": "Author",
+                            "title": f"Author: {a['author_name']}",
+                        }
+
+                    # Author -> Book edge
+                    edges.append({
+                        "from": author_node_id,
+                        "to": book_node_id,
+                        "label": "WROTE",
+                        "title": "WROTE",
+                    })
 
             # Loan -> Book edge
-            edge_id = f"{loan_node_id}_{book_node_id}"
-            if edge_id not in seen_nodes:
+            if (loan_id, book_id) not in seen_contains:
+                seen_contains.add((loan_id, book_id))
                 edges.append({
                     "from": loan_node_id,
                     "to": book_node_id,
                     "label": "CONTAINS",
                     "title": "CONTAINS",
                 })
-                seen_nodes.add(edge_id)
-
-            # Author node and edge
-            if include_authors and r["author_id"]:
-                author_node_id = f"author_{r['author_id']}"
-                if author_node_id not in seen_nodes:
-                    nodes.append({
-                        "id": author_node_id,
-                        "label": r["author_name"],
-                        "type": "Author",
-                        "title": f"Author: {r['author_name']}",
-                    })
-                    seen_nodes.add(author_node_id)
 
-                # Author -> Book edge
-                author_edge_id = f"{author_node_id}_{book_node_id}"
-                if author_edge_id not in seen_nodes:
-                    edges.append({
-                        "from": author_node_id,
-                        "to": book_node_id,
-                        "label": "WROTE",
-                        "title": "WROTE",
-                    })
-                    seen_nodes.add(author_edge_id)
+        nodes = [
+            member_node,
+            *loan_nodes.values(),
+            *book_nodes.values(),
+            *author_nodes.values(),
+        ]
 
         # Statistics
         unique_books = len(set(r["book_id"] for r in results))
@@ -185,7 +257,9 @@ def render(neo4j: Neo4jConnector) -> None:
         col2.metric("Unique Books", unique_books)
         col3.metric("Active Loans", active_loans)
         if include_authors:
-            unique_authors = len(set(r["author_id"] for r in results if r["author_id"]))
+            unique_authors = len(set(
+                a["author_id"] for authors in authors_by_book.values() for a in authors
+            ))
             col4.metric("Authors Read", unique_authors)
 
         # Display the interactive graph
@@ -208,10 +282,7 @@ def render(neo4j: Neo4jConnector) -> None:
 
         # Data table
         with st.expander("📋 Loan History Table"):
-            df = pd.DataFrame(results)
-            df = df[["loan_date", "due_date", "return_date", "book_title", "author_name"]]
-            df.columns = ["Loan Date", "Due Date", "Return Date", "Book", "Author"]
-            st.dataframe(df, width="stretch")
+            st.dataframe(_history_table(results, authors_by_book), width="stretch")
 
     except Exception as e:
         st.error(f"Error loading data: {e}")
@@ -3,7 +3,7 @@
 import streamlit as st
 import pandas as pd
 from etl.neo4j_connector import Neo4jConnector
-from app.components.streamlit_graph import display_interactive_graph
+from app.components.streamlit_graph import display_interactive_graph, short_label
 
 
 def render(neo4j: Neo4jConnector) -> None:
@@ -54,9 +54,8 @@ def render(neo4j: Neo4jConnector) -> None:
             )
 
         # Build graph
-        nodes = []
+        nodes_by_id: dict[str, dict] = {}
         edges = []
-        seen_nodes = set()
 
         # Calculate max loan count for scaling
         max_loans = max(r["loan_count"] for r in results) if results else 1
@@ -64,34 +63,32 @@ def render(neo4j: Neo4jConnector) -> None:
         for r in results:
             # Staff node
             staff_node_id = f"staff_{r['staff_id']}"
-            if staff_node_id not in seen_nodes:
+            if staff_node_id not in nodes_by_id:
                 # Scale size based on loan count
                 if scale_nodes:
                     size = 20 + (r["loan_count"] / max_loans) * 40
                 else:
                     size = 30
 
-                nodes.append({
+                nodes_by_id[staff_node_id] = {
                     "id": staff_node_id,
                     "label": f"{r['staff_name']}\n({r['loan_count']} loans)",
                     "type": "Staff",
                     "title": f"Staff: {r['staff_name']}\nRole: {r['staff_role']}\nEmail: {r['staff_email']}\nHired: {r['hire_date']}\nLoans Processed: {r['loan_count']}",
                     "size": size,
-                })
-                seen_nodes.add(staff_node_id)
+                }
 
             # Sample book nodes
             for i, book_title in enumerate(r["sample_books"][:max_books_display]):
                 book_node_id = f"book_{staff_node_id}_{i}"
-                if book_node_id not in seen_nodes:
-                    nodes.append({
+                if book_node_id not in nodes_by_id:
+                    nodes_by_id[book_node_id] = {
                         "id": book_node_id,
-                        "label": book_title[:20] + "..." if len(book_title) > 20 else book_title,
+                        "label": short_label(book_title),
                         "type": "Book",
                         "title": f"Book: {book_title}",
                         "size": 15,
-                    })
-                    seen_nodes.add(book_node_id)
+                    }
 
                     # Staff -> Book edge (through loans)
                     edges.append({
@@ -101,6 +98,8 @@ def render(neo4j: Neo4jConnector) -> None:
                         "title": "Processed loan for this book",
                     })
 
+        nodes = list(nodes_by_id.values())
+
         # Statistics
         total_loans = sum(r["loan_count"] for r in results)
         avg_loans = total_loans / len(results) if results else 0
@@ -23,11 +23,14 @@ class Settings(BaseSettings):
     mysql_olap_database: str = "library_olap"
     mysql_user: str = "root"
     mysql_password: str = "librarypass123"
+    mysql_pool_size: int = 5
 
     # Neo4j Configuration
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = "librarypass123"
+    neo4j_max_connection_pool_size: int = 50
+    neo4j_connection_acquisition_timeout: float = 30.0
 
     # Application Settings
     debug: bool = False
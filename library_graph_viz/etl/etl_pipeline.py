@@ -16,6 +16,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Secondary indexes for properties the app views sort and filter on.
+# Node ids are already indexed by their uniqueness constraints.
+VIEW_INDEXES = [
+    ("Book", "title"),
+    ("Member", "name"),
+    ("Author", "name"),
+    ("Category", "name"),
+    ("Loan", "due_date"),
+]
+
 
 class LibraryETL:
     """
@@ -59,6 +69,12 @@ class LibraryETL:
         for label, prop in constraints:
             self.neo4j.create_constraint(label, prop)
 
+    def create_indexes(self) -> None:
+        """Create range indexes backing the app's view queries."""
+        logger.info("Creating indexes...")
+        for label, prop in VIEW_INDEXES:
+            self.neo4j.create_index(label, prop)
+
     def load_members(self) -> int:
         """Load member nodes from MySQL to Neo4j."""
         logger.info("Loading members...")
@@ -305,8 +321,9 @@ class LibraryETL:
         if clear_first:
             self.clear_graph()
 
-        # Create constraints
+        # Create constraints and indexes
         self.create_constraints()
+        self.create_indexes()
 
         # Load nodes
         counts["members"] = self.load_members()
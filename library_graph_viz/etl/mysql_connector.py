@@ -20,6 +20,8 @@ class MySQLConnector:
     MySQL database connector with connection pooling and context manager support.
 
     Supports both OLTP (library) and OLAP (library_olap) databases.
+    Pools are shared per process, so short-lived connectors borrow an
+    already-open connection instead of reconnecting.
 
     Usage:
         # OLTP database (default)
@@ -95,7 +97,7 @@ class MySQLConnector:
 
             cls._pools[pool_key] = pooling.MySQLConnectionPool(
                 pool_name=pool_key,
-                pool_size=5,
+                pool_size=settings.mysql_pool_size,
                 pool_reset_session=True,
                 host=settings.mysql_host,
                 port=settings.mysql_port,
@@ -266,6 +268,35 @@ class MySQLConnector:
         result = self.execute_query(query)
         return result[0]["count"] if result else 0
 
+    def get_table_counts(self, table_names: list[str]) -> dict[str, int]:
+        """
+        Get row counts for several tables in a single query.
+
+        Args:
+            table_names: Names of the tables.
+
+        Returns:
+            Dictionary mapping table name to row count.
+        """
+        allowed_tables = (
+            self.OLAP_TABLES if self.database == "olap" else self.OLTP_TABLES
+        )
+
+        for table_name in table_names:
+            if table_name not in allowed_tables:
+                raise ValueError(
+                    f"Invalid table name for {self.database} database: {table_name}"
+                )
+
+        if not table_names:
+            return {}
+
+        query = " UNION ALL ".join(
+            f"SELECT '{table_name}' AS table_name, COUNT(*) AS count FROM {table_name}"
+            for table_name in table_names
+        )
+        return {row["table_name"]: row["count"] for row in self.execute_query(query)}
+
     def begin_transaction(self) -> None:
         """
         Start a new database transaction.
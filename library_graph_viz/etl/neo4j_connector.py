@@ -1,24 +1,36 @@
 """Neo4j database connector with context manager support."""
 
 import logging
-from typing import Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional
 
 from neo4j import GraphDatabase, Driver, Session, Result
 
 from config.settings import Settings, get_settings
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
 class Neo4jConnector:
     """
-    Neo4j database connector with driver lifecycle management.
+    Neo4j database connector with a shared, pooled driver.
+
+    Drivers are created once per URI and credentials and shared by every
+    connector, so their Bolt connection pool survives across contexts.
+    Only close_drivers closes them.
 
     Usage:
         with Neo4jConnector() as db:
             results = db.run_query("MATCH (n) RETURN n LIMIT 10")
     """
 
+    _drivers: dict[tuple[str, str, str], Driver] = {}
+    _drivers_lock = threading.Lock()
+
     def __init__(self, settings: Optional[Settings] = None):
         """
         Initialize Neo4j connector.
@@ -29,26 +41,51 @@ class Neo4jConnector:
         self.settings = settings or get_settings()
         self._driver: Optional[Driver] = None
 
+    @classmethod
+    def _get_driver(cls, settings: Settings) -> Driver:
+        """Get or create the pooled driver for the configured server."""
+        # The password is part of the key so changed credentials get a new driver
+        driver_key = (settings.neo4j_uri, settings.neo4j_user, settings.neo4j_password)
+
+        with cls._drivers_lock:
+            if driver_key not in cls._drivers:
+                cls._drivers[driver_key] = GraphDatabase.driver(
+                    settings.neo4j_uri,
+                    auth=(settings.neo4j_user, settings.neo4j_password),
+                    max_connection_pool_size=settings.neo4j_max_connection_pool_size,
+                    connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
+                )
+            return cls._drivers[driver_key]
+
+    @classmethod
+    def close_drivers(cls) -> None:
+        """Close every shared driver and its connection pool."""
+        with cls._drivers_lock:
+            drivers = list(cls._drivers.values())
+            cls._drivers.clear()
+        for driver in drivers:
+            driver.close()
+        logger.debug("Neo4j drivers closed")
+
     def __enter__(self) -> "Neo4jConnector":
-        """Enter context manager and create driver."""
+        """Enter context manager and acquire the shared driver."""
         try:
-            self._driver = GraphDatabase.driver(
-                self.settings.neo4j_uri,
-                auth=(self.settings.neo4j_user, self.settings.neo4j_password),
-            )
+            self._driver = self._get_driver(self.settings)
             # Verify connectivity
             self._driver.verify_connectivity()
             logger.debug("Neo4j connection established")
             return self
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}")
+            # The driver is shared with other connectors, so it stays open;
+            # its pool reconnects once the server is reachable again
+            self._driver = None
             raise ConnectionError(f"Neo4j connection failed: {e}") from e
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit context manager and close driver."""
-        if self._driver:
-            self._driver.close()
-        logger.debug("Neo4j connection closed")
+        """Exit context manager; the shared driver stays open for reuse."""
+        self._driver = None
+        logger.debug("Neo4j connection released")
 
     @property
     def driver(self) -> Driver:
@@ -74,6 +111,51 @@ class Neo4jConnector:
             result = session.run(query, params or {})
             return [record.data() for record in result]
 
+    def run_query_values(
+        self, query: str, params: Optional[dict] = None
+    ) -> "pd.DataFrame":
+        """
+        Execute a Cypher query and return results as a DataFrame.
+
+        Rows are read as value lists rather than one dict per record,
+        which avoids an intermediate object per row on large results.
+
+        Args:
+            query: Cypher query string.
+            params: Query parameters.
+
+        Returns:
+            DataFrame with one column per returned key.
+        """
+        import pandas as pd
+
+        with self.driver.session() as session:
+            result = session.run(query, params or {})
+            columns = result.keys()
+            return pd.DataFrame(result.values(), columns=columns)
+
+    def run_queries(
+        self, queries: list[tuple[str, Optional[dict]]]
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Execute independent read queries concurrently.
+
+        Each query runs in its own session on the shared connection pool,
+        so the total latency is that of the slowest query rather than the
+        sum of all of them.
+
+        Args:
+            queries: List of (query, params) tuples.
+
+        Returns:
+            List of result lists, in the same order as the queries.
+        """
+        if len(queries) <= 1:
+            return [self.run_query(query, params) for query, params in queries]
+
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            return list(executor.map(lambda q: self.run_query(*q), queries))
+
     def run_transaction(
         self, queries: list[tuple[str, Optional[dict]]]
     ) -> list[list[dict[str, Any]]]:
@@ -181,15 +263,16 @@ class Neo4jConnector:
         Returns:
             Dictionary with node and relationship counts by type.
         """
-        node_counts = self.run_query("""
-            MATCH (n)
-            RETURN labels(n)[0] AS label, count(*) AS count
-        """)
-
-        rel_counts = self.run_query("""
-            MATCH ()-[r]->()
-            RETURN type(r) AS type, count(*) AS count
-        """)
+        node_counts, rel_counts = self.run_queries([
+            ("""
+                MATCH (n)
+                RETURN labels(n)[0] AS label, count(*) AS count
+            """, None),
+            ("""
+                MATCH ()-[r]->()
+                RETURN type(r) AS type, count(*) AS count
+            """, None),
+        ])
 
         stats = {
             "nodes": {row["label"]: row["count"] for row in node_counts},
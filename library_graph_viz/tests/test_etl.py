@@ -49,6 +49,43 @@ class TestMySQLConnector:
             with pytest.raises(ValueError, match="Invalid table name"):
                 connector.fetch_table("invalid_table")
 
+    def test_pool_shared_between_connectors(self, mock_settings):
+        """Test that connectors for the same database borrow from one pool."""
+        from etl.mysql_connector import MySQLConnector
+
+        with patch("etl.mysql_connector.pooling.MySQLConnectionPool") as pool_factory:
+            MySQLConnector.reset_pools()
+
+            first = MySQLConnector._get_pool(mock_settings, "oltp")
+            second = MySQLConnector._get_pool(mock_settings, "oltp")
+
+            pool_factory.assert_called_once()
+            assert pool_factory.call_args.kwargs["pool_size"] == mock_settings.mysql_pool_size
+            assert first is second
+
+            MySQLConnector.reset_pools()
+
+    def test_get_table_counts_single_query(self):
+        """Test that table counts are fetched with one UNION ALL query."""
+        from etl.mysql_connector import MySQLConnector
+
+        with patch("etl.mysql_connector.MySQLConnector._get_pool"):
+            connector = MySQLConnector()
+            connector._cursor = Mock()
+            connector._cursor.fetchall.return_value = [
+                {"table_name": "member", "count": 3},
+                {"table_name": "book", "count": 5},
+            ]
+
+            counts = connector.get_table_counts(["member", "book"])
+
+            assert counts == {"member": 3, "book": 5}
+            connector._cursor.execute.assert_called_once()
+            assert "UNION ALL" in connector._cursor.execute.call_args.args[0]
+
+            with pytest.raises(ValueError, match="Invalid table name"):
+                connector.get_table_counts(["member", "invalid_table"])
+
 
 class TestNeo4jConnector:
     """Tests for Neo4j connector."""
@@ -71,6 +108,100 @@ class TestNeo4jConnector:
         assert stats["total_relationships"] == 45
         assert "Book" in stats["nodes"]
 
+    def test_run_queries_preserves_order(self, mock_settings):
+        """Test that concurrent queries return results in request order."""
+        from etl.neo4j_connector import Neo4jConnector
+
+        connector = Neo4jConnector(mock_settings)
+        with patch.object(
+            Neo4jConnector, "run_query", side_effect=lambda query, params=None: [{"q": query}]
+        ):
+            results = connector.run_queries([("A", None), ("B", {"x": 1}), ("C", None)])
+
+        assert results == [[{"q": "A"}], [{"q": "B"}], [{"q": "C"}]]
+
+    def test_run_query_values_returns_dataframe(self, mock_settings):
+        """Test that value rows are assembled into a DataFrame."""
+        from etl.neo4j_connector import Neo4jConnector
+
+        connector = Neo4jConnector(mock_settings)
+        connector._driver = MagicMock()
+        result = connector._driver.session.return_value.__enter__.return_value.run.return_value
+        result.keys.return_value = ["id", "title"]
+        result.values.return_value = [[1, "Dune"], [2, "Emma"]]
+
+        df = connector.run_query_values("MATCH (b:Book) RETURN b.id AS id, b.title AS title")
+
+        assert list(df.columns) == ["id", "title"]
+        assert df["title"].tolist() == ["Dune", "Emma"]
+
+    def test_get_statistics_totals(self, mock_settings):
+        """Test that statistics combine node and relationship counts."""
+        from etl.neo4j_connector import Neo4jConnector
+
+        connector = Neo4jConnector(mock_settings)
+        with patch.object(
+            Neo4jConnector,
+            "run_queries",
+            return_value=[
+                [{"label": "Book", "count": 3}, {"label": "Author", "count": 2}],
+                [{"type": "WROTE", "count": 4}],
+            ],
+        ):
+            stats = connector.get_statistics()
+
+        assert stats["total_nodes"] == 5
+        assert stats["relationships"] == {"WROTE": 4}
+
+    def test_driver_shared_between_connectors(self, mock_settings):
+        """Test that connectors reuse one pooled driver per server."""
+        from etl.neo4j_connector import Neo4jConnector
+
+        with patch("etl.neo4j_connector.GraphDatabase.driver") as driver_factory:
+            Neo4jConnector.close_drivers()
+
+            with Neo4jConnector(mock_settings) as first:
+                first_driver = first.driver
+            with Neo4jConnector(mock_settings) as second:
+                second_driver = second.driver
+
+            driver_factory.assert_called_once()
+            assert driver_factory.call_args.kwargs["max_connection_pool_size"] == 50
+            assert first_driver is second_driver
+            first_driver.close.assert_not_called()
+
+            Neo4jConnector.close_drivers()
+            first_driver.close.assert_called_once()
+
+    def test_failed_connect_keeps_shared_driver_open(self, mock_settings):
+        """Test that a failed connectivity check does not close the shared driver."""
+        from etl.neo4j_connector import Neo4jConnector
+
+        with patch("etl.neo4j_connector.GraphDatabase.driver") as driver_factory:
+            Neo4jConnector.close_drivers()
+            driver = driver_factory.return_value
+            driver.verify_connectivity.side_effect = OSError("unreachable")
+
+            with pytest.raises(ConnectionError):
+                with Neo4jConnector(mock_settings):
+                    pass
+
+            driver.close.assert_not_called()
+            Neo4jConnector.close_drivers()
+
+    def test_changed_password_gets_new_driver(self, mock_settings):
+        """Test that drivers are keyed on the credentials, not just the user."""
+        from etl.neo4j_connector import Neo4jConnector
+
+        with patch("etl.neo4j_connector.GraphDatabase.driver") as driver_factory:
+            Neo4jConnector.close_drivers()
+            Neo4jConnector._get_driver(mock_settings)
+            changed = mock_settings.model_copy(update={"neo4j_password": "rotated"})
+            Neo4jConnector._get_driver(changed)
+
+            assert driver_factory.call_count == 2
+            Neo4jConnector.close_drivers()
+
 
 class TestLibraryETL:
     """Tests for the ETL pipeline."""
@@ -110,6 +241,16 @@ class TestLibraryETL:
         # Should create 7 constraints (one for each node type)
         assert mock_neo4j_connector.create_constraint.call_count == 7
 
+    def test_create_indexes(self, mock_mysql_connector, mock_neo4j_connector):
+        """Test that view query indexes are created."""
+        from etl.etl_pipeline import LibraryETL, VIEW_INDEXES
+
+        etl = LibraryETL(mock_mysql_connector, mock_neo4j_connector)
+        etl.create_indexes()
+
+        mock_neo4j_connector.create_index.assert_any_call("Book", "title")
+        assert mock_neo4j_connector.create_index.call_count == len(VIEW_INDEXES)
+
     def test_full_etl_run(self, mock_mysql_connector, mock_neo4j_connector):
         """Test full ETL pipeline execution."""
         from etl.etl_pipeline import LibraryETL
@@ -45,6 +45,26 @@ class TestNetworkCreation:
         net_fa = create_network(layout="force_atlas")
         assert net_fa is not None
 
+    def test_create_network_applies_shared_options(self):
+        """Test that the shared vis.js options are applied to the network."""
+        from app.components.graph_builder import create_network
+
+        net = create_network()
+
+        assert net.options["nodes"]["font"]["size"] == 14
+        assert net.options["interaction"]["multiselect"] is True
+
+    def test_create_network_options_not_shared(self):
+        """Test that cached options are copied into each network."""
+        from app.components.graph_builder import create_network
+
+        first = create_network()
+        first.options["nodes"]["font"]["size"] = 99
+
+        second = create_network()
+
+        assert second.options["nodes"]["font"]["size"] == 14
+
 
 class TestNodeOperations:
     """Tests for node operations."""
@@ -117,6 +137,30 @@ class TestNodeOperations:
             assert node_type in NODE_SIZES
             assert isinstance(NODE_SIZES[node_type], int)
 
+    def test_build_style_table_combines_maps(self):
+        """Test that the style table merges colors, shapes and sizes per type."""
+        from app.components.graph_builder import (
+            build_style_table,
+            NODE_COLORS,
+            NODE_SHAPES,
+            NODE_SIZES,
+        )
+
+        table = build_style_table(NODE_COLORS, NODE_SHAPES, {**NODE_SIZES, "Extra": 5})
+
+        assert table["Book"] == (NODE_COLORS["Book"], NODE_SHAPES["Book"], NODE_SIZES["Book"])
+        assert table["Extra"] == ("#888888", "dot", 5)
+
+    def test_style_maps_are_read_only(self):
+        """Test that shared style maps cannot be mutated by callers."""
+        from app.components.graph_builder import NODE_COLORS, ERD_OLTP_SIZES
+
+        with pytest.raises(TypeError):
+            NODE_COLORS["Book"] = "#000000"
+
+        with pytest.raises(TypeError):
+            ERD_OLTP_SIZES["book"] = 1
+
 
 class TestEdgeOperations:
     """Tests for edge operations."""
@@ -170,6 +214,31 @@ class TestEdgeOperations:
         edge = net.edges[0]
         assert edge["color"] == "#ff0000"
 
+    def test_bulk_add_matches_per_element_add(self, sample_graph_nodes, sample_graph_edges):
+        """Test that bulk insertion produces the same network as PyVis calls."""
+        from app.components.graph_builder import create_network, add_nodes, add_edges
+
+        bulk_net = create_network()
+        add_nodes(bulk_net, sample_graph_nodes + sample_graph_nodes[:1])
+        add_edges(bulk_net, sample_graph_edges)
+
+        slow_net = create_network()
+        add_nodes(slow_net, sample_graph_nodes + sample_graph_nodes[:1], bulk=False)
+        add_edges(slow_net, sample_graph_edges, bulk=False)
+
+        assert bulk_net.nodes == slow_net.nodes
+        assert bulk_net.node_ids == slow_net.node_ids
+        assert bulk_net.edges == slow_net.edges
+
+    def test_bulk_add_edges_rejects_unknown_nodes(self):
+        """Test that bulk edge insertion still validates endpoints."""
+        from app.components.graph_builder import create_network, add_edges
+
+        net = create_network()
+
+        with pytest.raises(ValueError):
+            add_edges(net, [{"from": "missing", "to": "also_missing"}])
+
 
 class TestGraphRendering:
     """Tests for graph rendering."""
@@ -193,6 +262,60 @@ class TestGraphRendering:
         assert "<html>" in html or "<!DOCTYPE" in html
         assert "vis-network" in html or "vis.Network" in html
 
+    def test_networks_share_compiled_template(self):
+        """Test that networks reuse one template environment across renders."""
+        from app.components.graph_builder import _template_env, create_network, render_graph
+
+        _template_env.cache_clear()
+        first = create_network()
+        second = create_network()
+        render_graph(first)
+        render_graph(second)
+
+        assert first.templateEnv is second.templateEnv
+        assert len(first.templateEnv.cache) == 1
+
+    def test_render_streaming_html_chunks_payload(self, sample_graph_nodes, sample_graph_edges):
+        """Test that the streaming shell splits nodes and edges into chunks."""
+        from app.components.graph_builder import (
+            create_network,
+            add_nodes,
+            add_edges,
+            render_streaming_html,
+        )
+
+        net = create_network()
+        add_nodes(net, sample_graph_nodes)
+        add_edges(net, sample_graph_edges)
+
+        html = render_streaming_html(net, chunk_size=3)
+
+        assert html.count('data-chunk="nodes"') == 2
+        assert html.count('data-chunk="edges"') == 1
+        assert "vis-network" in html
+
+    def test_display_in_streamlit_uses_native_component(self, monkeypatch, sample_graph_nodes):
+        """Test that the native path forwards PyVis node dicts to the component."""
+        import app.components.streamlit_graph as streamlit_graph_module
+        from app.components.graph_builder import create_network, add_nodes, display_in_streamlit
+
+        calls = []
+        monkeypatch.setattr(
+            streamlit_graph_module,
+            "streamlit_graph",
+            lambda **kwargs: calls.append(kwargs) or {"type": "nodeClick"},
+        )
+
+        net = create_network()
+        add_nodes(net, sample_graph_nodes)
+
+        event = display_in_streamlit(net, height=400, layout="force_atlas")
+
+        assert event == {"type": "nodeClick"}
+        assert calls[0]["nodes"] is net.nodes
+        assert calls[0]["layout"] == "force_atlas"
+        assert calls[0]["height"] == 400
+
     def test_create_legend_returns_html(self):
         """Test that legend creation returns valid HTML."""
         from app.components.graph_builder import create_legend
@@ -221,6 +344,22 @@ class TestBuildGraphFromResults:
         assert len(net.nodes) == 4
         assert len(net.edges) == 2
 
+    def test_build_graph_returns_independent_networks(self, sample_graph_nodes, sample_graph_edges):
+        """Test that cached results are not shared between callers."""
+        from app.components.graph_builder import build_graph_from_neo4j_results
+
+        first = build_graph_from_neo4j_results(sample_graph_nodes, sample_graph_edges)
+        first.add_node("extra", label="Extra")
+        first.nodes[0]["label"] = "Changed"
+        second = build_graph_from_neo4j_results(
+            [dict(node) for node in sample_graph_nodes],
+            [dict(edge) for edge in sample_graph_edges],
+        )
+
+        assert first is not second
+        assert len(second.nodes) == len(sample_graph_nodes)
+        assert second.nodes[0]["label"] == sample_graph_nodes[0]["label"]
+
     def test_build_empty_graph(self):
         """Test building a graph with no data."""
         from app.components.graph_builder import build_graph_from_neo4j_results
@@ -230,3 +369,43 @@ class TestBuildGraphFromResults:
         assert isinstance(net, Network)
         assert len(net.nodes) == 0
         assert len(net.edges) == 0
+
+    def test_build_graph_from_df_matches_records(self, sample_graph_nodes, sample_graph_edges):
+        """Test that the DataFrame builder produces the same network."""
+        import pandas as pd
+        from app.components.graph_builder import (
+            build_graph_from_neo4j_df,
+            build_graph_from_neo4j_results,
+        )
+
+        expected = build_graph_from_neo4j_results(sample_graph_nodes, sample_graph_edges)
+        edges_df = pd.DataFrame(sample_graph_edges).rename(columns={"from": "source", "to": "target"})
+        net = build_graph_from_neo4j_df(pd.DataFrame(sample_graph_nodes), edges_df)
+
+        assert net.nodes == expected.nodes
+        assert net.edges == expected.edges
+
+    def test_build_graph_from_df_rejects_unknown_nodes(self):
+        """Test that edges pointing at missing nodes are rejected."""
+        import pandas as pd
+        from app.components.graph_builder import build_graph_from_neo4j_df
+
+        nodes_df = pd.DataFrame([{"id": "a", "label": "A", "type": "Author"}])
+        edges_df = pd.DataFrame([{"from": "a", "to": "missing"}])
+
+        with pytest.raises(ValueError):
+            build_graph_from_neo4j_df(nodes_df, edges_df)
+
+    def test_build_graph_from_df_dedupes_undirected_edges(self):
+        """Test that undirected graphs keep one edge per node pair, like add_edge."""
+        import pandas as pd
+        from app.components.graph_builder import _edge_records_from_df, create_network
+
+        net = create_network(directed=False)
+        net.add_node("a")
+        net.add_node("b")
+        edges_df = pd.DataFrame([{"from": "a", "to": "b"}, {"from": "b", "to": "a"}])
+
+        records = _edge_records_from_df(net, edges_df, "#888888")
+
+        assert [(e["from"], e["to"]) for e in records] == [("a", "b")]
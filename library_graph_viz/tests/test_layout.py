@@ -0,0 +1,80 @@
+"""Tests for the server-side force-directed layout."""
+
+import numpy as np
+
+
+class TestComputePositions:
+    """Tests for compute_positions."""
+
+    def test_returns_one_position_per_node(self, sample_graph_nodes, sample_graph_edges):
+        """Test that every node gets a finite (x, y) position."""
+        from app.components.layout import compute_positions
+
+        node_ids = [n["id"] for n in sample_graph_nodes]
+        edges = [(e["from"], e["to"]) for e in sample_graph_edges]
+
+        positions = compute_positions(node_ids, edges, iterations=20)
+
+        assert positions.shape == (4, 2)
+        assert np.isfinite(positions).all()
+
+    def test_connected_nodes_end_up_closer(self):
+        """Test that edges pull their endpoints together."""
+        from app.components.layout import compute_positions
+
+        node_ids = ["a", "b", "c", "d"]
+        positions = compute_positions(node_ids, [("a", "b"), ("c", "d")], iterations=100)
+
+        def distance(i, j):
+            return np.linalg.norm(positions[i] - positions[j])
+
+        assert distance(0, 1) < distance(0, 2)
+        assert distance(2, 3) < distance(1, 3)
+
+    def test_ignores_unknown_edges_and_empty_graphs(self):
+        """Test that dangling edges are skipped and empty input is handled."""
+        from app.components.layout import compute_positions
+
+        assert compute_positions([], []).shape == (0, 2)
+        assert compute_positions(["a"], [("a", "missing")]).shape == (1, 2)
+
+    def test_exact_repulsion_when_theta_is_zero(self):
+        """Test that theta=0 reproduces all-pairs repulsion."""
+        from app.components.layout import compute_positions
+
+        n, spacing, seed = 6, 100.0, 3
+        positions = compute_positions(list(range(n)), [], iterations=1, spacing=spacing, seed=seed, theta=0.0)
+
+        extent = spacing * np.sqrt(n)
+        start = np.random.default_rng(seed).uniform(-extent / 2, extent / 2, size=(n, 2))
+        delta = start[:, None, :] - start[None, :, :]
+        dist2 = (delta ** 2).sum(axis=2) + 1e-9
+        np.fill_diagonal(dist2, np.inf)
+        force = (delta * (spacing ** 2 / dist2)[:, :, None]).sum(axis=1)
+        length = np.linalg.norm(force, axis=1, keepdims=True)
+        expected = start + force / length * np.minimum(length, extent / 10)
+
+        assert np.allclose(positions, expected, rtol=1e-5)
+
+    def test_coincident_nodes_stay_finite(self):
+        """Test that overlapping nodes do not break the quadtree."""
+        from app.components.layout import _barnes_hut_kernel
+
+        positions = np.zeros((5, 2))
+        result = _barnes_hut_kernel(positions, np.zeros((0, 2), dtype=np.int64), 3, 100.0, 10.0, 0.5)
+
+        assert np.isfinite(result).all()
+
+
+class TestRadialPositions:
+    """Tests for radial_positions."""
+
+    def test_center_at_origin_and_ring_on_radius(self):
+        """Test that the hub sits at the origin and the rest on the circle."""
+        from app.components.layout import radial_positions
+
+        positions = radial_positions(["a", "hub", "b", "c"], center="hub", radius=100.0)
+
+        assert positions.shape == (4, 2)
+        assert np.allclose(positions[1], [0.0, 0.0])
+        assert np.allclose(np.linalg.norm(positions[[0, 2, 3]], axis=1), 100.0)
@@ -0,0 +1,30 @@
+"""Tests for the member borrowing history view helpers."""
+
+import pandas as pd
+
+
+class TestHistoryTable:
+    """Tests for _history_table."""
+
+    def test_neo4j_dates_are_converted(self):
+        """Test that neo4j.time.Date values come through as timestamps."""
+        from neo4j.time import Date
+        from app.views.member_history import _history_table
+
+        results = [
+            {
+                "loan_date": Date(2024, 1, 5),
+                "due_date": Date(2024, 1, 19),
+                "return_date": None,
+                "book_id": 1,
+                "book_title": "Dune",
+            },
+        ]
+        authors_by_book = {1: [{"author_id": 7, "author_name": "Frank Herbert"}]}
+
+        df = _history_table(results, authors_by_book)
+
+        assert df["Loan Date"].iloc[0] == pd.Timestamp(2024, 1, 5)
+        assert df["Due Date"].iloc[0] == pd.Timestamp(2024, 1, 19)
+        assert pd.isna(df["Return Date"].iloc[0])
+        assert df["Author"].iloc[0] == "Frank Herbert"
@@ -0,0 +1,34 @@
+"""Tests for the cached query helper."""
+
+from unittest.mock import MagicMock
+
+
+class TestCachedQuery:
+    """Tests for cached_query."""
+
+    def test_repeated_query_hits_neo4j_once(self):
+        """Test that identical query and params are served from the cache."""
+        from app.components.query_cache import cached_query
+
+        cached_query.clear()
+        neo4j = MagicMock()
+        neo4j.run_query.return_value = [{"book": "Dune", "borrows": 3}]
+
+        first = cached_query(neo4j, "MATCH (b:Book) RETURN b", (("limit", 5),))
+        second = cached_query(neo4j, "MATCH (b:Book) RETURN b", (("limit", 5),))
+
+        assert first == second == [{"book": "Dune", "borrows": 3}]
+        neo4j.run_query.assert_called_once_with("MATCH (b:Book) RETURN b", {"limit": 5})
+
+    def test_different_params_are_cached_separately(self):
+        """Test that parameters are part of the cache key."""
+        from app.components.query_cache import cached_query
+
+        cached_query.clear()
+        neo4j = MagicMock()
+        neo4j.run_query.return_value = []
+
+        cached_query(neo4j, "MATCH (a:Author) RETURN a", (("min_books", 1),))
+        cached_query(neo4j, "MATCH (a:Author) RETURN a", (("min_books", 2),))
+
+        assert neo4j.run_query.call_count == 2
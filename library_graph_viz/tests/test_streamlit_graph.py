@@ -0,0 +1,262 @@
+"""Tests for the interactive streamlit_graph component helpers."""
+
+import pytest
+
+
+class TestInteractiveNetwork:
+    """Tests for InteractiveNetwork node styling."""
+
+    def test_add_node_uses_type_styling(self):
+        """Test that nodes pick up color, shape and size from their type."""
+        from app.components.streamlit_graph import (
+            InteractiveNetwork,
+            NODE_COLORS,
+            NODE_SHAPES,
+            NODE_SIZES,
+        )
+
+        net = InteractiveNetwork()
+        net.add_node("book_1", "Dune", node_type="Book")
+
+        node = net.nodes[0]
+        assert node.color == NODE_COLORS["Book"]
+        assert node.shape == NODE_SHAPES["Book"]
+        assert node.size == NODE_SIZES["Book"]
+        assert node.title == "Book: Dune"
+
+    def test_add_node_unknown_type_uses_defaults(self):
+        """Test that unknown node types fall back to the default style."""
+        from app.components.streamlit_graph import InteractiveNetwork
+
+        net = InteractiveNetwork()
+        net.add_node("x", "Mystery", node_type="Unknown")
+
+        node = net.nodes[0]
+        assert node.color == "#888888"
+        assert node.shape == "dot"
+        assert node.size == 25
+
+    def test_set_styling_updates_new_nodes(self):
+        """Test that custom styling applies to nodes added afterwards."""
+        from app.components.streamlit_graph import InteractiveNetwork
+
+        net = InteractiveNetwork()
+        net.set_styling(colors={"Book": "#000000"}, sizes={"Widget": 12})
+        net.add_node("book_1", "Dune", node_type="Book")
+        net.add_node("w_1", "Gear", node_type="Widget")
+
+        assert net.nodes[0].color == "#000000"
+        assert net.nodes[1].size == 12
+        assert net.nodes[1].color == "#888888"
+
+    def test_set_styling_does_not_leak_between_networks(self):
+        """Test that custom styling on one network leaves others untouched."""
+        from app.components.graph_builder import NODE_COLORS
+        from app.components.streamlit_graph import InteractiveNetwork
+
+        styled = InteractiveNetwork()
+        styled.set_styling(colors={"Book": "#000000"})
+        plain = InteractiveNetwork()
+        plain.add_node("book_1", "Dune", node_type="Book")
+
+        assert plain.nodes[0].color == NODE_COLORS["Book"]
+        assert NODE_COLORS["Book"] != "#000000"
+
+    def test_explicit_style_overrides_type(self):
+        """Test that explicit node styling wins over type styling."""
+        from app.components.streamlit_graph import InteractiveNetwork
+
+        net = InteractiveNetwork()
+        net.add_node("book_1", "Dune", node_type="Book", color="#123456", title="Custom")
+
+        assert net.nodes[0].color == "#123456"
+        assert net.nodes[0].title == "Custom"
+
+
+    def test_display_sends_palette_encoded_nodes(self, monkeypatch):
+        """Test that node styles are dictionary-encoded into a palette."""
+        import app.components.streamlit_graph as streamlit_graph_module
+
+        calls = []
+        monkeypatch.setattr(
+            streamlit_graph_module,
+            "streamlit_graph",
+            lambda **kwargs: calls.append(kwargs),
+        )
+
+        net = streamlit_graph_module.InteractiveNetwork()
+        net.add_node("book_1", "Dune", node_type="Book")
+        net.add_node("book_2", "Emma", node_type="Book")
+        net.add_node("book_3", "Odd", node_type="Book", color="#000000")
+        net.display()
+
+        palette = calls[0]["palette"]
+        rows = calls[0]["nodes"]
+        assert len(palette) == 2
+        assert palette[0]["type"] == "Book"
+        assert palette[1]["color"] == "#000000"
+        assert rows[0] == ("book_1", "Dune", "Book: Dune", 0)
+        assert rows[1][3] == 0
+        assert rows[2][3] == 1
+
+
+class TestStreamlitGraphPayload:
+    """Tests for the payload handed to the frontend component."""
+
+    def test_payload_encodes_nodes_and_edges(self, monkeypatch, sample_graph_nodes, sample_graph_edges):
+        """Test that nodes and edges are sent as separate pre-encoded JSON payloads."""
+        import json
+        import app.components.streamlit_graph as streamlit_graph_module
+
+        if streamlit_graph_module.orjson is None:
+            pytest.skip("orjson not installed")
+
+        calls = []
+        monkeypatch.setattr(
+            streamlit_graph_module,
+            "_get_component",
+            lambda: lambda **kwargs: calls.append(kwargs),
+        )
+
+        streamlit_graph_module.streamlit_graph(sample_graph_nodes, sample_graph_edges)
+
+        assert "nodes" not in calls[0]
+        payload = json.loads(calls[0]["payload"])
+        assert payload["nodes"] == sample_graph_nodes
+        assert "edges" not in payload
+        assert json.loads(calls[0]["edgesPayload"]) == sample_graph_edges
+
+    def test_falls_back_without_orjson(self, monkeypatch, sample_graph_nodes, sample_graph_edges):
+        """Test that nodes and edges are passed directly when orjson is missing."""
+        import app.components.streamlit_graph as streamlit_graph_module
+
+        calls = []
+        monkeypatch.setattr(streamlit_graph_module, "orjson", None)
+        monkeypatch.setattr(
+            streamlit_graph_module,
+            "_get_component",
+            lambda: lambda **kwargs: calls.append(kwargs),
+        )
+
+        streamlit_graph_module.streamlit_graph(sample_graph_nodes, sample_graph_edges)
+
+        assert calls[0]["nodes"] == sample_graph_nodes
+        assert calls[0]["edges"] == sample_graph_edges
+
+    def test_large_graph_uses_straight_edges(self, monkeypatch, sample_graph_nodes, sample_graph_edges):
+        """Test that edges are only curved below SMOOTH_EDGE_LIMIT nodes."""
+        import app.components.streamlit_graph as streamlit_graph_module
+
+        calls = []
+        monkeypatch.setattr(streamlit_graph_module, "orjson", None)
+        monkeypatch.setattr(
+            streamlit_graph_module,
+            "_get_component",
+            lambda: lambda **kwargs: calls.append(kwargs),
+        )
+
+        streamlit_graph_module.streamlit_graph(sample_graph_nodes, sample_graph_edges)
+        monkeypatch.setattr(streamlit_graph_module, "SMOOTH_EDGE_LIMIT", 1)
+        streamlit_graph_module.streamlit_graph(sample_graph_nodes, sample_graph_edges)
+
+        assert calls[0]["smoothEdges"] is True
+        assert calls[1]["smoothEdges"] is False
+
+    def test_large_graph_sent_as_columns(self, monkeypatch):
+        """Test that graphs above SOA_THRESHOLD are transposed into columns."""
+        import app.components.streamlit_graph as streamlit_graph_module
+
+        calls = []
+        monkeypatch.setattr(streamlit_graph_module, "orjson", None)
+        monkeypatch.setattr(streamlit_graph_module, "SOA_THRESHOLD", 1)
+        monkeypatch.setattr(
+            streamlit_graph_module,
+            "_get_component",
+            lambda: lambda **kwargs: calls.append(kwargs),
+        )
+
+        nodes = [
+            {"id": "a", "label": "A", "type": "Author"},
+            {"id": "b", "label": "B", "type": "Book", "size": 10, "x": 5.0},
+        ]
+        edges = [{"from": "a", "to": "b", "label": "WROTE"}]
+        streamlit_graph_module.streamlit_graph(nodes, edges)
+
+        assert calls[0]["soa"] is True
+        assert calls[0]["nodes"]["id"] == ["a", "b"]
+        assert calls[0]["nodes"]["size"] == [None, 10]
+        assert calls[0]["nodes"]["x"] == [None, 5.0]
+        assert calls[0]["edges"]["from"] == ["a"]
+
+
+class TestDisplayInteractiveGraph:
+    """Tests for display_interactive_graph styling."""
+
+    def test_nodes_styled_by_type(self, monkeypatch):
+        """Test that type styling is applied while building the payload."""
+        import app.components.streamlit_graph as streamlit_graph_module
+
+        calls = []
+        monkeypatch.setattr(streamlit_graph_module, "orjson", None)
+        monkeypatch.setattr(
+            streamlit_graph_module,
+            "_get_component",
+            lambda: lambda **kwargs: calls.append(kwargs),
+        )
+
+        nodes = [
+            {"id": "b", "label": "B", "type": "Book"},
+            {"id": "c", "label": "C", "type": "Book", "color": "#000000"},
+        ]
+        streamlit_graph_module.display_interactive_graph(nodes, [])
+
+        sent = calls[0]["nodes"]
+        assert sent[0]["color"] == streamlit_graph_module.NODE_COLORS["Book"]
+        assert sent[0]["shape"] == streamlit_graph_module.NODE_SHAPES["Book"]
+        assert sent[1]["color"] == "#000000"
+        assert "color" not in nodes[0]
+
+    def test_style_nodes_applies_custom_maps(self):
+        """Test that nodes can be pre-styled with ERD style maps."""
+        from app.components.streamlit_graph import (
+            style_nodes,
+            ERD_OLAP_COLORS,
+            ERD_OLAP_SHAPES,
+            ERD_OLAP_SIZES,
+        )
+
+        nodes = [{"id": "fact_loan", "label": "FACT LOAN", "type": "fact_loan"}]
+        styled = style_nodes(nodes, ERD_OLAP_COLORS, ERD_OLAP_SHAPES, ERD_OLAP_SIZES)
+
+        assert styled[0]["color"] == ERD_OLAP_COLORS["fact_loan"]
+        assert styled[0]["shape"] == ERD_OLAP_SHAPES["fact_loan"]
+        assert "color" not in nodes[0]
+
+    def test_short_label_truncates_long_labels(self):
+        """Test that only labels over the width are cut and marked."""
+        from app.components.streamlit_graph import short_label
+
+        assert short_label("Dune") == "Dune"
+        assert short_label("x" * 20) == "x" * 20
+        assert short_label("x" * 21) == "x" * 20 + "..."
+
+    def test_positions_disable_physics(self, monkeypatch, sample_graph_nodes, sample_graph_edges):
+        """Test that precomputed positions are sent and physics is turned off."""
+        import app.components.streamlit_graph as streamlit_graph_module
+
+        calls = []
+        monkeypatch.setattr(streamlit_graph_module, "orjson", None)
+        monkeypatch.setattr(
+            streamlit_graph_module,
+            "_get_component",
+            lambda: lambda **kwargs: calls.append(kwargs),
+        )
+
+        positions = [[float(i), 0.0] for i in range(len(sample_graph_nodes))]
+        streamlit_graph_module.streamlit_graph(
+            sample_graph_nodes, sample_graph_edges, positions=positions
+        )
+
+        assert calls[0]["positions"] == positions
+        assert calls[0]["physics"]["enabled"] is False
+        assert "enabled" not in streamlit_graph_module.PHYSICS_PRESETS["barnes_hut"]
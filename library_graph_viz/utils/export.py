@@ -12,6 +12,9 @@ from pyvis.network import Network
 
 logger = logging.getLogger(__name__)
 
+# Rows formatted per write when encoding CSV, bounding the working set
+CSV_CHUNK_SIZE = 10_000
+
 
 def export_to_csv(
     data: Union[pd.DataFrame, list[dict]],
@@ -37,7 +40,11 @@ def export_to_csv(
     if filename is None:
         filename = f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-    csv_bytes = df.to_csv(index=False).encode("utf-8")
+    # Encode chunk by chunk into a byte buffer rather than building one
+    # str for the whole frame and then a second encoded copy
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, chunksize=CSV_CHUNK_SIZE, encoding="utf-8")
+    csv_bytes = buffer.getvalue()
 
     if output_dir:
         output_path = output_dir / f"{filename}.csv"